@@ -0,0 +1,95 @@
+/**
+ * Loss Tracker endpoint, bound to the tracking sheet.
+ *
+ * Implements the contract described in cutting_edge/receiver.py: every row
+ * carries an idempotencyKey, stored in the column after the fields, and a
+ * key already in the sheet is answered "duplicate" instead of appended again,
+ * so the outbox can retry safely. Replies are JSON; Apps Script cannot set an
+ * HTTP status, so errors are reported in the body.
+ *
+ * Deploy: Extensions > Apps Script in the sheet, replace the script with this
+ * file, then Deploy > Manage deployments > edit the existing web app > New
+ * version, so the /exec URL in CUTTING_EDGE_SHEET_URL stays the same.
+ */
+
+// Tab the rows are appended to, and its columns in order. FIELDS must match
+// the columns the sheet already has; the key goes in the next one.
+var SHEET_NAME = "Sheet1";
+var FIELDS = ["timestamp", "agentName", "agentId", "disposition"];
+var KEY_COLUMN = FIELDS.length + 1;
+var LOCK_TIMEOUT_MS = 20000;
+
+// One row, sent as query parameters: {"status": "ok" | "duplicate"}.
+function doGet(e) {
+  var result = record_([e.parameter])[0];
+  delete result.idempotencyKey;
+  return json_(result);
+}
+
+// A batch, for CUTTING_EDGE_SHEET_BATCH above 1:
+// {"rows": [...]} -> {"results": [{"idempotencyKey", "status", ...}, ...]}.
+function doPost(e) {
+  var rows = null;
+  try {
+    rows = JSON.parse(e.postData.contents).rows;
+  } catch (err) {
+    // Answered below.
+  }
+  if (!Array.isArray(rows)) {
+    return json_({status: "error", error: 'expected {"rows": [...]}', retry: false});
+  }
+  return json_({results: record_(rows)});
+}
+
+function record_(rows) {
+  var lock = LockService.getScriptLock();
+  try {
+    lock.waitLock(LOCK_TIMEOUT_MS);
+  } catch (err) {
+    // Another request holds the sheet for too long: let the client retry.
+    return rows.map(function (row) {
+      return {idempotencyKey: row.idempotencyKey, status: "error", error: "sheet busy", retry: true};
+    });
+  }
+  try {
+    var sheet = SpreadsheetApp.getActive().getSheetByName(SHEET_NAME);
+    var seen = storedKeys_(sheet);
+    var append = [];
+    var results = rows.map(function (row) {
+      var key = row.idempotencyKey;
+      if (!key) {
+        return {idempotencyKey: key, status: "error", error: "missing idempotencyKey", retry: false};
+      }
+      if (seen[key]) {
+        return {idempotencyKey: key, status: "duplicate"};
+      }
+      seen[key] = true;
+      append.push(FIELDS.map(function (field) { return row[field] || ""; }).concat([key]));
+      return {idempotencyKey: key, status: "ok"};
+    });
+    if (append.length) {
+      sheet.getRange(sheet.getLastRow() + 1, 1, append.length, KEY_COLUMN).setValues(append);
+    }
+    return results;
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+// Keys already in the sheet, read in one call per request.
+function storedKeys_(sheet) {
+  var seen = {};
+  var last = sheet.getLastRow();
+  if (last > 0) {
+    sheet.getRange(1, KEY_COLUMN, last, 1).getValues().forEach(function (cell) {
+      if (cell[0]) {
+        seen[cell[0]] = true;
+      }
+    });
+  }
+  return seen;
+}
+
+function json_(body) {
+  return ContentService.createTextOutput(JSON.stringify(body)).setMimeType(ContentService.MimeType.JSON);
+}
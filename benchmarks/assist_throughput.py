@@ -0,0 +1,62 @@
+"""Time the Call Assist matcher on a transcript streamed in small chunks.
+
+The transcript is built from objection surfaces, attach triggers and filler
+speech, then fed a few characters at a time, the way a live transcript feed
+delivers it. Per-chunk cost should stay flat as the call gets longer.
+
+    python benchmarks/assist_throughput.py --words 1000 10000 100000
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cutting_edge.assist import PhraseMatcher, phrases  # noqa: E402
+from cutting_edge.catalog import load_catalog  # noqa: E402
+
+FILLER = "um so yeah I was just wondering about the yard and whether you could maybe come by next week".split()
+
+
+def transcript(catalog, words, seed=0):
+    rng = random.Random(seed)
+    spoken = [text for text, _ in phrases(catalog)]
+    out = []
+    while len(out) < words:
+        out.extend(rng.choice(spoken).split() if rng.random() < 0.2 else rng.sample(FILLER, 6))
+    return " ".join(out[:words])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--chunk", type=int, default=12, help="characters per chunk")
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+    start = time.perf_counter()
+    matcher = PhraseMatcher(phrases(catalog))
+    print(f"compiled {len(matcher.goto)} nodes in {(time.perf_counter() - start) * 1000:.1f} ms, {args.chunk}-char chunks")
+    print(f"{'words':>8}{'matches':>9}{'total ms':>10}{'chunk p50 µs':>14}{'chunk p99 µs':>14}{'MB/s':>7}")
+    for words in args.words:
+        text = transcript(catalog, words)
+        chunks = [text[i:i + args.chunk] for i in range(0, len(text), args.chunk)]
+        node, pending, found, samples = 0, "", 0, []
+        for chunk in chunks:
+            t = time.perf_counter()
+            node, pending, matches = matcher.feed(node, pending, chunk)
+            samples.append(time.perf_counter() - t)
+            found += len(matches)
+        found += len(matcher.flush(node, pending)[1])
+        samples.sort()
+        total = sum(samples)
+        print(f"{words:>8,}{found:>9,}{total * 1000:>10.1f}{statistics.median(samples) * 1e6:>14.1f}"
+              f"{samples[int(len(samples) * 0.99)] * 1e6:>14.1f}{len(text) / total / 1e6:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Time outbox delivery to a local stand-in for the sheet endpoint.
+
+Enqueues N Loss Tracker rows in a temporary outbox and drains it against
+cutting_edge.receiver (with a per-request delay standing in for an Apps
+Script execution) three ways: one GET per row on a new connection each time,
+as urllib did; one GET per row over pooled keep-alive connections; and
+batched POSTs.
+
+    python benchmarks/delivery_throughput.py --rows 2000 --latency-ms 50 --batch 50
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cutting_edge import receiver  # noqa: E402
+from cutting_edge.outbox import ConnectionPool, Deliverer, Outbox, SheetClient  # noqa: E402
+
+
+def run(url, rows, batch, pool_size, tmp):
+    outbox = Outbox(Path(tmp) / f"outbox-{batch}-{pool_size}.sqlite")
+    for i in range(rows):
+        outbox.enqueue({"agentName": "Bench", "agentId": str(i % 40), "disposition": "Price", "timestamp": str(i)})
+    client = SheetClient(url, batch, ConnectionPool(maxsize=pool_size))
+    start = time.perf_counter()
+    sent = Deliverer(outbox, client).deliver_due()
+    elapsed = time.perf_counter() - start
+    client.pool.close()
+    assert sent == rows, outbox.stats()
+    return elapsed, client.requests, client.pool.opened
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="receiver delay per request")
+    parser.add_argument("--batch", type=int, default=50, help="rows per POST")
+    args = parser.parse_args()
+
+    server, sheet = receiver.serve(0, latency_ms=args.latency_ms)
+    url = f"http://127.0.0.1:{server.server_port}/exec"
+    print(f"{args.rows:,} rows, {args.latency_ms:g} ms per request")
+    print(f"{'mode':<22}{'requests':>9}{'conns':>7}{'seconds':>9}{'rows/s':>9}")
+    modes = [("GET, new connection", 1, 0), ("GET, pooled", 1, 4), (f"POST x{args.batch}, pooled", args.batch, 4)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, batch, pool_size in modes:
+            elapsed, requests, opened = run(url, args.rows, batch, pool_size, tmp)
+            print(f"{name:<22}{requests:>9,}{opened:>7,}{elapsed:>9.2f}{args.rows / elapsed:>9,.0f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
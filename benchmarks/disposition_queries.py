@@ -0,0 +1,91 @@
+"""Time Loss Tracker history queries on a synthetic store.
+
+Fills a temporary disposition store with N losses spread over --days days and
+--agents agents, then times the questions the Loss Tracker page asks and
+prints the query plan SQLite picks for each.
+
+    python benchmarks/disposition_queries.py --rows 500000 --agents 300 --days 365
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cutting_edge.catalog import load_catalog  # noqa: E402
+from cutting_edge.dispositions import DispositionStore  # noqa: E402
+
+
+def fill(store, catalog, rows, agents, days, seed=0):
+    rng = random.Random(seed)
+    now = time.time()
+    # Skewed like real logs: a few dispositions and agents account for most losses.
+    weights = [1 / (i + 1) for i in range(len(catalog.dispositions))]
+    batch = []
+    for i in range(rows):
+        agent = int(rng.paretovariate(1.2)) % agents
+        disposition = rng.choices(catalog.dispositions, weights)[0]
+        batch.append((f"Agent {agent}", f"A{agent:04d}", disposition, now - rng.random() * days * 86400, f"k{i}"))
+        if len(batch) == 50000:
+            store.record_many(batch)
+            batch = []
+    store.record_many(batch)
+
+
+def timed(fn, repeat=20):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--agents", type=int, default=300)
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+    with tempfile.TemporaryDirectory() as tmp:
+        store = DispositionStore(Path(tmp) / "dispositions.sqlite")
+        start = time.perf_counter()
+        fill(store, catalog, args.rows, args.agents, args.days)
+        print(f"{args.rows:,} losses, {args.agents} agents, {args.days} days: loaded in {time.perf_counter() - start:.1f}s")
+        agent = store.by_agent(30)[0][0]
+        top = catalog.dispositions[0]
+        cases = [
+            (f"agent {agent}, last 7 days", lambda: store.by_disposition(7, agent)),
+            (f"agent {agent}, recent", lambda: store.recent(agent)),
+            ("top disposition today, by agent", lambda: store.by_agent(1, top)),
+            ("top disposition, 30 days by agent", lambda: store.by_agent(30, top)),
+            ("top disposition, 30 days by day", lambda: store.daily(30, top)),
+            ("team today", lambda: store.by_disposition(1)),
+            ("team, last 7 days", lambda: store.by_disposition(7)),
+            ("team, last 30 days by day", lambda: store.daily(30)),
+        ]
+        print(f"{'query':<36}{'rows':>6}{'ms':>9}")
+        for name, fn in cases:
+            print(f"{name:<36}{len(fn()):>6}{timed(fn):>9.2f}")
+
+        # Every query should be a SEARCH on one index, never a SCAN.
+        print("\nplans:")
+        traced = []
+        store._db.set_trace_callback(traced.append)
+        for _, fn in cases:
+            fn()
+        store._db.set_trace_callback(None)
+        for sql in dict.fromkeys(traced):
+            plan = "; ".join(row[-1] for row in store._db.execute(f"EXPLAIN QUERY PLAN {sql}"))
+            print(f"  {plan}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Time loss-pattern queries on the columnar event store.
+
+Fills an EventStore with a year of synthetic losses (--agents agents,
+--per-day losses per agent per day), prints its size, and times counts by
+agent, disposition and hour of day, with and without filters, next to the
+same count over a list of row dicts.
+
+    python benchmarks/event_store.py --agents 300 --per-day 50
+"""
+import argparse
+import statistics
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cutting_edge.catalog import load_catalog  # noqa: E402
+from cutting_edge.events import EventStore  # noqa: E402
+
+
+def synthetic(catalog, agents, per_day, days=365, seed=0):
+    rng = np.random.default_rng(seed)
+    n = agents * per_day * days
+    weights = 1 / np.arange(1, len(catalog.dispositions) + 1)
+    codes = rng.choice(len(catalog.dispositions), n, p=weights / weights.sum())
+    agent = rng.integers(0, agents, n)
+    # Office hours, 8am to 8pm local time.
+    now = int(time.time())
+    ts = np.sort(now - rng.integers(0, days, n) * 86400 - now % 86400 + rng.integers(8 * 3600, 20 * 3600, n))
+    return [(f"A{a:04d}", f"Agent {a}", catalog.dispositions[c], t) for a, c, t in zip(agent.tolist(), codes.tolist(), ts.tolist())]
+
+
+def timed(fn, repeat=5):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=300)
+    parser.add_argument("--per-day", type=int, default=50)
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+    rows = synthetic(catalog, args.agents, args.per_day)
+    events = EventStore(catalog.dispositions)
+    start = time.perf_counter()
+    events.append(rows)
+    print(f"{events.size:,} losses, {len(events.agents)} agents, {len(events.dispositions)} dispositions: "
+          f"{events.nbytes() / 1e6:.0f} MB, appended in {time.perf_counter() - start:.1f}s")
+
+    agent = events.agents[0]
+    top = catalog.dispositions[0]
+    cases = [
+        ("by disposition", lambda: events.counts("disposition")),
+        ("by agent", lambda: events.counts("agent")),
+        ("by hour", lambda: events.counts("hour")),
+        ("by disposition, last 7 days", lambda: events.counts("disposition", days=7)),
+        ("by hour, one agent", lambda: events.counts("hour", agent_id=agent)),
+        ("agent x disposition", lambda: events.crosstab("agent", "disposition")),
+        ("weekday x hour, one disposition", lambda: events.crosstab("weekday", "hour", disposition=top)),
+    ]
+    print(f"{'query':<34}{'ms':>9}")
+    for name, fn in cases:
+        print(f"{name:<34}{timed(fn):>9.2f}")
+
+    dicts = [{"agentId": a, "agentName": n, "disposition": d, "ts": t} for a, n, d, t in rows[:1000000]]
+    loop = timed(lambda: Counter(datetime.fromtimestamp(r["ts"]).hour for r in dicts), repeat=1) * len(rows) / len(dicts)
+    print(f"{'by hour, loop over dicts (est.)':<34}{loop:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Time transcript mining on a synthetic archive.
+
+Writes N calls as JSON lines (utterances built from objection surfaces,
+attach triggers and filler speech, each with a random disposition) to a
+temporary directory, then mines it with 1 and --workers processes.
+
+    python benchmarks/mining_throughput.py --calls 50000 --workers 4
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cutting_edge.catalog import load_catalog  # noqa: E402
+from cutting_edge.mining import mine_archive, phrases  # noqa: E402
+
+FILLER = [
+    "hi thanks for calling how can I help you today",
+    "sure let me pull that up for you",
+    "okay and what is the address of the property",
+    "great and is that a front and back yard",
+    "alright let me check availability in your area",
+    "um yeah I think so",
+]
+
+
+def write_archive(path, catalog, calls, seed=0):
+    rng = random.Random(seed)
+    spoken = [text for text, _ in phrases(catalog)]
+    with open(path, "w") as f:
+        for i in range(calls):
+            turns = [rng.choice(spoken) if rng.random() < 0.15 else rng.choice(FILLER) for _ in range(rng.randint(20, 60))]
+            f.write(json.dumps({"id": str(i), "text": turns, "disposition": rng.choice(catalog.dispositions)}) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp) / "calls.jsonl"
+        write_archive(archive, catalog, args.calls)
+        size_mb = archive.stat().st_size / 1e6
+        print(f"{args.calls:,} calls, {size_mb:,.0f} MB")
+        print(f"{'workers':>8}{'seconds':>9}{'calls/s':>10}{'MB/s':>7}")
+        for workers in sorted({1, args.workers}):
+            start = time.perf_counter()
+            total = mine_archive([archive], catalog, workers)
+            elapsed = time.perf_counter() - start
+            assert total["calls"] == args.calls
+            print(f"{workers:>8}{elapsed:>9.1f}{args.calls / elapsed:>10,.0f}{size_mb / elapsed:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
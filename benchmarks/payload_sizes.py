@@ -0,0 +1,85 @@
+"""Report the bytes each view sends to the browser on a rerun.
+
+Sizes are the serialized element protos in the rendered tree, which is what a
+rerun pushes over the websocket, next to the markup bytes the view emitted
+through cutting_edge.components.html.
+
+    python benchmarks/payload_sizes.py
+"""
+import sys
+from pathlib import Path
+
+from streamlit import logger
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cutting_edge.components import payloads  # noqa: E402
+
+logger.set_log_level("error")
+
+
+def tree_bytes(node):
+    proto = getattr(node, "proto", None)
+    total = proto.ByteSize() if proto is not None else 0
+    children = getattr(node, "children", None) or {}
+    for child in children.values() if isinstance(children, dict) else children:
+        total += tree_bytes(child)
+    return total
+
+
+def flip(at):
+    next(b for b in at.button if b.label == "🔄 Flip Card").click()
+
+
+def answer(at):
+    at.button(key="qa_opt_A").click()
+
+
+def build_guide(at):
+    at.selectbox(key="guide_scenario").select("Price Concern").run()
+    for box in at.checkbox:
+        box.check()
+
+
+def build_attach(at):
+    at.selectbox(key="attach_service").select("Lawn Treatment").run()
+    for box in at.checkbox:
+        box.check()
+
+
+def search(at):
+    # The search box is a custom component; set its value as Enter would.
+    at.session_state["search_box"] = {"event": "submit", "query": "cancel", "faq_id": None, "seq": 1}
+
+
+VIEWS = [
+    ("flashcards", "flashcards", None),
+    ("flashcards (flipped)", "flashcards", flip),
+    ("loss_tracker", "loss_tracker", None),
+    ("guide_builder (all points)", "guide_builder", build_guide),
+    ("attach_builder (all points)", "attach_builder", build_attach),
+    ("qa_game", "qa_game", None),
+    ("qa_game (answered)", "qa_game", answer),
+    ("faq_search (browse all)", "faq_search", None),
+    ("faq_search (query)", "faq_search", search),
+]
+
+
+def main():
+    print(f"{'view':<30} {'element bytes':>14} {'markup bytes':>13}")
+    for label, page, interact in VIEWS:
+        at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+        at.run()
+        at.switch_page(f"sections/{page}.py").run()
+        if interact:
+            interact(at)
+        payloads.clear()
+        at.run()
+        markup = payloads.summary().get(page, {}).get("last", 0)
+        print(f"{label:<30} {tree_bytes(at._tree):>14,} {markup:>13,}")
+
+
+if __name__ == "__main__":
+    main()
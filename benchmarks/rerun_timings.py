@@ -0,0 +1,91 @@
+"""Compare full-script reruns with section-scoped fragment reruns per interaction.
+
+AppTest always re-executes the whole script, so each interaction is timed
+twice from one run: "full" is the router plus the selected section, and
+"fragment" is the section's fragment alone (what a click inside that section
+costs in the running app).
+
+    python benchmarks/rerun_timings.py [--repeat 20]
+"""
+import argparse
+import itertools
+import logging
+import sys
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cutting_edge.timing import timings  # noqa: E402
+
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+
+def flip_card(at):
+    next(b for b in at.button if b.label == "🔄 Flip Card").click()
+
+
+def next_card(at):
+    next(b for b in at.button if b.label == "➡️ Next Card").click()
+
+
+def answer_question(at):
+    buttons = [b for b in at.button if b.key and b.key.startswith("qa_opt_")]
+    if buttons:
+        buttons[0].click()
+    else:
+        next(b for b in at.button if b.label in ("➡️ Next Question", "🔁 Start Over")).click()
+
+
+def toggle_point(at):
+    scenario = next(s for s in at.selectbox if s.label == "What objection are you handling?")
+    if scenario.value == "Select a scenario...":
+        scenario.select("Price Concern").run()
+    box = next(c for c in at.checkbox if c.key.startswith("guide_"))
+    box.set_value(not box.value)
+
+
+SEARCHES = itertools.count()
+
+
+def search_faq(at):
+    # The search box is a custom component; set its value as Enter would.
+    seq = next(SEARCHES)
+    query = "cancel" if seq % 2 else "payment"
+    at.session_state["search_box"] = {"event": "submit", "query": query, "faq_id": None, "seq": seq}
+
+
+INTERACTIONS = [
+    ("flashcards", "flip card", flip_card),
+    ("flashcards", "next card", next_card),
+    ("qa_game", "answer question", answer_question),
+    ("guide_builder", "toggle key point", toggle_point),
+    ("faq_search", "search FAQs", search_faq),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+    at.run()
+
+    print(f"{'interaction':<20} {'full p50 ms':>12} {'fragment p50 ms':>16} {'speedup':>8}")
+    for fragment, label, interact in INTERACTIONS:
+        at.switch_page(f"sections/{fragment}.py").run()
+        timings.clear()
+        for _ in range(args.repeat):
+            interact(at)
+            at.run()
+        summary = timings.summary()
+        full = summary["app"]["p50_ms"]
+        scoped = summary[fragment]["p50_ms"]
+        print(f"{label:<20} {full:>12.2f} {scoped:>16.2f} {full / scoped:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Time FAQ search queries against a growing knowledge base.
+
+Compares the previous per-rerun linear substring scan with the BM25 inverted
+index in cutting_edge.search, and times suggestions for every keystroke of
+each query (the search box asks for them as the agent types). The FAQ entries are copied --scale times to
+stand in for a larger knowledge base.
+
+    python benchmarks/search_latency.py --scale 1 10 100
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cutting_edge import build  # noqa: E402
+from cutting_edge.catalog import build_catalog  # noqa: E402
+from cutting_edge.search import FaqIndex  # noqa: E402
+
+QUERIES = ["long grass", "payment", "cash", "cancel service", "when do i get charged", "skip a week", "cancle", "paymnet", "xyzzy"]
+
+
+def scan(faqs, query):
+    query_lower = query.lower()
+    return [
+        faq for faq in faqs
+        if query_lower in faq["question"].lower() or query_lower in faq["answer"].lower() or query_lower in faq["phrasing"].lower()
+    ]
+
+
+def per_query_ms(fn, repeat, queries=QUERIES, percentile=0.95):
+    samples = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            fn(query)
+            samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples) * 1000, samples[int(len(samples) * percentile)] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    sections = build.compile_sources()["sections"]
+    keystrokes = [query[:i] for query in QUERIES for i in range(1, len(query) + 1)]
+    print(f"{'faqs':>7}{'build ms':>10}{'scan p50':>10}{'scan p95':>10}{'index p50':>11}{'index p95':>11}"
+          f"{'suggest p50':>13}{'suggest p99':>13}")
+    for scale in args.scale:
+        faq_data = {f"{category} {n}": entries for n in range(scale) for category, entries in sections["faq_data"].items()}
+        catalog = build_catalog("bench", related={}, **{**sections, "faq_data": faq_data})
+        start = time.perf_counter()
+        index = FaqIndex(catalog.faqs)
+        build_ms = (time.perf_counter() - start) * 1000
+        scan_p50, scan_p95 = per_query_ms(lambda q: scan(catalog.faqs, q), args.repeat)
+        index_p50, index_p95 = per_query_ms(index.search, args.repeat)
+        suggest_p50, suggest_p99 = per_query_ms(index.suggest, args.repeat, keystrokes, percentile=0.99)
+        print(f"{len(catalog.faqs):>7}{build_ms:>10.1f}{scan_p50:>10.3f}{scan_p95:>10.3f}{index_p50:>11.3f}{index_p95:>11.3f}"
+              f"{suggest_p50:>13.3f}{suggest_p99:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Compare per-worker memory for a private catalog against the shared mapping.
+
+Starts N worker processes per mode. Each loads the catalog, reads every
+string in it, builds the search and Call Assist indexes as a worker serving
+those pages would, and reports how much its RSS and PSS (proportional set
+size, where shared pages are split between the processes mapping them) grew,
+for the catalog alone and with the indexes. All workers of a mode are alive
+when they measure, so the shared pages are split between them. Linux only
+(/proc/self/smaps_rollup).
+
+The indexes are private to each worker in both modes; only the catalog
+itself is shared.
+
+    python benchmarks/worker_rss.py --workers 4 --scale 50
+
+--scale copies the FAQ entries that many times to stand in for a larger
+knowledge base.
+"""
+import argparse
+import json
+import multiprocessing
+import shutil
+import sys
+import tempfile
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def memory_kb():
+    usage = {}
+    for line in Path("/proc/self/smaps_rollup").read_text().splitlines():
+        parts = line.split()
+        if parts[0] in ("Rss:", "Pss:"):
+            usage[parts[0][:-1].lower()] = int(parts[1])
+    return usage
+
+
+def walk(value):
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, Mapping):
+        return sum(walk(k) + walk(v) for k, v in value.items())
+    if isinstance(value, Sequence):
+        return sum(walk(v) for v in value)
+    return 0
+
+
+def worker(mode, content_dir, barrier, results):
+    from cutting_edge.assist import call_matcher
+    from cutting_edge.catalog import Catalog, CatalogStore
+    from cutting_edge.search import client_index, faq_index
+    from cutting_edge.shared import SharedCatalogStore
+
+    barrier.wait()
+    before = memory_kb()
+    store = SharedCatalogStore(content_dir) if mode == "shared" else CatalogStore(content_dir)
+    catalog = store.current()
+    chars = sum(walk(getattr(catalog, field)) for field in Catalog._fields if field != "version")
+    barrier.wait()
+    loaded = memory_kb()
+    barrier.wait()
+    client_index(faq_index(catalog))
+    call_matcher(catalog)
+    barrier.wait()
+    indexed = memory_kb()
+    results.put({
+        "rss_kb": loaded["rss"] - before["rss"], "pss_kb": loaded["pss"] - before["pss"],
+        "indexed_rss_kb": indexed["rss"] - before["rss"], "indexed_pss_kb": indexed["pss"] - before["pss"],
+        "chars": chars,
+    })
+    barrier.wait()
+
+
+def scaled_content(scale, into):
+    for path in (ROOT / "content").glob("*.json"):
+        shutil.copy(path, into / path.name)
+    faq_data = json.loads((ROOT / "content" / "faq_data.json").read_text())
+    scaled = {f"{category} {n}": entries for n in range(scale) for category, entries in faq_data.items()}
+    (into / "faq_data.json").write_text(json.dumps(scaled))
+
+
+def run(mode, workers, content_dir):
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(mode, content_dir, barrier, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    samples = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--scale", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        content_dir = Path(tmp)
+        scaled_content(args.scale, content_dir)
+        from cutting_edge.catalog import CatalogStore
+        from cutting_edge.shared import write_shared
+
+        # Build both artifacts up front so no worker pays for compiling.
+        write_shared(CatalogStore(content_dir).current(), content_dir / "catalog.bin")
+        size_kb = (content_dir / "catalog.bin").stat().st_size / 1024
+        print(f"{args.workers} workers, faq scale x{args.scale}, catalog.bin {size_kb:,.0f} KiB")
+        print(f"{'mode':<20}{'chars read':>12}{'RSS/worker':>14}{'PSS/worker':>14}{'PSS total':>12}")
+        for mode in ("private", "shared"):
+            samples = run(mode, args.workers, content_dir)
+            for label, prefix in ((mode, ""), (f"{mode} + indexes", "indexed_")):
+                rss = sum(s[f"{prefix}rss_kb"] for s in samples) / len(samples)
+                pss = sum(s[f"{prefix}pss_kb"] for s in samples) / len(samples)
+                print(f"{label:<20}{samples[0]['chars']:>12,}{rss:>11,.0f} KiB{pss:>11,.0f} KiB{pss * len(samples):>8,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Streaming phrase matcher behind the Call Assist page.
+
+Objection surfaces, attach-guide triggers and FAQ category keywords are
+compiled into one Aho-Corasick automaton over the search tokenizer's
+stemmed words, so "we can pay in cash, right?" matches "Can I pay with
+cash?". Text is fed in chunks as it arrives; each word goes through the
+automaton once, so the cost is proportional to the input, however many
+phrases there are. A word cut off at the end of a chunk is held back until
+the next chunk completes it.
+
+Matches are keys like the related table's: objection:<id>,
+attach:<service> and faqs:<category>.
+
+    some-transcript-feed | python -m cutting_edge.assist
+"""
+import re
+import sys
+import threading
+
+from cutting_edge.catalog import load_catalog
+from cutting_edge.search import tokenize
+
+# FAQ category names are lists of topics: "Payment & Billing".
+KEYWORD_SEPARATOR = re.compile(r"\s*[&/]\s*")
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over stemmed words.
+
+    Node 0 is the root. A stream's whole state is the node it is at (plus
+    any partial word it holds back), so it fits in session state.
+    """
+
+    def __init__(self, phrases):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+        for text, key in phrases:
+            node = 0
+            for term in tokenize(text):
+                child = self.goto[node].get(term)
+                if child is None:
+                    child = self.goto[node][term] = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                node = child
+            if node and key not in self.output[node]:
+                self.output[node] += (key,)
+
+        # Breadth first, so a node's failure target is final before its
+        # children need it; outputs along the failure chain are folded in.
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for term, child in self.goto[node].items():
+                queue.append(child)
+                target = self.fail[node]
+                while target and term not in self.goto[target]:
+                    target = self.fail[target]
+                self.fail[child] = self.goto[target].get(term, 0) if node else 0
+                self.output[child] += tuple(k for k in self.output[self.fail[child]] if k not in self.output[child])
+
+    def scan(self, node, terms):
+        """(node after terms, keys matched along the way in order)."""
+        goto, fail, output = self.goto, self.fail, self.output
+        matches = []
+        for term in terms:
+            while node and term not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(term, 0)
+            matches.extend(output[node])
+        return node, matches
+
+    def feed(self, node, pending, chunk):
+        """Consume a chunk of text: (node, pending, matches).
+
+        pending is the partial word returned by the previous call ("" at the
+        start of a stream).
+        """
+        text = pending + chunk
+        # Hold back the word still being spoken if the chunk ends inside it.
+        cut = len(text)
+        while cut and (text[cut - 1].isalnum() or text[cut - 1] in "_'"):
+            cut -= 1
+        node, matches = self.scan(node, tokenize(text[:cut]))
+        return node, text[cut:], matches
+
+    def flush(self, node, pending):
+        """Matches completed by treating the pending word as finished."""
+        return self.scan(node, tokenize(pending))
+
+
+def phrases(catalog):
+    for o in catalog.objections:
+        yield o["surface"], f"objection:{o['id']}"
+    for service, data in catalog.attach_guides.items():
+        for trigger in data["triggers"]:
+            yield trigger, f"attach:{service}"
+    for category in catalog.faq_categories:
+        for keyword in KEYWORD_SEPARATOR.split(category):
+            yield keyword, f"faqs:{category}"
+
+
+_matcher = (None, None)
+_matcher_lock = threading.Lock()
+
+
+def call_matcher(catalog):
+    """The matcher for this catalog version, compiled on first use."""
+    global _matcher
+    version, matcher = _matcher
+    if version != catalog.version:
+        with _matcher_lock:
+            if _matcher[0] != catalog.version:
+                _matcher = (catalog.version, PhraseMatcher(phrases(catalog)))
+            version, matcher = _matcher
+    return matcher
+
+
+def main():
+    catalog = load_catalog()
+    matcher = call_matcher(catalog)
+    node, pending = 0, ""
+    # Each line of the feed is a chunk, matched as soon as it arrives.
+    for chunk in iter(sys.stdin.readline, ""):
+        node, pending, matches = matcher.feed(node, pending, chunk)
+        for key in matches:
+            print(key, flush=True)
+    for key in matcher.flush(node, pending)[1]:
+        print(key, flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+from pathlib import Path
+
+from cutting_edge.related import related_table
+
+ROOT = Path(__file__).resolve().parent.parent
+CONTENT_DIR = ROOT / "content"
+SNAPSHOT_PATH = CONTENT_DIR / "catalog.snapshot"
+
+SECTIONS = ("objections", "dispositions", "guide_scenarios", "attach_guides", "qa_questions", "faq_data")
+SNAPSHOT_FORMAT = 3
+
+BUILDER_FIELDS = ("openings", "points", "closes")
+SECTION_TYPES = {
+    "objections": list,
+    "dispositions": list,
+    "guide_scenarios": dict,
+    "attach_guides": dict,
+    "qa_questions": list,
+    "faq_data": dict,
+}
+
+
+class ContentError(ValueError):
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__("invalid content:\n" + "\n".join(f"  - {p}" for p in problems))
+
+
+def source_path(section, content_dir=CONTENT_DIR):
+    return Path(content_dir) / f"{section}.json"
+
+
+def read_sources(content_dir=CONTENT_DIR):
+    return {section: source_path(section, content_dir).read_bytes() for section in SECTIONS}
+
+
+def section_digest(raw):
+    return hashlib.sha256(raw).hexdigest()
+
+
+def content_version(digests):
+    combined = hashlib.sha256()
+    for section in SECTIONS:
+        combined.update(f"{section}:{digests[section]}".encode())
+    return combined.hexdigest()[:12]
+
+
+def parse_section(section, raw):
+    try:
+        return json.loads(raw)
+    except ValueError as e:
+        raise ContentError([f"{section}.json: {e}"]) from None
+
+
+def _check_text(problems, where, record, fields):
+    for field in fields:
+        value = record.get(field) if isinstance(record, dict) else None
+        if not isinstance(value, str) or not value.strip():
+            problems.append(f"{where}: missing or empty '{field}'")
+
+
+def _check_shape(problems, where, value, kind):
+    """False (and a problem noted) if value is not a kind; callers skip
+    the entry rather than read fields from it."""
+    if isinstance(value, kind):
+        return True
+    problems.append(f"{where}: expected {'an object' if kind is dict else 'a list'}, got {type(value).__name__}")
+    return False
+
+
+def _check_builder(problems, where, data):
+    for field in BUILDER_FIELDS:
+        options = data.get(field)
+        if not isinstance(options, dict) or not options:
+            problems.append(f"{where}: '{field}' must be a non-empty mapping")
+
+
+def _validate_objections(problems, objections):
+    seen_ids = set()
+    for i, o in enumerate(objections):
+        where = f"objections[{i}]"
+        if not _check_shape(problems, where, o, dict):
+            continue
+        _check_text(problems, where, o, ("category", "surface", "reason", "rebuttal"))
+        if not isinstance(o.get("id"), int):
+            problems.append(f"{where}: 'id' must be an integer")
+        elif o["id"] in seen_ids:
+            problems.append(f"{where}: duplicate objection id {o['id']}")
+        else:
+            seen_ids.add(o["id"])
+
+
+def _validate_dispositions(problems, dispositions):
+    for i, d in enumerate(dispositions):
+        if not isinstance(d, str) or not d.strip():
+            problems.append(f"dispositions[{i}]: must be a non-empty string")
+    dispositions = [d for d in dispositions if isinstance(d, str)]
+    if len(set(dispositions)) != len(dispositions):
+        problems.append("dispositions: entries must be unique")
+
+
+def _validate_guide_scenarios(problems, guide_scenarios):
+    for name, data in guide_scenarios.items():
+        where = f"guide_scenarios[{name!r}]"
+        if _check_shape(problems, where, data, dict):
+            _check_builder(problems, where, data)
+
+
+def _validate_attach_guides(problems, attach_guides):
+    for name, data in attach_guides.items():
+        where = f"attach_guides[{name!r}]"
+        if not _check_shape(problems, where, data, dict):
+            continue
+        _check_builder(problems, where, data)
+        _check_text(problems, where, data, ("pro_tip",))
+        triggers = data.get("triggers")
+        if not isinstance(triggers, list) or not triggers or not all(isinstance(t, str) and t.strip() for t in triggers):
+            problems.append(f"{where}: 'triggers' must be a non-empty list of strings")
+
+
+def _validate_qa_questions(problems, qa_questions):
+    for i, q in enumerate(qa_questions):
+        where = f"qa_questions[{i}]"
+        if not _check_shape(problems, where, q, dict):
+            continue
+        _check_text(problems, where, q, ("category", "scenario", "correct", "explanation"))
+        if not isinstance(q.get("options"), dict) or not q["options"]:
+            problems.append(f"{where}: 'options' must be a non-empty mapping")
+        elif isinstance(q.get("correct"), str) and q["correct"] not in q["options"]:
+            problems.append(f"{where}: correct answer {q.get('correct')!r} is not one of {sorted(q['options'])}")
+
+
+def _validate_faq_data(problems, faq_data):
+    for category, faqs in faq_data.items():
+        if not _check_shape(problems, f"faq_data[{category!r}]", faqs, list):
+            continue
+        for i, faq in enumerate(faqs):
+            where = f"faq_data[{category!r}][{i}]"
+            if _check_shape(problems, where, faq, dict):
+                _check_text(problems, where, faq, ("question", "answer", "phrasing"))
+
+
+VALIDATORS = {
+    "objections": _validate_objections,
+    "dispositions": _validate_dispositions,
+    "guide_scenarios": _validate_guide_scenarios,
+    "attach_guides": _validate_attach_guides,
+    "qa_questions": _validate_qa_questions,
+    "faq_data": _validate_faq_data,
+}
+
+
+def validate(sections):
+    # Every rule is local to one section, so a partial dict (as used by the
+    # hot-reload path) is validated on its own.
+    problems = []
+    for section, data in sections.items():
+        if _check_shape(problems, f"{section}.json", data, SECTION_TYPES[section]):
+            VALIDATORS[section](problems, data)
+    if problems:
+        raise ContentError(problems)
+
+
+def compile_sources(content_dir=CONTENT_DIR):
+    raw = read_sources(content_dir)
+    sections = {section: parse_section(section, raw[section]) for section in SECTIONS}
+    validate(sections)
+    digests = {section: section_digest(raw[section]) for section in SECTIONS}
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "version": content_version(digests),
+        "digests": digests,
+        "sections": sections,
+        "related": related_table(sections),
+    }
+
+
+def write_snapshot(snapshot, path=SNAPSHOT_PATH):
+    path = Path(path)
+    # A temp file of this writer's own: the shared catalog.bin and other
+    # processes rewriting the snapshot write next to it at the same time.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp, path)
+
+
+def read_snapshot(path=SNAPSHOT_PATH):
+    snapshot = pickle.loads(Path(path).read_bytes())
+    if snapshot.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"{path}: unsupported snapshot format {snapshot.get('format')!r}")
+    return snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the training content and compile the catalog snapshot.")
+    parser.add_argument("--content-dir", default=CONTENT_DIR, type=Path)
+    parser.add_argument("--output", default=None, type=Path, help="snapshot path (default: <content-dir>/catalog.snapshot)")
+    parser.add_argument("--check", action="store_true", help="validate only, do not write the snapshot")
+    parser.add_argument("--shared", action="store_true", help="also write the memory-mapped catalog.bin")
+    args = parser.parse_args(argv)
+
+    try:
+        snapshot = compile_sources(args.content_dir)
+    except ContentError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    if not args.check:
+        # Imported here: both modules import this one.
+        from cutting_edge.catalog import build_catalog
+        from cutting_edge.search import FaqIndex, write_client_index
+
+        output = args.output or Path(args.content_dir) / SNAPSHOT_PATH.name
+        write_snapshot(snapshot, output)
+        print(f"wrote {output} (version {snapshot['version']})")
+        catalog = build_catalog(snapshot["version"], related=snapshot["related"], **snapshot["sections"])
+        print(f"wrote {write_client_index(FaqIndex(catalog.faqs, catalog.version))}")
+        if args.shared:
+            from cutting_edge.shared import write_shared
+
+            shared_output = output.with_name("catalog.bin")
+            write_shared(catalog, shared_output)
+            print(f"wrote {shared_output}")
+    else:
+        print(f"content ok (version {snapshot['version']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+import logging
+import os
+import pickle
+import re
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+from cutting_edge import build
+from cutting_edge.related import RELATED_SECTIONS, related_table
+
+log = logging.getLogger(__name__)
+
+
+class Catalog(NamedTuple):
+    version: str
+    objections: tuple
+    dispositions: tuple
+    guide_scenarios: MappingProxyType
+    attach_guides: MappingProxyType
+    qa_questions: tuple
+    faq_data: MappingProxyType
+    # Derived views, computed once when the catalog is built.
+    objection_categories: tuple
+    objections_by_id: MappingProxyType
+    objections_by_category: MappingProxyType
+    faq_categories: tuple
+    faqs: tuple
+    faqs_by_id: MappingProxyType
+    faqs_by_category: MappingProxyType
+    # "<kind>:<id>" -> keys of the most similar items (see related.py).
+    related: MappingProxyType
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def faq_id(category, position):
+    return f"{slugify(category)}-{position + 1}"
+
+
+def _derive_objections(objections):
+    objections = freeze(objections)
+    objection_categories = tuple(dict.fromkeys(o["category"] for o in objections))
+    objections_by_category = {c: [] for c in objection_categories}
+    for o in objections:
+        objections_by_category[o["category"]].append(o)
+    return {
+        "objections": objections,
+        "objection_categories": objection_categories,
+        "objections_by_id": MappingProxyType({o["id"]: o for o in objections}),
+        "objections_by_category": freeze(objections_by_category),
+    }
+
+
+def _derive_faq_data(faq_data):
+    faq_data = freeze(faq_data)
+    faqs = tuple(
+        MappingProxyType({"id": faq_id(category, i), "category": category, **faq})
+        for category, entries in faq_data.items()
+        for i, faq in enumerate(entries)
+    )
+    faqs_by_category = {category: [] for category in faq_data}
+    for faq in faqs:
+        faqs_by_category[faq["category"]].append(faq)
+    return {
+        "faq_data": faq_data,
+        "faq_categories": tuple(faq_data),
+        "faqs": faqs,
+        "faqs_by_id": MappingProxyType({f["id"]: f for f in faqs}),
+        "faqs_by_category": freeze(faqs_by_category),
+    }
+
+
+# Each section maps to the catalog fields it owns, so a change to one source
+# file only rebuilds that section and the views derived from it.
+DERIVERS = {
+    "objections": _derive_objections,
+    "dispositions": lambda data: {"dispositions": freeze(data)},
+    "guide_scenarios": lambda data: {"guide_scenarios": freeze(data)},
+    "attach_guides": lambda data: {"attach_guides": freeze(data)},
+    "qa_questions": lambda data: {"qa_questions": freeze(data)},
+    "faq_data": _derive_faq_data,
+}
+
+
+def build_catalog(version, related=None, **sections):
+    # The snapshot carries the related table; it is only computed here when
+    # the catalog is built straight from sources.
+    fields = {"version": version}
+    for section in build.SECTIONS:
+        fields.update(DERIVERS[section](sections[section]))
+    fields["related"] = freeze(related if related is not None else related_table(sections))
+    return Catalog(**fields)
+
+
+def update_catalog(catalog, version, changed):
+    fields = {"version": version}
+    for section, data in changed.items():
+        fields.update(DERIVERS[section](data))
+    if any(section in RELATED_SECTIONS for section in changed):
+        sections = {section: changed.get(section, getattr(catalog, section)) for section in RELATED_SECTIONS}
+        fields["related"] = freeze(related_table(sections))
+    return catalog._replace(**fields)
+
+
+def _signature(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+class CatalogStore:
+    """Holds the current catalog and swaps in a new one when sources change.
+
+    Readers call current() once per rerun and keep using that object, so a
+    reload that lands mid-rerun never mixes old and new content.
+    """
+
+    def __init__(self, content_dir=build.CONTENT_DIR):
+        self.content_dir = Path(content_dir)
+        self.snapshot_path = self.content_dir / build.SNAPSHOT_PATH.name
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+        self._signatures = self._read_signatures()
+
+        snapshot = self._load_snapshot()
+        self._digests = dict(snapshot["digests"])
+        self._catalog = build_catalog(snapshot["version"], related=snapshot["related"], **snapshot["sections"])
+
+    def current(self):
+        return self._catalog
+
+    def _read_signatures(self):
+        return {s: _signature(build.source_path(s, self.content_dir)) for s in build.SECTIONS}
+
+    def _load_snapshot(self):
+        try:
+            built = os.stat(self.snapshot_path).st_mtime_ns
+            if all(mtime <= built for mtime, _ in self._signatures.values()):
+                return build.read_snapshot(self.snapshot_path)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            pass  # missing, stale or not a snapshot: compile the sources
+        snapshot = build.compile_sources(self.content_dir)
+        try:
+            build.write_snapshot(snapshot, self.snapshot_path)
+        except OSError as e:
+            log.warning("could not write catalog snapshot: %s", e)
+        return snapshot
+
+    def reload(self):
+        """Rebuild the sections whose source files changed.
+
+        Returns the names of the reloaded sections. Invalid content leaves the
+        current catalog in place and is reported through last_error.
+        """
+        with self._lock:
+            signatures = self._read_signatures()
+            stale = [s for s in build.SECTIONS if signatures[s] != self._signatures[s]]
+            if not stale:
+                return []
+
+            raw = {s: build.source_path(s, self.content_dir).read_bytes() for s in stale}
+            digests = {s: build.section_digest(raw[s]) for s in stale}
+            changed = [s for s in stale if digests[s] != self._digests[s]]
+            try:
+                sections = {s: build.parse_section(s, raw[s]) for s in changed}
+                build.validate(sections)
+            except build.ContentError as e:
+                if str(e) != str(self.last_error):
+                    log.error("content reload rejected, keeping version %s\n%s", self._catalog.version, e)
+                self.last_error = e
+                return []
+
+            self.last_error = None
+            self._signatures.update({s: signatures[s] for s in stale})
+            if changed:
+                self._digests.update({s: digests[s] for s in changed})
+                version = build.content_version(self._digests)
+                # A single reference assignment publishes the new catalog.
+                self._catalog = update_catalog(self._catalog, version, sections)
+                log.info("reloaded %s (version %s)", ", ".join(changed), version)
+            return changed
+
+    def start_watching(self, interval=2.0):
+        if self._watcher is not None:
+            return
+        self._watcher = threading.Thread(target=self._watch, args=(interval,), name="catalog-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop.set()
+
+    def _watch(self, interval):
+        failure = None
+        while not self._stop.wait(interval):
+            # Whatever a bad edit raises, the watcher must survive it or hot
+            # reload stops for the life of the process.
+            try:
+                self.reload()
+                failure = None
+            except OSError as e:
+                log.warning("content watcher: %s", e)
+            except Exception as e:
+                if repr(e) != failure:
+                    log.exception("content watcher: reload failed, keeping version %s", self._catalog.version)
+                failure = repr(e)
+
+
+def load_catalog(content_dir=build.CONTENT_DIR):
+    return CatalogStore(content_dir).current()
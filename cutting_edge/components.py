@@ -0,0 +1,134 @@
+import hashlib
+import threading
+from collections import defaultdict, deque
+from functools import wraps
+from html import escape
+from pathlib import Path
+
+import streamlit as st
+
+STYLESHEET = Path(__file__).resolve().parent.parent / "static" / "cutting_edge.css"
+# The content hash in the URL lets browsers cache the stylesheet indefinitely
+# and still pick up a new one after a deploy.
+STYLESHEET_URL = f"app/static/{STYLESHEET.name}?v={hashlib.sha256(STYLESHEET.read_bytes()).hexdigest()[:10]}"
+
+
+class PayloadSizes:
+    """Process-wide rolling samples of markup bytes emitted per view."""
+
+    def __init__(self, maxlen=1000):
+        self._samples = defaultdict(lambda: deque(maxlen=maxlen))
+        self._lock = threading.Lock()
+
+    def record(self, view, nbytes):
+        with self._lock:
+            self._samples[view].append(nbytes)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        with self._lock:
+            samples = {view: list(values) for view, values in self._samples.items() if values}
+        return {view: {"count": len(v), "last": v[-1], "mean": sum(v) / len(v)} for view, v in samples.items()}
+
+
+payloads = PayloadSizes()
+_meter = threading.local()
+
+
+def metered(view):
+    """Count the markup bytes a view emits through html() on each run."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            outer = getattr(_meter, "count", None)
+            _meter.count = 0
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                payloads.record(view, _meter.count)
+                _meter.count = outer
+        return wrapper
+    return decorator
+
+
+def html(markup):
+    count = getattr(_meter, "count", None)
+    if count is not None:
+        _meter.count = count + len(markup.encode())
+    st.markdown(markup, unsafe_allow_html=True)
+
+
+def stylesheet():
+    html(f'<link rel="stylesheet" href="{STYLESHEET_URL}">')
+
+
+def tagline(text):
+    html(f'<p class="tagline">{text}</p>')
+
+
+def note(text, align=None):
+    html(f'<p class="note right">{text}</p>' if align == "right" else f'<p class="note">{text}</p>')
+
+
+def card_open(title):
+    html(f'<div class="card"><h3>{title}</h3>')
+
+
+def card_close():
+    html('</div>')
+
+
+def tip_card(title, body):
+    html(tip_card_markup(title, body))
+
+
+def tip_card_markup(title, body):
+    return f'<div class="card tip"><h4>{title}</h4><p>{body}</p></div>'
+
+
+def qa_header(score, answered, position, total):
+    html(
+        f'<div class="qa-header"><div class="qa-score"><p>🏆 Score: {score}/{answered}</p></div>'
+        f'<div class="qa-count"><p>Question {position + 1} of {total}</p></div></div>'
+    )
+
+
+def qa_question(category, scenario):
+    html(f'<div class="card"><span class="category-badge">{category}</span><p class="qa-scenario">{scenario}</p></div>')
+
+
+def qa_option(letter, text, state=None):
+    if state == "correct":
+        html(f'<div class="qa-opt correct"><p><strong>✅ {letter}) {text}</strong></p></div>')
+    elif state == "wrong":
+        html(f'<div class="qa-opt wrong"><p><strong>❌ {letter}) {text}</strong></p></div>')
+    else:
+        html(f'<div class="qa-opt"><p>{letter}) {text}</p></div>')
+
+
+def qa_feedback(got_it, explanation):
+    if got_it:
+        html(f'<div class="card qa-right"><h4>🎉 Correct!</h4><p>{explanation}</p></div>')
+    else:
+        html(f'<div class="card qa-miss"><h4>Not quite!</h4><p>{explanation}</p></div>')
+
+
+def qa_final(grade, grade_color, emoji, message, score, total, pct):
+    html(
+        f'<div class="card qa-final" style="--grade:{grade_color}"><p class="mascot">{emoji}🌱</p><h2>{grade}</h2>'
+        f'<p class="points">{score} / {total}</p><p class="pct">({pct:.0f}%)</p><p class="message">{message}</p></div>'
+    )
+
+
+def tally(title, rows):
+    """A ranked list of (label, count) with bars scaled to the largest."""
+    top = max((n for _, n in rows), default=1)
+    items = "".join(
+        f'<li><span class="tally-count">{n}</span>{escape(str(label))}'
+        f'<div class="tally-bar" style="width:{100 * n / top:.0f}%"></div></li>'
+        for label, n in rows
+    )
+    html(f'<div class="tally"><p>{escape(title)}</p><ul>{items}</ul></div>')
@@ -0,0 +1,219 @@
+"""Local store of logged losses, for finding patterns without the sheet.
+
+Every "Log & Send to Sheet" also records the loss here (SQLite in WAL mode,
+var/dispositions.sqlite or CUTTING_EDGE_DISPOSITIONS). Each row keeps the
+local day it was logged on next to its timestamp, and three indexes cover
+the questions the Loss Tracker asks:
+
+  (agent_id, ts)      one agent's losses over a period
+  (disposition, ts)   one disposition's losses over a period, by agent
+  (day, disposition)  the team's losses per day and disposition
+
+Each index also holds the column its queries count by, so "last 7 days for
+agent A123" or "Price losses today" is a range scan of one index, however
+long the history gets.
+
+    python -m cutting_edge.dispositions summary --days 7 [--agent A123] [--disposition Price]
+    python -m cutting_edge.dispositions import losses.jsonl   (rows exported from the sheet)
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import streamlit as st
+
+STORE_PATH = Path(__file__).resolve().parent.parent / "var" / "dispositions.sqlite"
+# How the Loss Tracker stamps a log; the sheet stores the same string.
+TIMESTAMP_FORMAT = "%m/%d/%Y, %I:%M:%S %p"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS losses (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    agent_id TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    disposition TEXT NOT NULL,
+    ts REAL NOT NULL,
+    day TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS losses_agent ON losses (agent_id, ts, disposition);
+CREATE INDEX IF NOT EXISTS losses_disposition ON losses (disposition, ts, agent_id);
+CREATE INDEX IF NOT EXISTS losses_day ON losses (day, disposition);
+"""
+
+
+def period_start(days, today=None):
+    """(first day, its local midnight as a timestamp) of the last `days`
+    days, today included."""
+    first = (today or date.today()) - timedelta(days=days - 1)
+    return first.isoformat(), datetime.combine(first, datetime.min.time()).timestamp()
+
+
+def row_key(row):
+    """A stable key for a row without one, so loading the same export twice
+    stores each loss once."""
+    return hashlib.sha1(json.dumps(row, sort_keys=True).encode()).hexdigest()
+
+
+class DispositionStore:
+    def __init__(self, path=STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+
+    def record(self, agent_name, agent_id, disposition, ts=None, key=None):
+        """Store one loss; a key that is already stored is ignored."""
+        self.record_many([(agent_name, agent_id, disposition, ts, key)])
+
+    def record_many(self, rows):
+        """Store (agent_name, agent_id, disposition, ts, key) rows in one
+        transaction; returns how many were new."""
+        values = []
+        for agent_name, agent_id, disposition, ts, key in rows:
+            ts = time.time() if ts is None else ts
+            day = datetime.fromtimestamp(ts).date().isoformat()
+            values.append((key or row_key([agent_name, agent_id, disposition, ts]), agent_id, agent_name, disposition, ts, day))
+        with self._lock, self._db:
+            before = self._db.total_changes
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT OR IGNORE INTO losses (key, agent_id, agent_name, disposition, ts, day) VALUES (?, ?, ?, ?, ?, ?)",
+                values,
+            )
+            return self._db.total_changes - before
+
+    def _query(self, sql, params):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def by_disposition(self, days, agent_id=None):
+        """[(disposition, losses)] over the last `days` days, most first."""
+        day, ts = period_start(days)
+        if agent_id:
+            return self._query(
+                "SELECT disposition, count(*) AS n FROM losses WHERE agent_id = ? AND ts >= ?"
+                " GROUP BY disposition ORDER BY n DESC, disposition",
+                (agent_id, ts),
+            )
+        # Without INDEXED BY, SQLite may walk losses_disposition to get the
+        # groups in order and read every row ever logged (seconds, not ms).
+        return self._query(
+            "SELECT disposition, count(*) AS n FROM losses INDEXED BY losses_day WHERE day >= ?"
+            " GROUP BY disposition ORDER BY n DESC, disposition",
+            (day,),
+        )
+
+    def by_agent(self, days, disposition=None):
+        """[(agent_id, agent_name, losses)] over the last `days` days, most
+        first, for one disposition or all of them."""
+        day, ts = period_start(days)
+        if disposition:
+            sql, params = "disposition = ? AND ts >= ?", (disposition, ts)
+        else:
+            sql, params = "day >= ?", (day,)
+        # Names come from each agent's latest row, one index probe per agent.
+        return self._query(
+            "SELECT agent_id, (SELECT agent_name FROM losses AS l WHERE l.agent_id = g.agent_id ORDER BY ts DESC LIMIT 1), n"
+            f" FROM (SELECT agent_id, count(*) AS n FROM losses WHERE {sql} GROUP BY agent_id) AS g"
+            " ORDER BY n DESC, agent_id",
+            params,
+        )
+
+    def daily(self, days, disposition=None):
+        """[(day, disposition, losses)] for each day of the last `days` days
+        that has any."""
+        day, _ = period_start(days)
+        if disposition:
+            return self._query(
+                "SELECT day, disposition, count(*) FROM losses INDEXED BY losses_day WHERE day >= ? AND disposition = ?"
+                " GROUP BY day ORDER BY day",
+                (day, disposition),
+            )
+        return self._query(
+            "SELECT day, disposition, count(*) FROM losses INDEXED BY losses_day WHERE day >= ?"
+            " GROUP BY day, disposition ORDER BY day, disposition",
+            (day,),
+        )
+
+    def recent(self, agent_id, limit=10):
+        """An agent's latest losses: [(ts, disposition)], newest first."""
+        return self._query(
+            "SELECT ts, disposition FROM losses WHERE agent_id = ? ORDER BY ts DESC LIMIT ?", (agent_id, limit),
+        )
+
+    def since(self, last_id, limit):
+        """Rows stored after last_id, oldest first: [(id, agent_id,
+        agent_name, disposition, ts)]."""
+        return self._query(
+            "SELECT id, agent_id, agent_name, disposition, ts FROM losses WHERE id > ? ORDER BY id LIMIT ?", (last_id, limit),
+        )
+
+    def count(self):
+        return self._query("SELECT count(*) FROM losses", ())[0][0]
+
+
+@st.cache_resource
+def get_disposition_store():
+    return DispositionStore(os.environ.get("CUTTING_EDGE_DISPOSITIONS", STORE_PATH))
+
+
+def load_export(store, path):
+    """Load a JSON lines export of the sheet ({agentName, agentId,
+    disposition, timestamp}); returns (rows read, rows new)."""
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                key = row.pop("idempotencyKey", None) or row_key(row)
+                ts = datetime.strptime(row["timestamp"], TIMESTAMP_FORMAT).timestamp()
+                rows.append((row["agentName"], row["agentId"], row["disposition"], ts, key))
+    return len(rows), store.record_many(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the local Loss Tracker history.")
+    parser.add_argument("--db", type=Path, default=Path(os.environ.get("CUTTING_EDGE_DISPOSITIONS", STORE_PATH)))
+    sub = parser.add_subparsers(dest="command", required=True)
+    summary = sub.add_parser("summary", help="losses by disposition, agent and day")
+    summary.add_argument("--days", type=int, default=7)
+    summary.add_argument("--agent", help="only this agent id")
+    summary.add_argument("--disposition", help="only this disposition")
+    load = sub.add_parser("import", help="load a JSON lines export of the sheet")
+    load.add_argument("path", type=Path)
+    args = parser.parse_args(argv)
+
+    store = DispositionStore(args.db)
+    if args.command == "import":
+        read, new = load_export(store, args.path)
+        print(f"read {read:,} row(s), {new:,} new; {store.count():,} stored")
+        return 0
+
+    start = time.perf_counter()
+    report = {"days": args.days}
+    if args.disposition:
+        report["by_agent"] = store.by_agent(args.days, args.disposition)
+    else:
+        report["by_disposition"] = store.by_disposition(args.days, args.agent)
+    if args.agent:
+        report["recent"] = [(datetime.fromtimestamp(ts).strftime(TIMESTAMP_FORMAT), d) for ts, d in store.recent(args.agent)]
+    else:
+        report["daily"] = store.daily(args.days, args.disposition)
+    report["ms"] = round((time.perf_counter() - start) * 1000, 2)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
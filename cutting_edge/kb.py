@@ -0,0 +1,285 @@
+"""SQLite FTS5 knowledge base for FAQ corpora too large to hold in the catalog.
+
+Set CUTTING_EDGE_KB to a database built with
+
+    python -m cutting_edge.kb import articles.jsonl --db content/kb.sqlite
+
+and the FAQ page browses and searches it instead of content/faq_data.json.
+The database is opened read-only with memory-mapped I/O, so startup does not
+load the corpus and its pages are shared through the OS page cache. Rebuilding
+it replaces the file atomically; open readers move to the new file on their
+next query.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+from cutting_edge import build
+from cutting_edge.catalog import faq_id
+from cutting_edge.search import FUZZY_MIN_LENGTH, edit_distance, max_edits
+
+# Column weights for bm25(), in column order: question, answer, phrasing.
+BM25_WEIGHTS = (3.0, 1.0, 0.5)
+MMAP_SIZE = 1 << 30
+CACHE_KIB = 8 * 1024
+SNIPPET_TOKENS = 16
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE articles (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    category TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    phrasing TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX articles_category ON articles (category, rowid);
+CREATE VIRTUAL TABLE articles_fts USING fts5(
+    question, answer, phrasing,
+    content='articles', content_rowid='rowid', tokenize='porter unicode61 remove_diacritics 2'
+);
+CREATE VIRTUAL TABLE articles_vocab USING fts5vocab(articles_fts, 'row');
+"""
+
+WORD = re.compile(r"\w+")
+
+
+def match_expression(query, operator=" ", prefix=False, column=None):
+    """An FTS5 MATCH expression for free text, with every word quoted so
+    user input cannot produce a syntax error."""
+    words = WORD.findall(query.lower())
+    if not words:
+        return None
+    terms = [f'"{w}"' for w in words]
+    if prefix:
+        terms[-1] += "*"
+    expression = operator.join(terms)
+    return f"{column} : ({expression})" if column else expression
+
+
+class KnowledgeBase:
+    """Read-only access to a knowledge base database.
+
+    Mirrors the FAQ source interface of search.CatalogFaqs: records are
+    dicts with id, category and question (plus answer and phrasing from
+    get(), and a highlighted snippet from search()).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._connection()
+
+    def _connection(self):
+        # One connection per thread; reopened when the file is replaced.
+        inode = os.stat(self.path).st_ino
+        local = self._local
+        if getattr(local, "inode", None) != inode:
+            if getattr(local, "db", None) is not None:
+                local.db.close()
+            db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            db.row_factory = sqlite3.Row
+            db.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            db.execute(f"PRAGMA cache_size = -{CACHE_KIB}")
+            db.execute("PRAGMA query_only = 1")
+            local.db, local.inode = db, inode
+            local.version = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]
+        return local.db
+
+    @property
+    def version(self):
+        self._connection()
+        return self._local.version
+
+    def categories(self):
+        rows = self._connection().execute("SELECT category FROM articles GROUP BY category ORDER BY min(rowid)")
+        return [row[0] for row in rows]
+
+    def count(self, category=None):
+        if category is None:
+            return self._connection().execute("SELECT count(*) FROM articles").fetchone()[0]
+        return self._connection().execute("SELECT count(*) FROM articles WHERE category = ?", (category,)).fetchone()[0]
+
+    def page(self, category, start, end):
+        where, params = ("WHERE category = ?", (category,)) if category is not None else ("", ())
+        rows = self._connection().execute(
+            f"SELECT id, category, question FROM articles {where} ORDER BY rowid LIMIT ? OFFSET ?",
+            (*params, end - start, start),
+        )
+        return [dict(row) for row in rows]
+
+    def get(self, article_id):
+        row = self._connection().execute(
+            "SELECT id, category, question, answer, phrasing FROM articles WHERE id = ?", (article_id,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def _match(self, expression, category, limit, offset=0, snippets=False):
+        snippet = f", snippet(articles_fts, 1, '<mark>', '</mark>', '…', {SNIPPET_TOKENS}) AS snippet" if snippets else ""
+        where, params = ("AND a.category = ?", (category,)) if category is not None else ("", ())
+        rows = self._connection().execute(
+            f"SELECT a.id, a.category, a.question{snippet} FROM articles_fts f JOIN articles a ON a.rowid = f.rowid"
+            f" WHERE articles_fts MATCH ? {where} ORDER BY bm25(articles_fts, ?, ?, ?) LIMIT ? OFFSET ?",
+            (expression, *params, *BM25_WEIGHTS, limit, offset),
+        )
+        return [dict(row) for row in rows]
+
+    def _count_matches(self, expression, category):
+        where, params = ("AND a.category = ?", (category,)) if category is not None else ("", ())
+        return self._connection().execute(
+            f"SELECT count(*) FROM articles_fts f JOIN articles a ON a.rowid = f.rowid WHERE articles_fts MATCH ? {where}",
+            (expression, *params),
+        ).fetchone()[0]
+
+    def correct(self, word):
+        """The indexed term closest to a misspelled word, or the word itself.
+
+        Candidates are the (stemmed) vocabulary terms sharing its first
+        letter, checked with the same bounded edit distance as the catalog
+        search; ties go to the term in more articles.
+        """
+        if len(word) < FUZZY_MIN_LENGTH or word.isdigit():
+            return word
+        limit = max_edits(word)
+        rows = self._connection().execute(
+            "SELECT term, doc FROM articles_vocab WHERE term >= ? AND term < ? AND length(term) BETWEEN ? AND ?",
+            (word[0], word[0] + "\uffff", len(word) - limit - 2, len(word) + limit),
+        )
+        best, best_key = word, None
+        for term, docs in rows:
+            distance = edit_distance(word, term, limit)
+            if distance <= limit and (best_key is None or (distance, -docs) < best_key):
+                best, best_key = term, (distance, -docs)
+        return best
+
+    def normalize(self, query):
+        # Queries with the same normalized form get the same results.
+        return " ".join(WORD.findall(query.lower()))
+
+    def search(self, query, category=None, start=0, end=None):
+        """(total, records[start:end]) ranked by bm25, each with an answer
+        snippet whose matches are wrapped in <mark>.
+
+        Articles containing every word are returned when there are any, then
+        articles containing every word after misspellings are corrected, and
+        otherwise articles containing at least one of the words.
+        """
+        words = WORD.findall(query.lower())
+        if not words:
+            return 0, []
+        corrected = None
+        for attempt in ("exact", "corrected", "any"):
+            if attempt == "corrected":
+                corrected = " ".join(self.correct(w) for w in words)
+                if corrected == " ".join(words):
+                    continue
+            expression = match_expression(corrected if attempt == "corrected" else query, " OR " if attempt == "any" else " ")
+            total = self._count_matches(expression, category)
+            if total:
+                limit = (end if end is not None else total) - start
+                return total, self._match(expression, category, limit, start, snippets=True)
+        return 0, []
+
+    def suggest(self, text, limit=8):
+        expression = match_expression(text, prefix=not text[-1:].isspace(), column="question")
+        if expression is None:
+            return []
+        return self._match(expression, None, limit)
+
+    def client_index_url(self):
+        # Too large to ship to the browser; suggestions come from the server.
+        return None
+
+
+def read_articles(source):
+    """Articles from faq_data.json ({category: [faq, ...]}), a JSON list, or
+    JSON lines. Entries without an id get the catalog's category-slug ids."""
+    text = Path(source).read_text(encoding="utf-8")
+    if Path(source).suffix == ".jsonl":
+        data = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        data = json.loads(text)
+    if isinstance(data, dict):
+        data = [{"category": category, **faq} for category, faqs in data.items() for faq in faqs]
+
+    positions = {}
+    for i, article in enumerate(data):
+        problems = []
+        build._check_text(problems, f"{source}[{i}]", article, ("category", "question", "answer"))
+        if problems:
+            raise build.ContentError(problems)
+        position = positions.get(article["category"], 0)
+        positions[article["category"]] = position + 1
+        yield {
+            "id": str(article.get("id") or faq_id(article["category"], position)),
+            "category": article["category"],
+            "question": article["question"],
+            "answer": article["answer"],
+            "phrasing": article.get("phrasing", ""),
+        }
+
+
+def import_articles(sources, db_path):
+    """Build a fresh database from the sources and swap it in atomically."""
+    db_path = Path(db_path)
+    tmp = db_path.with_suffix(".tmp")
+    tmp.unlink(missing_ok=True)
+    digest = hashlib.sha256()
+    db = sqlite3.connect(tmp)
+    try:
+        db.executescript(SCHEMA)
+        count = 0
+        for source in sources:
+            for article in read_articles(source):
+                db.execute(
+                    "INSERT INTO articles (id, category, question, answer, phrasing)"
+                    " VALUES (:id, :category, :question, :answer, :phrasing)",
+                    article,
+                )
+                digest.update(json.dumps(article, sort_keys=True).encode())
+                count += 1
+        db.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+        db.execute("INSERT INTO articles_fts (articles_fts) VALUES ('optimize')")
+        db.execute("INSERT INTO meta VALUES ('version', ?)", (digest.hexdigest()[:12],))
+        db.commit()
+        db.execute("VACUUM")
+    except sqlite3.IntegrityError as e:
+        db.close()
+        tmp.unlink()
+        raise build.ContentError([f"duplicate article id: {e}"]) from None
+    except BaseException:
+        db.close()
+        tmp.unlink()
+        raise
+    db.close()
+    os.replace(tmp, db_path)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the SQLite FTS5 knowledge base.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    importer = sub.add_parser("import", help="build the database from article files")
+    importer.add_argument("sources", nargs="*", type=Path, help="default: content/faq_data.json")
+    importer.add_argument("--db", required=True, type=Path)
+    args = parser.parse_args(argv)
+
+    sources = args.sources or [build.source_path("faq_data")]
+    try:
+        count = import_articles(sources, args.db)
+    except build.ContentError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"wrote {args.db} ({count} articles, version {KnowledgeBase(args.db).version})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""Mine archived call transcripts for objections and attach triggers.
+
+    python -m cutting_edge.mining transcripts/2026-09 --out reports/2026-09
+
+Transcripts are read from files or directories (searched recursively):
+
+  *.txt    one call per file
+  *.json   a call object, or a list of them
+  *.jsonl  one call object per line
+
+A call object has "text" (a string, or a list of utterances that are strings
+or {"text": ...}) and optionally "id" and "disposition". Lines and files that
+cannot be decoded or parsed, and calls of any other shape, are skipped and
+counted in the summary rather than stopping the run. Every call is
+streamed through the Call Assist matcher (assist.PhraseMatcher), compiled
+from the objection surfaces and the individual attach triggers, on a pool of
+worker processes. Large .jsonl files are split into byte ranges so one big
+archive still spreads across the pool.
+
+Three CSV files are written to --out:
+
+  objections.csv  calls and mentions per objection
+  triggers.csv    calls and mentions per attach trigger
+  outcomes.csv    per objection/trigger and disposition: calls with both,
+                  and the lift of that disposition among calls with the item
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from cutting_edge.assist import PhraseMatcher
+from cutting_edge.catalog import load_catalog
+
+SPLIT_BYTES = 8 << 20
+SUFFIXES = (".txt", ".json", ".jsonl")
+SKIPPED_SHOWN = 5
+
+
+def phrases(catalog):
+    for o in catalog.objections:
+        yield o["surface"], ("objection", o["id"])
+    for service, data in catalog.attach_guides.items():
+        for trigger in data["triggers"]:
+            yield trigger, ("trigger", service, trigger)
+
+
+def tasks(paths, split_bytes=SPLIT_BYTES):
+    """(path, start, end) work units; end is None for a whole file.
+    Directories are searched for SUFFIXES; a file named directly must have
+    one of them."""
+    for root in paths:
+        root = Path(root)
+        if not root.is_dir() and root.suffix not in SUFFIXES:
+            raise ValueError(f"{root}: not a transcript file (expected {', '.join(SUFFIXES)})")
+        files = sorted(p for p in root.rglob("*") if p.suffix in SUFFIXES) if root.is_dir() else [root]
+        for path in files:
+            size = path.stat().st_size
+            if path.suffix != ".jsonl" or size <= split_bytes:
+                yield str(path), 0, None
+            else:
+                for start in range(0, size, split_bytes):
+                    yield str(path), start, min(start + split_bytes, size)
+
+
+def _utterances(text):
+    if isinstance(text, str):
+        return [text]
+    return [u["text"] if isinstance(u, dict) else u for u in text]
+
+
+def _is_call(call):
+    if not isinstance(call, dict):
+        return False
+    text = call.get("text", "")
+    if isinstance(text, str):
+        return True
+    return isinstance(text, list) and all(
+        isinstance(u, str) or (isinstance(u, dict) and isinstance(u.get("text"), str)) for u in text
+    )
+
+
+def read_calls(path, start=0, end=None, skipped=None):
+    """Call objects in a work unit. A byte range owns the lines that start
+    inside it, so every line is read by exactly one range.
+
+    A line or .json file that cannot be decoded or parsed, and a call object
+    of the wrong shape, is left out and counted in skipped[path] (a Counter).
+    """
+    skipped = Counter() if skipped is None else skipped
+    path = Path(path)
+    if path.suffix == ".txt":
+        yield {"id": path.stem, "text": path.read_text(encoding="utf-8", errors="replace")}
+        return
+    if path.suffix == ".json":
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:  # includes UnicodeDecodeError
+            skipped[str(path)] += 1
+            return
+        calls = data if isinstance(data, list) else [data]
+    elif path.suffix == ".jsonl":
+        calls = _jsonl_calls(path, start, end, skipped)
+    else:
+        raise ValueError(f"{path}: not a transcript file (expected {', '.join(SUFFIXES)})")
+    for call in calls:
+        if _is_call(call):
+            yield call
+        else:
+            skipped[str(path)] += 1
+
+
+def _jsonl_calls(path, start, end, skipped):
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()  # finish the line that began before this range
+        while end is None or f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    skipped[str(path)] += 1
+
+
+_matcher = None
+
+
+def _init_worker(phrase_list):
+    global _matcher
+    _matcher = PhraseMatcher(phrase_list)
+
+
+def mine(task):
+    """Counters for one work unit: calls, calls and mentions per item,
+    calls per disposition and per (item, disposition)."""
+    counts = {
+        "calls": 0, "items": Counter(), "mentions": Counter(), "dispositions": Counter(), "outcomes": Counter(),
+        "skipped": Counter(),
+    }
+    for call in read_calls(*task, skipped=counts["skipped"]):
+        node, pending, found = 0, "", []
+        for utterance in _utterances(call.get("text", "")):
+            node, pending, matches = _matcher.feed(node, pending, utterance + "\n")
+            found.extend(matches)
+        found.extend(_matcher.flush(node, pending)[1])
+        items = set(found)
+        counts["calls"] += 1
+        counts["items"].update(items)
+        counts["mentions"].update(found)
+        disposition = call.get("disposition")
+        if disposition:
+            counts["dispositions"][disposition] += 1
+            counts["outcomes"].update((item, disposition) for item in items)
+    return counts
+
+
+def mine_archive(paths, catalog, workers=None, split_bytes=SPLIT_BYTES):
+    phrase_list = list(phrases(catalog))
+    total = {
+        "calls": 0, "items": Counter(), "mentions": Counter(), "dispositions": Counter(), "outcomes": Counter(),
+        "skipped": Counter(),
+    }
+    work = list(tasks(paths, split_bytes))
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(workers, initializer=_init_worker, initargs=(phrase_list,)) as pool:
+        for counts in pool.imap_unordered(mine, work):
+            total["calls"] += counts["calls"]
+            for name in ("items", "mentions", "dispositions", "outcomes", "skipped"):
+                total[name].update(counts[name])
+    return total
+
+
+def write_reports(total, catalog, out_dir):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    calls = total["calls"] or 1
+
+    def share(n):
+        return f"{n / calls:.4f}"
+
+    with open(out_dir / "objections.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["objection_id", "category", "surface", "calls", "mentions", "share_of_calls"])
+        for o in sorted(catalog.objections, key=lambda o: -total["items"][("objection", o["id"])]):
+            key = ("objection", o["id"])
+            writer.writerow([o["id"], o["category"], o["surface"], total["items"][key], total["mentions"][key], share(total["items"][key])])
+
+    with open(out_dir / "triggers.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["service", "trigger", "calls", "mentions", "share_of_calls"])
+        keys = [("trigger", service, t) for service, data in catalog.attach_guides.items() for t in data["triggers"]]
+        for key in sorted(keys, key=lambda k: -total["items"][k]):
+            writer.writerow([key[1], key[2], total["items"][key], total["mentions"][key], share(total["items"][key])])
+
+    # Lift compares the disposition's rate among calls mentioning the item
+    # with its rate among all calls that have a disposition.
+    disposed = sum(total["dispositions"].values())
+    item_disposed = Counter()
+    for (item, _), n in total["outcomes"].items():
+        item_disposed[item] += n
+    with open(out_dir / "outcomes.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["kind", "item", "disposition", "calls", "rate", "baseline_rate", "lift"])
+        for (item, disposition), n in sorted(total["outcomes"].items(), key=lambda kv: (-kv[1], str(kv[0]))):
+            rate = n / item_disposed[item]
+            baseline = total["dispositions"][disposition] / disposed
+            label = item[1] if item[0] == "objection" else f"{item[1]}: {item[2]}"
+            writer.writerow([item[0], label, disposition, n, f"{rate:.4f}", f"{baseline:.4f}", f"{rate / baseline:.2f}"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count objections and attach triggers in call transcripts.")
+    parser.add_argument("paths", nargs="+", type=Path, help="transcript files or directories")
+    parser.add_argument("--out", required=True, type=Path, help="directory for the CSV reports")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    missing = [p for p in args.paths if not p.exists()]
+    if missing:
+        print(f"not found: {', '.join(map(str, missing))}", file=sys.stderr)
+        return 1
+    unsupported = [p for p in args.paths if not p.is_dir() and p.suffix not in SUFFIXES]
+    if unsupported:
+        print(f"not transcript files (expected {', '.join(SUFFIXES)}): {', '.join(map(str, unsupported))}", file=sys.stderr)
+        return 1
+    catalog = load_catalog()
+    start = time.perf_counter()
+    total = mine_archive(args.paths, catalog, args.workers)
+    write_reports(total, catalog, args.out)
+    elapsed = time.perf_counter() - start
+    print(f"{total['calls']:,} calls ({sum(total['dispositions'].values()):,} with a disposition) "
+          f"on {args.workers or os.cpu_count()} worker(s) in {elapsed:.1f}s; wrote {args.out}/objections.csv, triggers.csv, outcomes.csv")
+    skipped = total["skipped"]
+    if skipped:
+        worst = ", ".join(f"{path} ({n:,})" for path, n in skipped.most_common(SKIPPED_SHOWN))
+        print(f"skipped {sum(skipped.values()):,} unreadable or malformed call(s) in {len(skipped):,} file(s): {worst}"
+              + (", ..." if len(skipped) > SKIPPED_SHOWN else ""), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,600 @@
+"""Durable outbox for Loss Tracker logs.
+
+Logging a disposition writes a row to a local SQLite database (WAL mode) and
+returns; a background thread delivers pending rows to the sheet's Apps
+Script endpoint over a pooled keep-alive connection: one GET per row, or up
+to CUTTING_EDGE_SHEET_BATCH rows per POST once the script implements doPost
+(see receiver.py). Failed deliveries are retried with exponential backoff
+and jitter, so logs survive an endpoint outage or a server restart.
+
+Every row carries an idempotency key, so a delivery that is retried after the
+endpoint already recorded it (a timeout, a crash before the row was marked)
+can be dropped by the receiver. Several server processes can share one
+outbox: a worker claims a row by leasing it, and a lease that expires (the
+process died mid-delivery) makes the row due again.
+
+    CUTTING_EDGE_OUTBOX=/var/lib/cutting-edge/outbox.sqlite   (default: var/outbox.sqlite)
+    CUTTING_EDGE_SHEET_URL=http://127.0.0.1:8765/exec         (default: the Apps Script URL)
+    CUTTING_EDGE_SHEET_BATCH=1     (rows per request; above 1 POSTs batches, for a script with doPost)
+    CUTTING_EDGE_SHEET_RATE=1      (requests per second from this process)
+    CUTTING_EDGE_SHEET_REPLY=json  (any: count any 2xx reply to a GET as delivered, for a
+                                    script older than apps_script/Code.gs)
+
+    python -m cutting_edge.outbox status
+    python -m cutting_edge.outbox retry     (requeue rows that were given up on)
+    python -m cutting_edge.outbox backfill rows.jsonl   (queue rows behind live ones)
+"""
+import argparse
+import hashlib
+import http.client
+import json
+import logging
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+import streamlit as st
+
+log = logging.getLogger(__name__)
+
+SCRIPT_URL = "https://script.google.com/a/macros/lawnstarter.com/s/AKfycbyEGIP63SoZrL5XAAzfpY7NfaThcMIf_R36_YebHHsRkIeUWGfCmzVRHxI1OVs_WFNv/exec"
+OUTBOX_PATH = Path(__file__).resolve().parent.parent / "var" / "outbox.sqlite"
+
+BACKOFF_BASE = 2.0
+BACKOFF_MAX = 15 * 60
+MAX_ATTEMPTS = 12
+LEASE_SECONDS = 60
+REQUEST_TIMEOUT = 10
+# Rows go one GET at a time unless CUTTING_EDGE_SHEET_BATCH says the
+# endpoint takes batched POSTs (apps_script/Code.gs has doPost).
+BATCH_SIZE = 1
+# What a GET reply must be to count as delivered: "json" is the script's
+# {"status": "ok" | "duplicate"}; "any" is any 2xx, for the script deployed
+# before apps_script/Code.gs, which does not answer in JSON.
+SHEET_REPLY = "json"
+SHEET_REPLIES = ("json", "any")
+BATCH_LINGER = 0.5
+POOL_SIZE = 4
+MAX_REDIRECTS = 3
+REDIRECT_STATUS = frozenset({301, 302, 303, 307, 308})
+# Requests per second to the sheet endpoint, and how many may go at once
+# after a quiet spell. Apps Script quotas are per user, so with several
+# server processes give each a share.
+SHEET_RATE = 1.0
+SHEET_BURST = 5
+# How long to hold off after a 429 that does not say (Retry-After).
+THROTTLE_PAUSE = 30
+THROTTLE_PAUSE_MAX = 5 * 60
+
+# Claim order: live logs first, then retries, then backfilled rows.
+LIVE, RETRY, BACKFILL = 0, 1, 2
+PRIORITY_NAMES = {LIVE: "live", RETRY: "retry", BACKFILL: "backfill"}
+KEEP_DELIVERED = 7 * 24 * 3600
+# Client errors that are worth retrying; any other 4xx will fail again.
+RETRYABLE_STATUS = frozenset({408, 425, 429})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    delivered_at REAL,
+    dead_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (next_attempt_at) WHERE delivered_at IS NULL AND dead_at IS NULL;
+"""
+
+
+def backoff(attempts, base=BACKOFF_BASE, cap=BACKOFF_MAX):
+    """Seconds to wait after the given number of failed attempts ("full
+    jitter": uniform up to the exponential bound, so retries from many rows
+    do not arrive together)."""
+    return random.uniform(0, min(cap, base * 2 ** attempts))
+
+
+class Outbox:
+    def __init__(self, path=OUTBOX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(outbox)")}
+        if "priority" not in columns:
+            self._db.execute("ALTER TABLE outbox ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+
+    def enqueue(self, payload, key=None, priority=LIVE):
+        """Store a row for delivery and return its idempotency key. Enqueuing
+        the same key twice keeps the first row."""
+        key = key or uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO outbox (idempotency_key, payload, created_at, priority, next_attempt_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(payload, separators=(",", ":")), now, priority, now),
+            )
+        return key
+
+    def claim(self, limit=1, lease=LEASE_SECONDS):
+        """Lease up to limit due rows, highest priority first: [(id, key,
+        payload, attempts)]."""
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            rows = self._db.execute(
+                "SELECT id, idempotency_key, payload, attempts FROM outbox"
+                " WHERE delivered_at IS NULL AND dead_at IS NULL AND next_attempt_at <= ?"
+                " ORDER BY priority, next_attempt_at LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            self._db.executemany(
+                "UPDATE outbox SET next_attempt_at = ? WHERE id = ?", [(now + lease, row[0]) for row in rows],
+            )
+        return [(row_id, key, json.loads(payload), attempts) for row_id, key, payload, attempts in rows]
+
+    def delivered(self, row_ids):
+        now = time.time()
+        with self._lock, self._db:
+            self._db.executemany(
+                "UPDATE outbox SET delivered_at = ?, attempts = attempts + 1, last_error = NULL WHERE id = ?",
+                [(now, row_id) for row_id in row_ids],
+            )
+
+    def failed(self, row_id, attempts, error, retry=True):
+        """Record a failed attempt; the row is retried after a backoff, or
+        given up on once retry is false or MAX_ATTEMPTS is reached. Retried
+        rows queue behind live ones."""
+        now = time.time()
+        attempts += 1
+        dead = not retry or attempts >= MAX_ATTEMPTS
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET attempts = ?, last_error = ?, next_attempt_at = ?, dead_at = ?,"
+                " priority = max(priority, ?) WHERE id = ?",
+                (attempts, str(error)[:500], now + backoff(attempts), now if dead else None, RETRY, row_id),
+            )
+        if dead:
+            log.error("giving up on outbox row %s after %d attempt(s): %s", row_id, attempts, error)
+
+    def postpone(self, row_ids, delay, error):
+        """Make claimed rows due again after delay seconds without counting
+        an attempt: the endpoint refused the request over its quota, not the
+        rows."""
+        next_attempt = time.time() + delay
+        with self._lock, self._db:
+            self._db.executemany(
+                "UPDATE outbox SET next_attempt_at = ?, last_error = ? WHERE id = ?",
+                [(next_attempt, str(error)[:500], row_id) for row_id in row_ids],
+            )
+
+    def due(self):
+        """(count, earliest next_attempt_at) of the rows that are due now."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT count(*), min(next_attempt_at) FROM outbox"
+                " WHERE delivered_at IS NULL AND dead_at IS NULL AND next_attempt_at <= ?",
+                (time.time(),),
+            ).fetchone()
+
+    def next_due(self):
+        """When the earliest pending row is due, or None if nothing is pending."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT min(next_attempt_at) FROM outbox WHERE delivered_at IS NULL AND dead_at IS NULL"
+            ).fetchone()[0]
+
+    def revive(self):
+        """Make rows that were given up on due again; returns how many."""
+        with self._lock:
+            return self._db.execute(
+                "UPDATE outbox SET dead_at = NULL, attempts = 0, next_attempt_at = ?, priority = max(priority, ?)"
+                " WHERE dead_at IS NOT NULL",
+                (time.time(), RETRY),
+            ).rowcount
+
+    def prune(self, keep=KEEP_DELIVERED):
+        """Drop delivered rows older than keep seconds."""
+        with self._lock:
+            self._db.execute("DELETE FROM outbox WHERE delivered_at < ?", (time.time() - keep,))
+
+    def stats(self):
+        with self._lock:
+            pending, delivered, dead = self._db.execute(
+                "SELECT count(*) FILTER (WHERE delivered_at IS NULL AND dead_at IS NULL),"
+                " count(delivered_at), count(dead_at) FROM outbox"
+            ).fetchone()
+            queued = self._db.execute(
+                "SELECT priority, count(*) FROM outbox WHERE delivered_at IS NULL AND dead_at IS NULL GROUP BY priority"
+            ).fetchall()
+        by_priority = {name: 0 for name in PRIORITY_NAMES.values()}
+        by_priority.update((PRIORITY_NAMES.get(p, str(p)), n) for p, n in queued)
+        return {"pending": pending, "delivered": delivered, "dead": dead, "pending_by_priority": by_priority}
+
+
+class DeliveryError(Exception):
+    def __init__(self, message, retry=True, throttled=None):
+        super().__init__(message)
+        self.retry = retry
+        # Seconds the endpoint asked us to hold off for (a 429), if any.
+        self.throttled = throttled
+
+
+def _status_error(response):
+    status = response.status
+    throttled = None
+    if status == 429:
+        try:
+            throttled = min(THROTTLE_PAUSE_MAX, float(response.getheader("Retry-After")))
+        except (TypeError, ValueError):
+            throttled = THROTTLE_PAUSE
+    return DeliveryError(f"HTTP {status}", retry=status >= 500 or status in RETRYABLE_STATUS, throttled=throttled)
+
+
+def _json_body(data):
+    """The script's JSON object reply. Anything else, such as the HTML of a
+    sign-in or error page that Apps Script serves with a 200, fails the
+    request so it is retried."""
+    try:
+        body = json.loads(data)
+    except ValueError:
+        body = None
+    if not isinstance(body, dict):
+        raise DeliveryError("unexpected response (not JSON from the script)")
+    return body
+
+
+class TokenBucket:
+    """Rate limit for requests to the sheet endpoint, shared by every session
+    in the process: rate per second on average, up to burst at once.
+
+    acquire() blocks until a token is free. A token taken while the bucket
+    is empty is borrowed against the next refill, so waiting callers queue
+    in order. pause() holds everyone off after the endpoint reports a quota
+    error.
+    """
+
+    def __init__(self, rate=SHEET_RATE, burst=SHEET_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.throttle_seconds = 0.0
+        self.pauses = 0
+
+    def acquire(self):
+        """Take a token, sleeping until one is available; returns the seconds
+        slept."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate) - 1
+            self._updated = now
+            wait = max(-self._tokens / self.rate, self._paused_until - now, 0.0)
+            self.requests += 1
+            if wait:
+                self.throttled += 1
+                self.throttle_seconds += wait
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds):
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0)
+            self.pauses += 1
+
+    def summary(self):
+        with self._lock:
+            return {
+                "rate": self.rate, "burst": self.burst, "requests": self.requests, "throttled": self.throttled,
+                "throttle_seconds": round(self.throttle_seconds, 2), "pauses": self.pauses,
+                "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 2),
+            }
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections per host, reused across deliveries so a
+    run of requests pays for one TCP and TLS handshake instead of one each."""
+
+    def __init__(self, maxsize=POOL_SIZE, timeout=REQUEST_TIMEOUT):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.opened = 0
+        self._idle = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def _connection(self, scheme, host):
+        with self._lock:
+            idle = self._idle[scheme, host]
+            if idle:
+                return idle.pop(), True
+            self.opened += 1
+        connection = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection(host, timeout=self.timeout), False
+
+    def _release(self, scheme, host, conn):
+        with self._lock:
+            idle = self._idle[scheme, host]
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, defaultdict(list)
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def request(self, method, url, body=None, headers=None, redirects=MAX_REDIRECTS):
+        """(response, body) for the request, following redirects: Apps Script
+        answers a POST with a 302 to the URL its output is read from."""
+        parts = urllib.parse.urlsplit(url)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        while True:
+            conn, reused = self._connection(parts.scheme, parts.netloc)
+            try:
+                conn.request(method, target, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                # The server dropped a connection that sat idle in the pool;
+                # rows carry idempotency keys, so sending again is safe.
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(parts.scheme, parts.netloc, conn)
+            break
+        if response.status in REDIRECT_STATUS and redirects:
+            location = urllib.parse.urljoin(url, response.getheader("Location", ""))
+            if response.status in (307, 308):
+                return self.request(method, location, body, headers, redirects - 1)
+            return self.request("GET", location, redirects=redirects - 1)
+        return response, data
+
+
+class SheetClient:
+    """Sends claimed outbox rows to the sheet endpoint.
+
+    With batch_size above 1, rows go out as one JSON POST per batch and the
+    endpoint reports on each row (the contract is described in receiver.py).
+    With batch_size 1, each row is a GET with the fields as query parameters,
+    the way the sheet link did it, for endpoints that only implement doGet.
+    reply (SHEET_REPLIES) says what a GET reply must be to count as delivered.
+    """
+
+    def __init__(self, url, batch_size=BATCH_SIZE, pool=None, reply=SHEET_REPLY):
+        if reply not in SHEET_REPLIES:
+            raise ValueError(f"unknown sheet reply {reply!r}; expected one of {', '.join(SHEET_REPLIES)}")
+        self.url = url
+        self.batch_size = max(1, batch_size)
+        self.reply = reply
+        self.pool = pool or ConnectionPool()
+        self.requests = 0
+
+    def _request(self, method, url, body=None, headers=None):
+        self.requests += 1
+        try:
+            return self.pool.request(method, url, body, headers)
+        except (http.client.HTTPException, OSError) as e:
+            raise DeliveryError(str(e) or type(e).__name__) from None
+
+    def deliver(self, rows):
+        """Send rows [(id, key, payload, attempts)]; returns {id: None if
+        delivered, else the DeliveryError}."""
+        if self.batch_size == 1:
+            return {row_id: self._get(key, payload) for row_id, key, payload, _ in rows}
+        return self._post(rows)
+
+    def _get(self, key, payload):
+        query = urllib.parse.urlencode({**payload, "idempotencyKey": key})
+        try:
+            response, data = self._request("GET", f"{self.url}?{query}", headers={"Idempotency-Key": key})
+            if response.status >= 400:
+                raise _status_error(response)
+            if self.reply == "any" and 200 <= response.status < 300:
+                return None
+            body = _json_body(data)
+        except DeliveryError as e:
+            return e
+        if body.get("status") in ("ok", "duplicate"):
+            return None
+        return DeliveryError(body.get("error") or f"unexpected status {body.get('status')!r}", retry=body.get("retry", True))
+
+    def _post(self, rows):
+        body = json.dumps({"rows": [{"idempotencyKey": key, **payload} for _, key, payload, _ in rows]}).encode()
+        try:
+            response, data = self._request("POST", self.url, body, {"Content-Type": "application/json"})
+            if response.status >= 400:
+                raise _status_error(response)
+            try:
+                results = {r["idempotencyKey"]: r for r in _json_body(data)["results"]}
+            except (KeyError, TypeError):
+                raise DeliveryError("malformed response") from None
+        except DeliveryError as e:
+            return {row[0]: e for row in rows}
+        # A batch can partly succeed: rows the endpoint rejected, or did not
+        # mention, are retried on their own schedule.
+        outcome = {}
+        for row_id, key, _, _ in rows:
+            result = results.get(key)
+            if result is None:
+                outcome[row_id] = DeliveryError("no result for row")
+            elif result.get("status") in ("ok", "duplicate"):
+                outcome[row_id] = None
+            else:
+                outcome[row_id] = DeliveryError(result.get("error") or "rejected", retry=result.get("retry", True))
+        return outcome
+
+
+class Deliverer:
+    """Background thread that drains the outbox into the sheet endpoint.
+
+    Due rows are sent once a full batch is waiting or the oldest of them has
+    waited linger seconds, whichever comes first. Each request waits for a
+    token from the limiter before its rows are claimed, so rows logged while
+    it waits still go ahead of retries and backfills.
+    """
+
+    def __init__(self, outbox, client, limiter=None, linger=BATCH_LINGER, idle=30.0):
+        self.outbox = outbox
+        self.client = client
+        self.limiter = limiter
+        self.linger = linger
+        self.idle = idle
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def wake(self):
+        self._wake.set()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="outbox-delivery", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def deliver_due(self):
+        """Deliver every row that is due now; returns how many were sent."""
+        sent = 0
+        while not self._stop.is_set():
+            if self.limiter is not None:
+                if not self.outbox.due()[0]:
+                    return sent
+                self.limiter.acquire()
+            rows = self.outbox.claim(self.client.batch_size)
+            if not rows:
+                return sent
+            results = self.client.deliver(rows)
+            delivered = []
+            throttled_rows = []
+            throttled = 0
+            for row_id, _, _, attempts in rows:
+                error = results[row_id]
+                if error is None:
+                    delivered.append(row_id)
+                elif error.throttled:
+                    # A quota rejection is not the row's fault: it goes out
+                    # again after the pause and keeps its attempts.
+                    throttled_rows.append(row_id)
+                    throttled = max(throttled, error.throttled)
+                else:
+                    log.warning("outbox row %s not delivered (attempt %d): %s", row_id, attempts + 1, error)
+                    self.outbox.failed(row_id, attempts, error, retry=error.retry)
+            if throttled_rows:
+                log.warning("sheet endpoint is throttling; pausing deliveries for %.0fs", throttled)
+                self.outbox.postpone(throttled_rows, throttled, results[throttled_rows[0]])
+                if self.limiter is not None:
+                    self.limiter.pause(throttled)
+            self.outbox.delivered(delivered)
+            sent += len(delivered)
+        return sent
+
+    def _run(self):
+        next_prune = 0.0
+        while not self._stop.is_set():
+            wait = self.idle
+            try:
+                count, oldest = self.outbox.due()
+                if count and (count >= self.client.batch_size or time.time() >= oldest + self.linger):
+                    self.deliver_due()
+                    continue
+                if time.monotonic() >= next_prune:
+                    self.outbox.prune()
+                    next_prune = time.monotonic() + 3600
+                # Sleep until a partial batch has lingered long enough, or
+                # the next retry is due (idle if nothing is pending); a new
+                # row wakes the thread to check for a full batch.
+                due = oldest + self.linger if count else self.outbox.next_due()
+                if due is not None:
+                    wait = min(self.idle, max(0.0, due - time.time()))
+            except sqlite3.Error as e:
+                log.warning("outbox: %s", e)
+            self._wake.wait(wait)
+            self._wake.clear()
+
+
+@st.cache_resource
+def get_outbox():
+    """The process's outbox and its running delivery thread."""
+    outbox = Outbox(os.environ.get("CUTTING_EDGE_OUTBOX", OUTBOX_PATH))
+    client = SheetClient(
+        os.environ.get("CUTTING_EDGE_SHEET_URL", SCRIPT_URL),
+        int(os.environ.get("CUTTING_EDGE_SHEET_BATCH", BATCH_SIZE)),
+        reply=os.environ.get("CUTTING_EDGE_SHEET_REPLY", SHEET_REPLY),
+    )
+    limiter = TokenBucket(float(os.environ.get("CUTTING_EDGE_SHEET_RATE", SHEET_RATE)), SHEET_BURST)
+    deliverer = Deliverer(outbox, client, limiter)
+    deliverer.start()
+    return outbox, deliverer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect the Loss Tracker outbox.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="count pending, delivered and failed rows")
+    sub.add_parser("retry", help="requeue rows that were given up on")
+    backfill = sub.add_parser("backfill", help="queue rows from a JSON lines file behind live logs")
+    backfill.add_argument("path", type=Path)
+    parser.add_argument("--db", type=Path, default=Path(os.environ.get("CUTTING_EDGE_OUTBOX", OUTBOX_PATH)))
+    args = parser.parse_args(argv)
+
+    outbox = Outbox(args.db)
+    if args.command == "retry":
+        print(f"requeued {outbox.revive()} row(s)")
+    elif args.command == "backfill":
+        count = 0
+        with open(args.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    # Without a key of its own, a row's key is derived from its
+                    # fields, so backfilling the same file twice sends it once.
+                    key = row.pop("idempotencyKey", None) or hashlib.sha1(
+                        json.dumps(row, sort_keys=True).encode()
+                    ).hexdigest()
+                    outbox.enqueue(row, key, priority=BACKFILL)
+                    count += 1
+        print(f"read {count} row(s)")
+    print(json.dumps(outbox.stats()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
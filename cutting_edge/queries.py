@@ -0,0 +1,253 @@
+"""Shared cache of FAQ search results and a log of the searches agents run.
+
+Results are cached per process, across sessions, keyed by the FAQ source
+version, the normalized query and the category, so the phrases every agent
+searches for are ranked once per content version rather than once per agent
+or once per page.
+
+With CUTTING_EDGE_QUERY_LOG set to a file path, every search an agent runs
+is appended to it as a JSON line, and a background thread folds new lines
+into a report (cache hit rate, latency percentiles and the most common
+queries that found nothing) shown in the ?debug=1 panel. The same report is
+available offline:
+
+    python -m cutting_edge.queries report /var/log/cutting-edge/queries.jsonl
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+
+import streamlit as st
+
+log = logging.getLogger(__name__)
+
+QUERY_CACHE_SIZE = 512
+QUERY_CACHE_TTL = 15 * 60
+# Results kept per cached search: the knowledge base builds a snippet for
+# each, and agents rarely page this deep.
+QUERY_RESULT_LIMIT = 500
+REPORT_INTERVAL = 60
+REPORT_LATENCIES = 10000
+TOP_ZERO_RESULTS = 20
+
+
+class QueryCache:
+    """LRU cache whose entries also expire ttl seconds after being stored."""
+
+    def __init__(self, maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """(True, value) for a live entry, else (False, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def summary(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+            }
+
+
+query_cache = QueryCache()
+
+
+class QueryLog:
+    """Append-only JSON lines file of searches, shared by every process.
+
+    Each record is written with a single O_APPEND write, so lines from
+    concurrent processes never interleave.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def append(self, record):
+        os.write(self._fd, json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode() + b"\n")
+
+
+class QueryReport:
+    """Running aggregates over a query log, reading only the lines appended
+    since the last update."""
+
+    def __init__(self, path):
+        self.path = path
+        self._offset = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._reset()
+
+    def _reset(self):
+        self.searches = self.hits = 0
+        self.latencies = deque(maxlen=REPORT_LATENCIES)
+        self.zero_results = Counter()
+
+    def update(self):
+        with self._lock:
+            try:
+                with open(self.path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size < self._offset:
+                        # Truncated or rotated: start over.
+                        self._offset = 0
+                        self._reset()
+                    f.seek(self._offset)
+                    data = f.read()
+            except FileNotFoundError:
+                return
+            # A line still being written is picked up on the next update.
+            complete = data[:data.rfind(b"\n") + 1]
+            self._offset += len(complete)
+            for line in complete.splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self.searches += 1
+                self.hits += bool(record.get("hit"))
+                self.latencies.append(record.get("ms", 0.0))
+                if not record.get("total"):
+                    self.zero_results[record.get("query", "")] += 1
+
+    def summary(self):
+        with self._lock:
+            latencies = sorted(self.latencies)
+            return {
+                "searches": self.searches,
+                "hit_rate": self.hits / self.searches if self.searches else None,
+                "p50_ms": latencies[len(latencies) // 2] if latencies else None,
+                "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else None,
+                "zero_results": self.zero_results.most_common(TOP_ZERO_RESULTS),
+            }
+
+    def start(self, interval=REPORT_INTERVAL):
+        if self._thread is not None:
+            return
+        self.update()
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.update()
+                except OSError as e:
+                    log.warning("could not read query log: %s", e)
+
+        self._thread = threading.Thread(target=run, name="query-report", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+@st.cache_resource
+def get_query_log():
+    path = os.environ.get("CUTTING_EDGE_QUERY_LOG")
+    return QueryLog(path) if path else None
+
+
+@st.cache_resource
+def get_query_report():
+    path = os.environ.get("CUTTING_EDGE_QUERY_LOG")
+    if not path:
+        return None
+    report = QueryReport(path)
+    report.start()
+    return report
+
+
+def search(faqs, query, category=None, record=False):
+    """(total, ranked results) for faqs.search(), through the shared result
+    cache.
+
+    A query is ranked once per source, version and category, and the
+    results (the first QUERY_RESULT_LIMIT of them) are cached whole, so the
+    count and every page an agent turns to come from one entry; see page().
+    With record set, the search is also appended to the query log; the FAQ
+    page sets it once per query an agent runs, not on every rerun that
+    shows its results.
+    """
+    started = time.perf_counter()
+    normalized = faqs.normalize(query)
+    key = (type(faqs).__name__, faqs.version, normalized, category)
+    hit, result = query_cache.get(key)
+    if not hit:
+        result = faqs.search(query, category, 0, QUERY_RESULT_LIMIT)
+        query_cache.put(key, result)
+    query_log = get_query_log() if record else None
+    if query_log is not None:
+        try:
+            query_log.append({
+                "ts": round(time.time(), 3),
+                "query": normalized,
+                "category": category,
+                "version": faqs.version,
+                "total": result[0],
+                "hit": hit,
+                "ms": round((time.perf_counter() - started) * 1000, 3),
+            })
+        except OSError as e:  # a full disk must not break the search
+            log.warning("could not write query log: %s", e)
+    return result
+
+
+def page(faqs, query, category, result, start, end):
+    """results[start:end] of a search() result; a page past the cached
+    results is asked of the source directly."""
+    total, ranked = result
+    if (total if end is None else min(end, total)) <= len(ranked):
+        return ranked[start:end]
+    return faqs.search(query, category, start, end)[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize a FAQ query log.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    reporter = sub.add_parser("report", help="print hit rate, latency and zero-result queries")
+    reporter.add_argument("log")
+    args = parser.parse_args(argv)
+
+    report = QueryReport(args.log)
+    report.update()
+    print(json.dumps(report.summary(), indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
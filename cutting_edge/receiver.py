@@ -0,0 +1,227 @@
+"""Local stand-in for the sheet's Apps Script endpoint.
+
+Accepts Loss Tracker rows the way the outbox delivers them and records each
+idempotency key once. The contract the sheet's script implements
+(apps_script/Code.gs):
+
+  POST /exec  {"rows": [{"idempotencyKey": ..., "agentName": ..., "agentId": ...,
+                         "disposition": ..., "timestamp": ...}, ...]}
+    200 {"results": [{"idempotencyKey": ..., "status": "ok" | "duplicate" | "error",
+                      "error": ..., "retry": true | false}, ...]}
+    One result per row, in any order. "duplicate" means the key was recorded
+    before and counts as delivered; an "error" row is retried unless "retry"
+    is false, and so is a row with no result. Any other status fails the
+    whole batch (5xx, 408, 425 and 429 are retried; after a 429 the client
+    sends nothing for Retry-After seconds).
+
+  GET /exec?agentName=...&idempotencyKey=...
+    200 {"status": "ok" | "duplicate"}: one row, the default. Any other reply,
+    including an HTML page served with a 200, is retried.
+
+It can be told to fail or slow down some requests, reject some rows of a
+batch, or enforce a request quota (429 with Retry-After), to exercise
+retries and throttling, and to answer POSTs with a redirect the way Apps
+Script does:
+
+    python -m cutting_edge.receiver --port 8765 --fail-rate 0.3 --row-fail-rate 0.1 --latency-ms 200
+    CUTTING_EDGE_SHEET_URL=http://127.0.0.1:8765/exec streamlit run app.py
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class Sheet:
+    """Rows received so far, deduplicated by idempotency key."""
+
+    def __init__(self, fail_rate=0.0, row_fail_rate=0.0, latency_ms=0.0, redirect=False, quota=None, log_path=None):
+        self.fail_rate = fail_rate
+        self.quota = quota
+        self.row_fail_rate = row_fail_rate
+        self.latency_ms = latency_ms
+        self.redirect = redirect
+        self.rows = {}
+        self.requests = 0
+        self.duplicates = 0
+        self.failures = 0
+        self.row_failures = 0
+        self.over_quota = 0
+        self.responses = {}
+        self._recent = deque()
+        self._lock = threading.Lock()
+        self._log = open(log_path, "a", encoding="utf-8") if log_path else None
+
+    def receive(self, key, row):
+        """True if the row is new, False if the key was seen before."""
+        with self._lock:
+            if key in self.rows:
+                self.duplicates += 1
+                return False
+            self.rows[key] = row
+            if self._log is not None:
+                self._log.write(json.dumps({"key": key, **row}) + "\n")
+                self._log.flush()
+            return True
+
+    def admit(self):
+        """False if this request would exceed quota requests in the last
+        second (the way Apps Script rejects executions over its quota)."""
+        if self.quota is None:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and self._recent[0] <= now - 1:
+                self._recent.popleft()
+            if len(self._recent) >= self.quota:
+                self.over_quota += 1
+                return False
+            self._recent.append(now)
+            return True
+
+    def receive_batch(self, rows):
+        """Per-row results for a POSTed batch."""
+        results = []
+        for row in rows:
+            row = dict(row)
+            key = row.pop("idempotencyKey", None)
+            if not key:
+                results.append({"idempotencyKey": key, "status": "error", "error": "missing idempotencyKey", "retry": False})
+            elif random.random() < self.row_fail_rate:
+                with self._lock:
+                    self.row_failures += 1
+                results.append({"idempotencyKey": key, "status": "error", "error": "row not written"})
+            else:
+                results.append({"idempotencyKey": key, "status": "ok" if self.receive(key, row) else "duplicate"})
+        return results
+
+    def summary(self):
+        with self._lock:
+            return {
+                "requests": self.requests, "rows": len(self.rows), "duplicates": self.duplicates,
+                "failures": self.failures, "row_failures": self.row_failures, "over_quota": self.over_quota,
+            }
+
+
+def handler(sheet):
+    class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps connections open between requests, like Google's front end.
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without this, Nagle
+        # and delayed ACKs stall every response on a reused connection.
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            url = urllib.parse.urlsplit(self.path)
+            if url.path == "/stats":
+                return self._reply(200, sheet.summary())
+            if url.path.startswith("/result/"):
+                with sheet._lock:
+                    body = sheet.responses.pop(url.path[len("/result/"):], None)
+                return self._reply(200, body) if body is not None else self._reply(404, {"status": "error", "error": "not found"})
+            if url.path != "/exec":
+                return self._reply(404, {"status": "error", "error": "not found"})
+            if not self._accept():
+                return
+            row = dict(urllib.parse.parse_qsl(url.query))
+            key = row.pop("idempotencyKey", None) or self.headers.get("Idempotency-Key")
+            if not key:
+                return self._reply(400, {"status": "error", "error": "missing idempotencyKey"})
+            new = sheet.receive(key, row)
+            self._reply(200, {"status": "ok" if new else "duplicate"})
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if urllib.parse.urlsplit(self.path).path != "/exec":
+                return self._reply(404, {"status": "error", "error": "not found"})
+            if not self._accept():
+                return
+            try:
+                rows = json.loads(body)["rows"]
+            except (ValueError, KeyError, TypeError):
+                return self._reply(400, {"status": "error", "error": "expected {\"rows\": [...]}"})
+            result = {"results": sheet.receive_batch(rows)}
+            if not sheet.redirect:
+                return self._reply(200, result)
+            # Apps Script answers with a redirect to the script's output.
+            token = uuid.uuid4().hex
+            with sheet._lock:
+                sheet.responses[token] = result
+            self._reply(302, {}, {"Location": f"/result/{token}"})
+
+        def _accept(self):
+            """Count the request and apply the configured latency and
+            failures; False once a failure has been answered."""
+            with sheet._lock:
+                sheet.requests += 1
+            if not sheet.admit():
+                self._reply(429, {"status": "error", "error": "quota exceeded"}, {"Retry-After": "1"})
+                return False
+            if sheet.latency_ms:
+                time.sleep(sheet.latency_ms / 1000)
+            if random.random() < sheet.fail_rate:
+                with sheet._lock:
+                    sheet.failures += 1
+                self._reply(503, {"status": "unavailable"})
+                return False
+            return True
+
+        def _reply(self, status, body, headers=None):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(port=8765, host="127.0.0.1", **options):
+    """Start the stand-in in a background thread: (server, sheet)."""
+    sheet = Sheet(**options)
+    server = ThreadingHTTPServer((host, port), handler(sheet))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="sheet-receiver", daemon=True).start()
+    return server, sheet
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the sheet endpoint.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--row-fail-rate", type=float, default=0.0, help="fraction of POSTed rows answered with an error")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay before answering each request")
+    parser.add_argument("--quota", type=int, help="answer 429 beyond this many requests per second")
+    parser.add_argument("--redirect", action="store_true", help="answer POSTs with a 302 to the result, like Apps Script")
+    parser.add_argument("--log", help="append received rows to this JSON lines file")
+    args = parser.parse_args(argv)
+
+    server, sheet = serve(
+        args.port, args.host, fail_rate=args.fail_rate, row_fail_rate=args.row_fail_rate,
+        latency_ms=args.latency_ms, redirect=args.redirect, quota=args.quota, log_path=args.log,
+    )
+    print(f"listening on http://{args.host}:{server.server_port}/exec (stats at /stats)")
+    try:
+        while True:
+            time.sleep(10)
+            print(json.dumps(sheet.summary()), flush=True)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Related-content table linking objections, FAQs, guide scenarios and QA
+questions.
+
+Every item is turned into a TF-IDF vector over the search tokenizer's
+stemmed terms, and its top-k nearest neighbours by cosine similarity are
+stored with the catalog, so pages look related items up by key instead of
+searching while they render.
+
+Items are keyed "<kind>:<id>": objection:<id>, faq:<faq id>,
+guide:<scenario name> and qa:<position in qa_questions>.
+"""
+import numpy as np
+
+from cutting_edge.search import tokenize
+
+RELATED_SECTIONS = ("objections", "faq_data", "guide_scenarios", "qa_questions")
+TOP_K = 4
+# Below this the shared terms are mostly generic ("service", "lawn").
+MIN_SIMILARITY = 0.1
+
+
+def documents(sections):
+    """(key, text) for every item in the sections."""
+    from cutting_edge.catalog import faq_id  # catalog imports this module
+
+    for o in sections["objections"]:
+        yield f"objection:{o['id']}", " ".join((o["category"], o["surface"], o["reason"], o["rebuttal"]))
+    for category, faqs in sections["faq_data"].items():
+        for i, faq in enumerate(faqs):
+            yield f"faq:{faq_id(category, i)}", " ".join((faq["question"], faq["answer"], faq["phrasing"]))
+    for name, data in sections["guide_scenarios"].items():
+        parts = [name]
+        for field in ("openings", "points", "closes"):
+            parts.extend(data[field].values())
+        yield f"guide:{name}", " ".join(parts)
+    for i, q in enumerate(sections["qa_questions"]):
+        yield f"qa:{i}", " ".join((q["scenario"], q["options"][q["correct"]], q["explanation"]))
+
+
+def tfidf(texts):
+    """L2-normalised TF-IDF rows in CSR form: (indptr, terms, weights)."""
+    vocabulary = {}
+    indptr, terms, counts = [0], [], []
+    for text in texts:
+        row = {}
+        for token in tokenize(text):
+            term = vocabulary.setdefault(token, len(vocabulary))
+            row[term] = row.get(term, 0) + 1
+        terms.extend(row)
+        counts.extend(row.values())
+        indptr.append(len(terms))
+    indptr = np.array(indptr, dtype=np.int64)
+    terms = np.array(terms, dtype=np.int64)
+    counts = np.array(counts, dtype=np.float64)
+
+    n = len(indptr) - 1
+    df = np.bincount(terms, minlength=len(vocabulary))
+    idf = np.log((1 + n) / (1 + df)) + 1
+    weights = (1 + np.log(counts)) * idf[terms]
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    norms = np.sqrt(np.bincount(rows, weights * weights, minlength=n))
+    weights /= np.where(norms > 0, norms, 1)[rows]
+    return indptr, terms, weights
+
+
+def related_table(sections, k=TOP_K, min_similarity=MIN_SIMILARITY):
+    """{key: (related key, ...)} with at most k entries per item, most
+    similar first."""
+    items = list(documents(sections))
+    if not items:
+        return {}
+    keys, texts = zip(*items)
+    n = len(keys)
+    indptr, terms, weights = tfidf(texts)
+
+    # Transpose to term -> items so each row's similarities are one sparse
+    # product: only items sharing a term with it are touched.
+    order = np.argsort(terms, kind="stable")
+    item_of = np.repeat(np.arange(n), np.diff(indptr))[order]
+    weight_of = weights[order]
+    term_ptr = np.searchsorted(terms[order], np.arange(terms.max() + 2))
+
+    table = {}
+    for i in range(n):
+        row_terms = terms[indptr[i]:indptr[i + 1]]
+        row_weights = weights[indptr[i]:indptr[i + 1]]
+        starts, ends = term_ptr[row_terms], term_ptr[row_terms + 1]
+        lengths = ends - starts
+        postings = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        scores = np.bincount(
+            item_of[postings], weight_of[postings] * np.repeat(row_weights, lengths), minlength=n,
+        )
+        scores[i] = 0
+        top = np.argpartition(-scores, k)[:k] if n > k + 1 else np.arange(n)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        table[keys[i]] = tuple(keys[j] for j in top if scores[j] >= min_similarity)
+    return table
@@ -0,0 +1,166 @@
+import threading
+from collections import OrderedDict
+
+from cutting_edge import components
+
+
+class RenderCache:
+    """Bounded LRU of rendered HTML shared by every session in the process.
+
+    Entries are keyed by the render parameters and belong to one catalog
+    version; the first lookup against a new version drops them all.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version, key, render):
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        html = render()
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = html
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return html
+
+    def __len__(self):
+        return len(self._entries)
+
+
+cache = RenderCache()
+
+
+def objection_card(catalog, objection_id, position, total):
+    def render():
+        o = catalog.objections_by_id[objection_id]
+        return (
+            f'<div class="card"><span class="category-badge">{o["category"]}</span>'
+            f'<span class="card-position">{position + 1} of {total}</span>'
+            f'<div class="surface-text">"{o["surface"]}"</div>'
+            f'<p class="reason-label">🎯 THE REAL REASON</p><p class="reason-text">{o["reason"]}</p></div>'
+        )
+    return cache.get(catalog.version, ("objection_card", objection_id, position, total), render)
+
+
+def objection_answer(catalog, objection_id):
+    def render():
+        o = catalog.objections_by_id[objection_id]
+        return f'<div class="card answer"><p class="approach-label">✅ BEST APPROACH</p><p class="approach-text">{o["rebuttal"]}</p></div>'
+    return cache.get(catalog.version, ("objection_answer", objection_id), render)
+
+
+def call_objection(catalog, objection_id):
+    def render():
+        o = catalog.objections_by_id[objection_id]
+        return (
+            f'<div class="card"><span class="category-badge">{o["category"]}</span>'
+            f'<div class="surface-text">"{o["surface"]}"</div>'
+            f'<p class="reason-label">🎯 THE REAL REASON</p><p class="reason-text">{o["reason"]}</p>'
+            f'<p class="approach-label">✅ BEST APPROACH</p><p class="approach-text">{o["rebuttal"]}</p></div>'
+        )
+    return cache.get(catalog.version, ("call_objection", objection_id), render)
+
+
+def call_attach(catalog, service):
+    def render():
+        return components.tip_card_markup(f"🎯 Attach: {service}", catalog.attach_guides[service]["pro_tip"]) + attach_triggers(catalog, service)
+    return cache.get(catalog.version, ("call_attach", service), render)
+
+
+def call_faqs(catalog, category):
+    def render():
+        items = "".join(f"<li>{faq['question']}</li>" for faq in catalog.faqs_by_category[category])
+        return f'<div class="related"><p>❓ {category}</p><ul>{items}</ul></div>'
+    return cache.get(catalog.version, ("call_faqs", category), render)
+
+
+def faq_body(catalog, faqs, faq_id, show_category=False):
+    # faqs is the FAQ source (search.CatalogFaqs or kb.KnowledgeBase); its
+    # version is part of the key because it can change without the catalog.
+    def render():
+        faq = faqs.get(faq_id)
+        category = f'<div class="faq-category"><p>Category: {faq["category"]}</p></div>\n\n' if show_category else ""
+        return (
+            f"{category}**📋 The Facts:**\n\n{faq['answer']}\n\n"
+            f"**💬 How to say it (in your own words):**\n\n"
+            f'<div class="phrasing"><em>"{faq["phrasing"]}"</em></div>'
+        )
+    return cache.get(catalog.version, ("faq_body", faqs.version, faq_id, show_category), render)
+
+
+RELATED_LABELS = {"objection": "Objection", "faq": "FAQ", "guide": "Guide", "qa": "QA"}
+
+
+def _related_title(catalog, key):
+    kind, _, ident = key.partition(":")
+    if kind == "objection":
+        return catalog.objections_by_id[int(ident)]["surface"]
+    if kind == "faq":
+        return catalog.faqs_by_id[ident]["question"]
+    if kind == "qa":
+        return catalog.qa_questions[int(ident)]["scenario"]
+    return ident
+
+
+def related(catalog, key):
+    """Links to the items most similar to key ("<kind>:<id>"), or "" if none."""
+    def render():
+        keys = catalog.related.get(key, ())
+        if not keys:
+            return ""
+        items = "".join(
+            f'<li><span class="related-kind">{RELATED_LABELS[k.partition(":")[0]]}</span>{_related_title(catalog, k)}</li>'
+            for k in keys
+        )
+        return f'<div class="related"><p>🔗 Related</p><ul>{items}</ul></div>'
+    return cache.get(catalog.version, ("related", key), render)
+
+
+def _builder_data(catalog, kind, name):
+    return catalog.guide_scenarios[name] if kind == "guide" else catalog.attach_guides[name]
+
+
+def pitch(catalog, kind, name, opening_style, points, close_style):
+    """The Guide/Attach Builder output; kind is "guide" or "attach"."""
+    points = frozenset(points)
+
+    def render():
+        data = _builder_data(catalog, kind, name)
+        items = "".join(f"<li>{text}</li>" for point, text in data["points"].items() if point in points)
+        return (
+            '<div class="guide-output">'
+            f'<div class="guide-section"><p class="guide-label">🎯 Your Opening</p><p class="guide-text">"{data["openings"][opening_style]}"</p></div>'
+            f'<div class="guide-section"><p class="guide-label">💡 Key Points to Hit</p><ul class="guide-points">{items}</ul></div>'
+            f'<div class="guide-section"><p class="guide-label">🎬 Your Close</p><p class="guide-text">"{data["closes"][close_style]}"</p></div>'
+            '</div>'
+        )
+    return cache.get(catalog.version, ("pitch", kind, name, opening_style, points, close_style), render)
+
+
+def attach_triggers(catalog, service):
+    def render():
+        triggers_display = " • ".join([f'"{t}"' for t in catalog.attach_guides[service]["triggers"]])
+        return f'<div class="listen-for"><p><strong>🎧 Listen for:</strong> {triggers_display}</p></div>'
+    return cache.get(catalog.version, ("attach_triggers", service), render)
+
+
+def attach_pro_tip(catalog, service):
+    def render():
+        return components.tip_card_markup(f"💡 Pro Tip for {service}", catalog.attach_guides[service]["pro_tip"])
+    return cache.get(catalog.version, ("attach_pro_tip", service), render)
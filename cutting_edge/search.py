@@ -0,0 +1,365 @@
+import heapq
+import json
+import math
+import os
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+# Question matches count most: they are what agents remember the entry by.
+FIELD_WEIGHTS = {"question": 3.0, "answer": 1.0, "phrasing": 0.5}
+K1 = 1.2
+B = 0.75
+
+# Browser-side search index, served through Streamlit static file serving.
+CLIENT_INDEX_DIR = Path(__file__).resolve().parent.parent / "static" / "search"
+CLIENT_INDEX_URL = "app/static/search/faq-{version}.json"
+CLIENT_INDEX_KEEP = 3
+SNIPPET_LENGTH = 160
+
+# Misspelled query terms are matched against the question and answer
+# vocabulary. Shorter terms are too ambiguous to correct.
+FUZZY_FIELDS = ("question", "answer")
+FUZZY_MIN_LENGTH = 4
+
+STOPWORDS = frozenset(
+    "a am an and are as at be been but by can do does for from has have how i if in is it its me my "
+    "of on or our so that the their them they this to was we what when where which who why "
+    "were will with you your".split()
+)
+
+TOKEN = re.compile(r"[a-z0-9]+")
+VOWEL = re.compile(r"[aeiouy]")
+
+
+@lru_cache(maxsize=1 << 16)
+def stem(word):
+    """Light suffix stripping so plural, -ed and -ing forms share a term.
+
+    Not a full Porter stemmer: it only has to map the forms agents type
+    ("charges", "charged", "charging") onto the same key for index and query.
+    Mirrored in frontend/search_box/index.html for client-side search.
+    """
+    if len(word) <= 3 or word.isdigit():
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("es") and not word.endswith(("aes", "ees", "oes")):
+        word = word[:-1]
+    elif word.endswith("s") and not word.endswith(("us", "ss")):
+        word = word[:-1]
+    for suffix in ("ing", "ed"):
+        base = word[:-len(suffix)]
+        if word.endswith(suffix) and len(base) >= 3 and VOWEL.search(base):
+            word = base
+            if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "lsz":
+                word = word[:-1]
+            break
+    if word.endswith("e") and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def words(text):
+    return [t for t in TOKEN.findall(text.lower().replace("'", "")) if t not in STOPWORDS]
+
+
+def tokenize(text):
+    return [stem(t) for t in words(text)]
+
+
+def normalize(text):
+    return " ".join(TOKEN.findall(text.lower().replace("'", "")))
+
+
+def trigrams(term):
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_edits(term):
+    return 1 if len(term) <= 5 else 2
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance, or limit + 1 once it must exceed limit.
+
+    Counts an adjacent transposition ("paymnet") as one edit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        row = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            row[j] = min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], prev2[j - 2] + 1)
+        if min(row) > limit:
+            return limit + 1
+        prev2, prev = prev, row
+    return prev[-1]
+
+
+class FaqIndex:
+    """BM25F index over the FAQ entries of one catalog version.
+
+    Field term frequencies are length-normalised per field, weighted and
+    summed before saturation, and the per-term score of every posting is
+    computed at build time, so a query only adds up posting scores.
+    """
+
+    def __init__(self, faqs, version=None):
+        self.version = version
+        self.faqs = faqs
+        n = len(faqs)
+        tokens = {field: [tokenize(faq[field]) for faq in faqs] for field in FIELD_WEIGHTS}
+        weighted_tf = defaultdict(dict)
+        for field, weight in FIELD_WEIGHTS.items():
+            avg_len = sum(map(len, tokens[field])) / n if n else 0
+            for doc, field_tokens in enumerate(tokens[field]):
+                norm = 1 - B + B * len(field_tokens) / avg_len if avg_len else 1
+                for term, tf in Counter(field_tokens).items():
+                    postings = weighted_tf[term]
+                    postings[doc] = postings.get(doc, 0) + weight * tf / norm
+        self.postings = {}
+        for term, postings in weighted_tf.items():
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            self.postings[term] = {doc: idf * tf * (K1 + 1) / (K1 + tf) for doc, tf in postings.items()}
+
+        self.vocabulary = sorted({t for field in FUZZY_FIELDS for doc_tokens in tokens[field] for t in doc_tokens})
+        self.trigrams = defaultdict(list)
+        for term_id, term in enumerate(self.vocabulary):
+            for gram in trigrams(term):
+                self.trigrams[gram].append(term_id)
+        self._corrections = {}
+
+        # Sorted prefix array for suggestions: one key per question suffix
+        # starting at the first word or any non-stopword, so "long gr" finds
+        # "What is the long grass fee?". Rank favours matches at the start of
+        # the question, then shorter questions.
+        entries = []
+        for doc, faq in enumerate(faqs):
+            question_words = normalize(faq["question"]).split()
+            for i, word in enumerate(question_words):
+                if i == 0 or word not in STOPWORDS:
+                    entries.append((" ".join(question_words[i:]), (i > 0) * 1000 + min(len(faq["question"]), 999), doc))
+        entries.sort()
+        self.prefix_keys = [key for key, _, _ in entries]
+        self.prefix_ranks = [rank for _, rank, _ in entries]
+        self.prefix_docs = [doc for _, _, doc in entries]
+        self._short_prefixes = {}
+
+    def correct(self, term):
+        """The indexed term closest to a term that is not in the index, or None.
+
+        Candidates must share enough trigrams to be within max_edits(term)
+        (one edit touches at most three trigrams, a transposition four) and
+        are then checked with a bounded edit distance. Ties go to the term
+        sharing more trigrams, then to the one found in more entries.
+        """
+        if term in self._corrections:
+            return self._corrections[term]
+        best = None
+        if len(term) >= FUZZY_MIN_LENGTH and not term.isdigit():
+            limit = max_edits(term)
+            grams = trigrams(term)
+            shared = Counter(term_id for gram in grams for term_id in self.trigrams.get(gram, ()))
+            needed = len(grams) - 4 * limit
+            best_key = None
+            for term_id, count in shared.items():
+                if count < needed:
+                    continue
+                candidate = self.vocabulary[term_id]
+                distance = edit_distance(term, candidate, limit)
+                if distance <= limit:
+                    key = (distance, -count, -len(self.postings[candidate]), candidate)
+                    if best_key is None or key < best_key:
+                        best, best_key = candidate, key
+        if len(self._corrections) > 10_000:
+            self._corrections.clear()
+        self._corrections[term] = best
+        return best
+
+    def _term(self, word):
+        # Stemming can cut a typo further from the indexed stem ("gras" ->
+        # "gra"), so the word as typed is tried too.
+        term = stem(word)
+        if term in self.postings:
+            return term
+        return self.correct(term) or self.correct(word) or term
+
+    def search(self, query, limit=None):
+        """FAQ records matching the query, best first.
+
+        Entries containing every query term are returned when there are any;
+        otherwise entries containing at least one of them. Terms missing from
+        the index are replaced by their closest spelling, if any.
+        """
+        terms = dict.fromkeys(self._term(word) for word in words(query))
+        postings = sorted((self.postings.get(t, {}) for t in terms), key=len)
+        if not postings or not postings[-1]:
+            return []
+        first, rest = postings[0], postings[1:]
+        scores = {doc: score + sum(p[doc] for p in rest) for doc, score in first.items() if all(doc in p for p in rest)}
+        if not scores:
+            for p in postings:
+                for doc, score in p.items():
+                    scores[doc] = scores.get(doc, 0) + score
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self.faqs[doc] for doc, _ in ranked[:limit]]
+
+    def suggest(self, text, limit=8):
+        """Up to `limit` FAQ records whose question contains a word starting
+        with `text`, best first; falls back to ranked search when no question
+        matches (e.g. a typo)."""
+        prefix = normalize(text)
+        if text[-1:].isspace():
+            prefix += " "
+        if not prefix.strip():
+            return []
+        # One- and two-letter prefixes span most of the array; memoize them.
+        short = len(prefix) <= 2
+        if short and prefix in self._short_prefixes:
+            return self._short_prefixes[prefix][:limit]
+        lo = bisect_left(self.prefix_keys, prefix)
+        hi = bisect_left(self.prefix_keys, prefix + "\uffff", lo)
+        best = {}
+        for i in range(lo, hi):
+            doc, rank = self.prefix_docs[i], self.prefix_ranks[i]
+            if rank < best.get(doc, 10_000):
+                best[doc] = rank
+        docs = heapq.nsmallest(max(limit, 8), best, key=lambda doc: (best[doc], doc))
+        results = [self.faqs[doc] for doc in docs] if docs else self.search(text, max(limit, 8))
+        if short:
+            self._short_prefixes[prefix] = results
+        return results[:limit]
+
+
+def snippet(text, length=SNIPPET_LENGTH):
+    text = re.sub(r"[*_`#>]+", "", " ".join(text.split()))
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(" ", 1)[0] + "…"
+
+
+def client_index(index):
+    """Compact JSON-ready export of an index for the browser.
+
+    Postings are flattened to [doc gap, score, ...] with scores scaled to
+    integers (1/100), so the client only sums precomputed scores. Documents
+    carry what a result row shows: id, category, question and an answer
+    snippet.
+    """
+    categories = list(dict.fromkeys(faq["category"] for faq in index.faqs))
+    category_ids = {c: i for i, c in enumerate(categories)}
+    terms = {}
+    for term in sorted(index.postings):
+        flat, last = [], 0
+        for doc, score in sorted(index.postings[term].items()):
+            flat += [doc - last, max(1, round(score * 100))]
+            last = doc
+        terms[term] = flat
+    return {
+        "version": index.version,
+        "stopwords": sorted(STOPWORDS),
+        "categories": categories,
+        "docs": [[faq["id"], category_ids[faq["category"]], faq["question"], snippet(faq["answer"])] for faq in index.faqs],
+        "terms": terms,
+    }
+
+
+def write_client_index(index, directory=CLIENT_INDEX_DIR):
+    """Write faq-<version>.json and drop all but the newest CLIENT_INDEX_KEEP."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"faq-{index.version}.json"
+    if not path.exists():
+        # Every worker may publish the same version at once.
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(client_index(index), separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    old = sorted(directory.glob("faq-*.json"), key=lambda p: p.stat().st_mtime, reverse=True)[CLIENT_INDEX_KEEP:]
+    for stale in old:
+        stale.unlink(missing_ok=True)
+    return path
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def faq_index(catalog):
+    """The index for this catalog version, built on first use."""
+    global _index
+    index = _index
+    if index is None or index.version != catalog.version:
+        with _index_lock:
+            if _index is None or _index.version != catalog.version:
+                _index = FaqIndex(catalog.faqs, catalog.version)
+            index = _index
+    return index
+
+
+def search_faqs(catalog, query, limit=None):
+    return faq_index(catalog).search(query, limit)
+
+
+def suggest_faqs(catalog, text, limit=8):
+    return faq_index(catalog).suggest(text, limit)
+
+
+class CatalogFaqs:
+    """The catalog's FAQ entries behind the interface of kb.KnowledgeBase,
+    so the FAQ page works the same against either."""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.version = catalog.version
+
+    def categories(self):
+        return list(self.catalog.faq_categories)
+
+    def count(self, category=None):
+        return len(self.catalog.faqs if category is None else self.catalog.faqs_by_category[category])
+
+    def page(self, category, start, end):
+        return (self.catalog.faqs if category is None else self.catalog.faqs_by_category[category])[start:end]
+
+    def get(self, faq_id):
+        return self.catalog.faqs_by_id.get(faq_id)
+
+    def normalize(self, query):
+        # Queries with the same normalized form get the same results.
+        return normalize(query)
+
+    def search(self, query, category=None, start=0, end=None):
+        results = search_faqs(self.catalog, query)
+        if category is not None:
+            results = [faq for faq in results if faq["category"] == category]
+        return len(results), results[start:end]
+
+    def suggest(self, text, limit=8):
+        return suggest_faqs(self.catalog, text, limit)
+
+    def client_index_url(self):
+        return client_index_url(self.catalog)
+
+
+_published = set()
+
+
+def client_index_url(catalog):
+    """URL of the browser index for this catalog version, or None if it
+    cannot be written (the search box then asks the server per keystroke)."""
+    if catalog.version not in _published:
+        try:
+            write_client_index(faq_index(catalog))
+        except OSError:
+            return None
+        _published.add(catalog.version)
+    return CLIENT_INDEX_URL.format(version=catalog.version)
@@ -0,0 +1,237 @@
+"""Session state kept outside the server process.
+
+With CUTTING_EDGE_SESSION_STORE set, the progress and selections an agent
+builds up (flashcards, QA game, builder and FAQ widgets) are written to a
+shared store after every rerun, keyed by a session id carried in the URL
+(?sid=...). A new session on any replica that presents the same id picks
+up where the old one left off, so replicas need no sticky sessions.
+
+    CUTTING_EDGE_SESSION_STORE=sqlite:///var/lib/cutting-edge/sessions.db
+    CUTTING_EDGE_SESSION_STORE=redis://localhost:6379/0   (needs `redis`)
+    CUTTING_EDGE_SESSION_STORE=memory                     (single process)
+
+Each key is stored as its own compact JSON value and only keys whose value
+changed during a rerun are written.
+"""
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from functools import wraps
+
+import streamlit as st
+
+from cutting_edge.ui import PERSISTENT_WIDGET_PREFIXES
+
+log = logging.getLogger(__name__)
+
+SESSION_TTL = 7 * 24 * 3600
+
+# Plain session state owned by the sections. Widget keys are picked up via
+# PERSISTENT_WIDGET_PREFIXES.
+SESSION_KEYS = frozenset({
+    "card_index", "show_answer", "completed",
+    "qa_index", "qa_score", "qa_answered", "qa_selected", "qa_history", "qa_show_final",
+})
+# Per-session caches that are cheaper to rebuild than to ship around.
+TRANSIENT_KEYS = frozenset({"faq_bodies", "faq_bodies_version"})
+
+SESSION_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+def persisted_key(key):
+    if not isinstance(key, str) or key in TRANSIENT_KEYS:
+        return False
+    return key in SESSION_KEYS or key.startswith(PERSISTENT_WIDGET_PREFIXES)
+
+
+def _tag_tuples(value):
+    if isinstance(value, tuple):
+        return {"$t": [_tag_tuples(v) for v in value]}
+    if isinstance(value, list):
+        return [_tag_tuples(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _tag_tuples(v) for k, v in value.items()}
+    return value
+
+
+def _untag_tuples(obj):
+    return tuple(obj["$t"]) if obj.keys() == {"$t"} else obj
+
+
+def encode(value):
+    # Tuples are tagged so values like a pager scope compare equal after a
+    # round trip.
+    return json.dumps(_tag_tuples(value), separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def decode(raw):
+    return json.loads(raw, object_hook=_untag_tuples)
+
+
+class MemoryBackend:
+    """In-process stand-in for a shared store; state dies with the process."""
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def load(self, session_id):
+        with self._lock:
+            return dict(self._sessions.get(session_id, {}))
+
+    def save(self, session_id, changed, removed):
+        with self._lock:
+            state = self._sessions.setdefault(session_id, {})
+            state.update(changed)
+            for key in removed:
+                state.pop(key, None)
+
+
+class SQLiteBackend:
+    """One row per (session, key), shared by every process on the host."""
+
+    def __init__(self, path, ttl=SESSION_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS session_state ("
+            " session_id TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, updated_at REAL NOT NULL,"
+            " PRIMARY KEY (session_id, key)) WITHOUT ROWID"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS session_state_updated ON session_state (updated_at)")
+        self.expire()
+
+    def expire(self):
+        with self._lock:
+            self._db.execute("DELETE FROM session_state WHERE updated_at < ?", (time.time() - self.ttl,))
+
+    def load(self, session_id):
+        with self._lock:
+            rows = self._db.execute("SELECT key, value FROM session_state WHERE session_id = ?", (session_id,))
+            return dict(rows.fetchall())
+
+    def save(self, session_id, changed, removed):
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            self._db.executemany(
+                "INSERT INTO session_state VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (session_id, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                [(session_id, key, value, now) for key, value in changed.items()],
+            )
+            self._db.executemany(
+                "DELETE FROM session_state WHERE session_id = ? AND key = ?",
+                [(session_id, key) for key in removed],
+            )
+
+
+class RedisBackend:
+    """One hash per session on a Redis-protocol server, expiring when idle."""
+
+    def __init__(self, url, ttl=SESSION_TTL):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("the redis session store needs the 'redis' package: pip install redis") from None
+        self.ttl = ttl
+        self._client = redis.Redis.from_url(url)
+
+    def _name(self, session_id):
+        return f"cutting-edge:session:{session_id}"
+
+    def load(self, session_id):
+        return {key.decode(): value for key, value in self._client.hgetall(self._name(session_id)).items()}
+
+    def save(self, session_id, changed, removed):
+        name = self._name(session_id)
+        pipe = self._client.pipeline(transaction=False)
+        if changed:
+            pipe.hset(name, mapping=changed)
+        if removed:
+            pipe.hdel(name, *removed)
+        pipe.expire(name, self.ttl)
+        pipe.execute()
+
+
+def open_backend(spec):
+    if spec == "memory":
+        return MemoryBackend()
+    if spec.startswith("sqlite:///"):
+        return SQLiteBackend(spec[len("sqlite:///"):])
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend(spec)
+    raise ValueError(f"unknown session store {spec!r}")
+
+
+@st.cache_resource
+def get_session_backend():
+    spec = os.environ.get("CUTTING_EDGE_SESSION_STORE")
+    return open_backend(spec) if spec else None
+
+
+def restore_session():
+    """Attach this browser session to its stored state; call once per full run.
+
+    The session id is kept in session state too, because page navigation can
+    drop query parameters; it is written back to the URL on every run.
+    """
+    backend = get_session_backend()
+    if backend is None:
+        return
+    if "_session_id" not in st.session_state:
+        sid = st.query_params.get("sid", "")
+        if SESSION_ID_PATTERN.fullmatch(sid):
+            stored = backend.load(sid)
+            for key, raw in stored.items():
+                if persisted_key(key) and key not in st.session_state:
+                    st.session_state[key] = decode(raw)
+        else:
+            sid, stored = uuid.uuid4().hex, {}
+        st.session_state._session_id = sid
+        st.session_state._session_saved = stored
+    if st.query_params.get("sid") != st.session_state._session_id:
+        st.query_params["sid"] = st.session_state._session_id
+
+
+def save_session():
+    """Write the persisted keys whose encoded value changed since the last save."""
+    backend = get_session_backend()
+    if backend is None or "_session_id" not in st.session_state:
+        return
+    saved = st.session_state._session_saved
+    current = {}
+    for key in list(st.session_state):
+        if persisted_key(key):
+            try:
+                current[key] = encode(st.session_state[key])
+            except (TypeError, ValueError):
+                log.warning("session key %r is not JSON serializable; not persisted", key)
+    changed = {key: raw for key, raw in current.items() if saved.get(key) != raw}
+    removed = [key for key in saved if key not in current]
+    if not changed and not removed:
+        return
+    try:
+        backend.save(st.session_state._session_id, changed, removed)
+    except Exception as e:  # a store outage must not break the page
+        log.warning("could not save session state: %s", e)
+        return
+    st.session_state._session_saved = current
+
+
+def persisted(fn):
+    # Saves in a finally block: st.rerun() leaves the section by raising.
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            save_session()
+    return wrapper
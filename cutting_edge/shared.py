@@ -0,0 +1,307 @@
+"""Memory-mapped catalog shared by every server process on the host.
+
+The catalog is packed into one file: a string table (offsets plus a UTF-8
+blob, each distinct string stored once) and a flat array of 32-bit nodes
+describing the lists and mappings. Anything JSON content can hold is packed:
+true, false and null as constants, and floats and integers that do not fit
+in 32 bits as their text in the string table. Workers map the file read-only, so its
+pages live once in the OS page cache however many workers there are, and
+read it through lazy views that decode a string only when it is accessed.
+"""
+import logging
+import mmap
+import os
+import struct
+import threading
+from array import array
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+from cutting_edge import build
+from cutting_edge.catalog import Catalog, CatalogStore
+
+try:
+    import fcntl
+except ImportError:  # Windows: rebuilds are not coordinated between workers.
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+SHARED_PATH = build.CONTENT_DIR / "catalog.bin"
+
+MAGIC = b"CECT"
+FORMAT = 3
+HEADER = struct.Struct("<4sHH12sIIIII")
+
+TAG_STR, TAG_INT, TAG_LIST, TAG_MAP, TAG_CONST, TAG_FLOAT, TAG_BIGINT = range(7)
+CONSTANTS = (None, False, True)
+
+
+class _Packer:
+    def __init__(self):
+        self.strings = {}
+        self.words = array("I")
+
+    def string(self, text):
+        sid = self.strings.get(text)
+        if sid is None:
+            sid = self.strings[text] = len(self.strings)
+        return sid
+
+    def node(self, value):
+        if isinstance(value, str):
+            return TAG_STR, self.string(value)
+        if value is None or isinstance(value, bool):
+            return TAG_CONST, CONSTANTS.index(value)
+        if isinstance(value, int):
+            if 0 <= value < 2 ** 32:
+                return TAG_INT, value
+            return TAG_BIGINT, self.string(str(value))
+        if isinstance(value, float):
+            return TAG_FLOAT, self.string(repr(value))
+        if not isinstance(value, (Mapping, Sequence)):
+            raise TypeError(f"cannot pack {type(value).__name__} into the shared catalog")
+        if isinstance(value, Mapping):
+            children = [part for k, v in value.items() for part in (*self.node(k), *self.node(v))]
+            tag = TAG_MAP
+        else:
+            children = [part for v in value for part in self.node(v)]
+            tag = TAG_LIST
+        position = len(self.words)
+        self.words.append(len(value))
+        self.words.extend(children)
+        return tag, position
+
+
+def pack(catalog):
+    packer = _Packer()
+    root_tag, root = packer.node({field: getattr(catalog, field) for field in Catalog._fields if field != "version"})
+    assert root_tag == TAG_MAP
+
+    encoded = [s.encode() for s in packer.strings]
+    offsets = array("I", [0])
+    for e in encoded:
+        offsets.append(offsets[-1] + len(e))
+    header = HEADER.pack(
+        MAGIC, FORMAT, 0, catalog.version.encode().ljust(12), len(encoded), offsets[-1], len(packer.words), root, 0,
+    )
+    return b"".join([header, offsets.tobytes(), packer.words.tobytes(), *encoded])
+
+
+def write_shared(catalog, path=SHARED_PATH):
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(pack(catalog))
+    os.replace(tmp, path)
+
+
+class _Buffer:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, fmt, _, version, n_strings, blob_len, n_words, root, _ = HEADER.unpack_from(self.mm)
+        if magic != MAGIC or fmt != FORMAT:
+            raise ValueError(f"{path}: not a shared catalog (format {fmt})")
+        self.version = version.decode().strip()
+        self.root = root
+        view = memoryview(self.mm)
+        start = HEADER.size
+        self.offsets = view[start:start + 4 * (n_strings + 1)].cast("I")
+        start += 4 * (n_strings + 1)
+        self.words = view[start:start + 4 * n_words].cast("I")
+        start += 4 * n_words
+        self.blob = view[start:start + blob_len]
+
+    def string(self, sid):
+        return str(self.blob[self.offsets[sid]:self.offsets[sid + 1]], "utf-8")
+
+    def value(self, tag, val):
+        if tag == TAG_STR:
+            return self.string(val)
+        if tag == TAG_INT:
+            return val
+        if tag == TAG_LIST:
+            return ListView(self, val)
+        if tag == TAG_MAP:
+            return MapView(self, val)
+        if tag == TAG_CONST:
+            return CONSTANTS[val]
+        if tag == TAG_FLOAT:
+            return float(self.string(val))
+        return int(self.string(val))
+
+
+class ListView(Sequence):
+    __slots__ = ("_buf", "_pos", "_len")
+
+    def __init__(self, buf, pos):
+        self._buf = buf
+        self._pos = pos
+        self._len = buf.words[pos]
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+        at = self._pos + 1 + 2 * index
+        words = self._buf.words
+        return self._buf.value(words[at], words[at + 1])
+
+    def __repr__(self):
+        return f"<ListView of {self._len}>"
+
+
+class MapView(Mapping):
+    """Read-only mapping over a packed map, in insertion order.
+
+    Lookups scan the keys; maps larger than INDEX_THRESHOLD build a private
+    key index on first use, which is why top-level views are kept around.
+    """
+
+    __slots__ = ("_buf", "_pos", "_len", "_index")
+    INDEX_THRESHOLD = 16
+
+    def __init__(self, buf, pos):
+        self._buf = buf
+        self._pos = pos
+        self._len = buf.words[pos]
+        self._index = None
+
+    def __len__(self):
+        return self._len
+
+    def _key(self, i):
+        at = self._pos + 1 + 4 * i
+        return self._buf.value(self._buf.words[at], self._buf.words[at + 1])
+
+    def _value(self, i):
+        at = self._pos + 3 + 4 * i
+        return self._buf.value(self._buf.words[at], self._buf.words[at + 1])
+
+    def __iter__(self):
+        return (self._key(i) for i in range(self._len))
+
+    def __getitem__(self, key):
+        if self._len > self.INDEX_THRESHOLD:
+            if self._index is None:
+                self._index = {self._key(i): i for i in range(self._len)}
+            i = self._index.get(key)
+            if i is None:
+                raise KeyError(key)
+            return self._value(i)
+        for i in range(self._len):
+            if self._key(i) == key:
+                return self._value(i)
+        raise KeyError(key)
+
+    def __repr__(self):
+        return f"<MapView of {self._len}>"
+
+
+class SharedCatalog:
+    """A Catalog-shaped object whose fields are views into the mapped file."""
+
+    def __init__(self, path=SHARED_PATH):
+        buf = _Buffer(path)
+        self.version = buf.version
+        root = MapView(buf, buf.root)
+        for i in range(len(root)):
+            setattr(self, root._key(i), root._value(i))
+
+
+def _stale(path, content_dir):
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        built = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return True
+    if len(header) < HEADER.size or HEADER.unpack_from(header)[:2] != (MAGIC, FORMAT):
+        return True  # written by an older release
+    return any(os.stat(build.source_path(s, content_dir)).st_mtime_ns > built for s in build.SECTIONS)
+
+
+class SharedCatalogStore:
+    """CatalogStore counterpart that serves a memory-mapped SharedCatalog.
+
+    When the sources change, one worker (holding the lock file) rebuilds
+    catalog.bin and every worker remaps it; in-flight reruns keep the
+    mapping they started with.
+    """
+
+    def __init__(self, content_dir=build.CONTENT_DIR):
+        self.content_dir = Path(content_dir)
+        self.path = self.content_dir / SHARED_PATH.name
+        self.last_error = None
+        self._stop = threading.Event()
+        self._watcher = None
+        self._rebuild(blocking=True)
+        self._signature = self._read_signature()
+        self._catalog = SharedCatalog(self.path)
+
+    def current(self):
+        return self._catalog
+
+    def _read_signature(self):
+        st = os.stat(self.path)
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _rebuild(self, blocking):
+        if not _stale(self.path, self.content_dir):
+            return
+        with open(self.content_dir / ".catalog.lock", "w") as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+                except BlockingIOError:
+                    return
+            # Another worker may have rebuilt it while we waited for the lock.
+            if _stale(self.path, self.content_dir):
+                write_shared(CatalogStore(self.content_dir).current(), self.path)
+
+    def reload(self):
+        try:
+            self._rebuild(blocking=False)
+        except build.ContentError as e:
+            if str(e) != str(self.last_error):
+                log.error("content reload rejected, keeping version %s\n%s", self._catalog.version, e)
+            self.last_error = e
+            return False
+        self.last_error = None
+        signature = self._read_signature()
+        if signature == self._signature:
+            return False
+        self._catalog = SharedCatalog(self.path)
+        self._signature = signature
+        log.info("remapped shared catalog (version %s)", self._catalog.version)
+        return True
+
+    def start_watching(self, interval=2.0):
+        if self._watcher is not None:
+            return
+        self._watcher = threading.Thread(target=self._watch, args=(interval,), name="catalog-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop.set()
+
+    def _watch(self, interval):
+        failure = None
+        while not self._stop.wait(interval):
+            # As in CatalogStore: a failed rebuild or remap must not end hot
+            # reload for the life of the process.
+            try:
+                self.reload()
+                failure = None
+            except OSError as e:
+                log.warning("content watcher: %s", e)
+            except Exception as e:
+                if repr(e) != failure:
+                    log.exception("content watcher: reload failed, keeping version %s", self._catalog.version)
+                failure = repr(e)
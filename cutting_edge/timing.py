@@ -0,0 +1,50 @@
+import statistics
+import threading
+import time
+from collections import defaultdict, deque
+from functools import wraps
+
+
+class RerunTimings:
+    """Process-wide rolling samples of how long each part of a rerun takes."""
+
+    def __init__(self, maxlen=1000):
+        self._samples = defaultdict(lambda: deque(maxlen=maxlen))
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            self._samples[name].append(seconds)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items() if values}
+        report = {}
+        for name, values in samples.items():
+            report[name] = {
+                "count": len(values),
+                "p50_ms": statistics.median(values) * 1000,
+                "p95_ms": values[min(len(values) - 1, int(len(values) * 0.95))] * 1000,
+                "max_ms": values[-1] * 1000,
+            }
+        return report
+
+
+timings = RerunTimings()
+
+
+def timed(name):
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                timings.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as st_components
+from streamlit.errors import StreamlitAPIException
+
+from cutting_edge.catalog import CatalogStore
+from cutting_edge.components import html
+from cutting_edge.search import CatalogFaqs
+
+
+@st.cache_resource
+def get_catalog_store():
+    # With several server processes, CUTTING_EDGE_SHARED_CATALOG=1 maps one
+    # on-disk copy of the catalog into all of them instead of each building
+    # its own.
+    if os.environ.get("CUTTING_EDGE_SHARED_CATALOG"):
+        from cutting_edge.shared import SharedCatalogStore
+        store = SharedCatalogStore()
+    else:
+        store = CatalogStore()
+    store.start_watching()
+    return store
+
+
+@st.cache_resource
+def get_knowledge_base():
+    path = os.environ.get("CUTTING_EDGE_KB")
+    if not path:
+        return None
+    from cutting_edge.kb import KnowledgeBase
+    return KnowledgeBase(path)
+
+
+def faq_source(catalog):
+    """Where the FAQ page reads entries from: the SQLite knowledge base named
+    by CUTTING_EDGE_KB, or the catalog's faq_data."""
+    kb = get_knowledge_base()
+    return kb if kb is not None else CatalogFaqs(catalog)
+
+
+def rerun_tab():
+    # Fragment scope is only valid during a fragment rerun; if a full run got
+    # here, rerun the whole script as before.
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+
+# Widget values under these prefixes survive switching pages. Streamlit drops
+# the state of widgets that were not rendered in a run; re-assigning it turns
+# it into plain session state that the widget picks up again when its page
+# is shown.
+PERSISTENT_WIDGET_PREFIXES = ("flash_", "loss_", "guide_", "attach_", "faq_", "assist_")
+
+
+def keep_widget_state():
+    for key in list(st.session_state):
+        if isinstance(key, str) and key.startswith(PERSISTENT_WIDGET_PREFIXES):
+            st.session_state[key] = st.session_state[key]
+
+
+def paginate(key, count, page_size, scope=None):
+    """Render prev/next controls for a list and return the (start, end) window.
+
+    The page lives in session state under `key` and resets to the first page
+    whenever `scope` (e.g. the active filter) changes.
+    """
+    if st.session_state.get(f"{key}_scope") != scope:
+        st.session_state[f"{key}_scope"] = scope
+        st.session_state[key] = 0
+    pages = max(1, -(-count // page_size))
+    page = min(st.session_state.get(key, 0), pages - 1)
+    if pages > 1:
+        prev_col, label_col, next_col = st.columns([1, 2, 1])
+        # Button keys must stay outside PERSISTENT_WIDGET_PREFIXES: button
+        # values cannot be assigned through session state.
+        if prev_col.button("◀ Prev", key=f"pager_{key}_prev", disabled=page == 0, use_container_width=True):
+            page -= 1
+        if next_col.button("Next ▶", key=f"pager_{key}_next", disabled=page == pages - 1, use_container_width=True):
+            page += 1
+        with label_col:
+            html(f'<p class="note pager">Page {page + 1} of {pages}</p>')
+    st.session_state[key] = page
+    start = page * page_size
+    return start, min(start + page_size, count)
+
+
+_search_box = st_components.declare_component("search_box", path=str(Path(__file__).parent / "frontend" / "search_box"))
+
+
+def search_box(key, query="", suggestions=(), for_query="", placeholder="", index_url=None, version=None):
+    """Text box that searches as the agent types and reports Enter and picks.
+
+    With `index_url` (see search.client_index_url) suggestions are computed
+    in the browser. Otherwise, or until the index has loaded, keystrokes come
+    back as debounced "type" events and `suggestions` are shown while the box
+    still holds `for_query`.
+
+    Returns the last event, {event, query, faq_id, seq}, or None before the
+    first one; `seq` tells a new event from the same one seen on a later
+    rerun. The key must stay outside PERSISTENT_WIDGET_PREFIXES.
+    """
+    return _search_box(
+        query=query, suggestions=list(suggestions), for_query=for_query, placeholder=placeholder,
+        index_url=index_url, version=version, key=key, default=None,
+    )
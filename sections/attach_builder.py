@@ -0,0 +1,44 @@
+import streamlit as st
+
+from cutting_edge import components, render
+from cutting_edge.components import html, metered
+from cutting_edge.sessions import persisted
+from cutting_edge.timing import timed
+from cutting_edge.ui import get_catalog_store
+
+
+@st.fragment
+@timed("attach_builder")
+@metered("attach_builder")
+@persisted
+def attach_builder():
+    catalog = get_catalog_store().current()
+    components.tagline("Build your attach pitch — your words, your style!")
+    components.card_open("🎯 Build Your Attach Pitch")
+    attach_service = st.selectbox("What service do you want to attach?", ["Select a service..."] + list(catalog.attach_guides.keys()), key="attach_service")
+    if attach_service != "Select a service...":
+        adata = catalog.attach_guides[attach_service]
+        html(render.attach_triggers(catalog, attach_service))
+        st.markdown("---")
+        st.markdown("**Step 1: How do you want to open?**")
+        attach_opening = st.radio("Choose your style:", list(adata["openings"].keys()), horizontal=True, key="attach_opening")
+        st.markdown("---")
+        st.markdown("**Step 2: Which points do you want to hit?**")
+        selected_attach_points = []
+        for point_name in adata["points"]:
+            if st.checkbox(point_name, key=f"attach_{attach_service}_{point_name}"):
+                selected_attach_points.append(point_name)
+        st.markdown("---")
+        st.markdown("**Step 3: How do you want to close?**")
+        attach_close = st.radio("Choose your close:", list(adata["closes"].keys()), horizontal=True, key="attach_close")
+        if selected_attach_points:
+            st.markdown("---")
+            st.markdown("### 📋 Your Attach Pitch")
+            html(render.pitch(catalog, "attach", attach_service, attach_opening, selected_attach_points, attach_close))
+            html(render.attach_pro_tip(catalog, attach_service))
+        else:
+            st.info("👆 Select at least one key point to see your pitch!")
+    components.card_close()
+
+
+attach_builder()
@@ -0,0 +1,62 @@
+import streamlit as st
+
+from cutting_edge import components, render
+from cutting_edge.assist import call_matcher
+from cutting_edge.components import html, metered
+from cutting_edge.sessions import persisted
+from cutting_edge.timing import timed
+from cutting_edge.ui import get_catalog_store
+
+MAX_MATCHES = 5
+
+
+def clear_call():
+    st.session_state.assist_text = ""
+    st.session_state.assist_stream = None
+
+
+def show_match(catalog, key):
+    kind, _, ident = key.partition(":")
+    if kind == "objection":
+        html(render.call_objection(catalog, int(ident)))
+    elif kind == "attach":
+        html(render.call_attach(catalog, ident))
+    else:
+        html(render.call_faqs(catalog, ident))
+
+
+@st.fragment
+@timed("call_assist")
+@metered("call_assist")
+@persisted
+def call_assist():
+    catalog = get_catalog_store().current()
+    matcher = call_matcher(catalog)
+    components.tagline("Type or paste what the customer says — we'll surface the right response!")
+    text = st.text_area(
+        "What is the customer saying?", key="assist_text", height=120,
+        placeholder="e.g. honestly your prices are too high, and can I pay with cash?",
+    )
+    st.button("🧹 New Call", on_click=clear_call, key="new_call")
+
+    # Only the text added since the last run goes through the matcher; an
+    # edit anywhere else starts the call over.
+    stream = st.session_state.get("assist_stream")
+    if not stream or stream["version"] != catalog.version or not text.startswith(stream["fed"]):
+        stream = {"version": catalog.version, "fed": "", "node": 0, "pending": "", "hits": []}
+    node, pending, matches = matcher.feed(stream["node"], stream["pending"], text[len(stream["fed"]):])
+    hits = list(dict.fromkeys(reversed(matches))) + [k for k in stream["hits"] if k not in matches]
+    st.session_state.assist_stream = {"version": catalog.version, "fed": text, "node": node, "pending": pending, "hits": hits}
+
+    # The word still being typed counts for display, not for the stream.
+    typing = [k for k in dict.fromkeys(reversed(matcher.flush(node, pending)[1])) if k not in hits[:MAX_MATCHES]]
+    shown = (typing + hits)[:MAX_MATCHES]
+    if shown:
+        st.markdown("**🎧 Heard on this call:**")
+        for key in shown:
+            show_match(catalog, key)
+    elif text.strip():
+        st.info("No objection, attach trigger or FAQ topic recognised yet — keep listening!")
+
+
+call_assist()
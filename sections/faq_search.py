@@ -0,0 +1,115 @@
+import streamlit as st
+
+from cutting_edge import components, queries, render
+from cutting_edge.components import html, metered
+from cutting_edge.search import snippet
+from cutting_edge.sessions import persisted
+from cutting_edge.timing import timed
+from cutting_edge.ui import faq_source, get_catalog_store, paginate, search_box
+
+FAQ_PAGE_SIZES = [10, 25, 50]
+
+
+def faq_entry(catalog, faqs, faq, show_category=False):
+    # Only the headline is sent up front; the body is rendered the first time
+    # the expander is opened and then kept for the rest of the session.
+    expander = st.expander(f"📌 {faq['question']}", key=f"faq_open_{faq['id']}", on_change="rerun")
+    if expander.open:
+        if st.session_state.get("faq_bodies_version") != (catalog.version, faqs.version):
+            st.session_state.faq_bodies_version = (catalog.version, faqs.version)
+            st.session_state.faq_bodies = {}
+        bodies = st.session_state.faq_bodies
+        if (faq["id"], show_category) not in bodies:
+            bodies[faq["id"], show_category] = render.faq_body(catalog, faqs, faq["id"], show_category)
+        with expander:
+            html(bodies[faq["id"], show_category])
+            # Knowledge base articles are not in the catalog's related table.
+            related = render.related(catalog, f"faq:{faq['id']}") if faqs.version == catalog.version else ""
+            if related:
+                html(related)
+    elif faq.get("snippet"):
+        html(f'<p class="snippet">{faq["snippet"]}</p>')
+
+
+@st.fragment
+@timed("faq_search")
+@metered("faq_search")
+@persisted
+def faq_search():
+    catalog = get_catalog_store().current()
+    faqs = faq_source(catalog)
+    components.tagline("Find answers fast — search or browse by category!")
+    
+    # The search box suggests entries from a browser-side index as the agent
+    # types; the server only hears about Enter and picked suggestions. If the
+    # index is unavailable it reports debounced keystrokes instead, and the
+    # suggestions are computed here.
+    event = st.session_state.get("search_box")
+    if event and event["seq"] != st.session_state.get("faq_search_seq"):
+        st.session_state.faq_search_seq = event["seq"]
+        st.session_state.faq_query = event["query"]
+        if event["event"] == "submit" or not event["query"].strip():
+            st.session_state.faq_submitted = event["query"].strip()
+            st.session_state.faq_selected = None
+        elif event["event"] == "select" and faqs.get(event["faq_id"]) is not None:
+            st.session_state.faq_selected = event["faq_id"]
+            st.session_state[f"faq_open_{event['faq_id']}"] = True
+    typed = st.session_state.get("faq_query", "")
+    suggestions = [
+        {"id": faq["id"], "question": faq["question"], "category": faq["category"], "snippet": snippet(faq.get("answer", ""))}
+        for faq in faqs.suggest(typed)
+    ] if event and event["event"] == "type" and typed.strip() else []
+    st.markdown("**🔍 Search FAQs**")
+    search_box(
+        "search_box", query=typed, suggestions=suggestions, for_query=typed,
+        placeholder="Type keywords like 'long grass' or 'payment'...",
+        index_url=faqs.client_index_url(), version=faqs.version,
+    )
+    search_query = st.session_state.get("faq_submitted", "")
+    selected = st.session_state.get("faq_selected")
+    
+    st.markdown("**Or browse by category:**")
+    categories = ["All Categories"] + faqs.categories()
+    selected_faq_cat = st.selectbox("Select a category", categories, label_visibility="collapsed", key="faq_category")
+    
+    category = None if selected_faq_cat == "All Categories" else selected_faq_cat
+    selected_faq = faqs.get(selected) if selected else None
+    if selected_faq is not None:
+        faq_entry(catalog, faqs, selected_faq, show_category=True)
+    elif search_query:
+        # One ranked search through the shared result cache gives the count
+        # and the page shown; the query log hears about each query once.
+        logged = st.session_state.get("faq_logged") == (search_query, category)
+        st.session_state.faq_logged = (search_query, category)
+        result = queries.search(faqs, search_query, category, record=not logged)
+        total = result[0]
+        where = f" in {category}" if category else ""
+        if total:
+            components.note(f'Found {total} result(s) for "{search_query}"{where}')
+            start, end = paginate("faq_results", total, FAQ_PAGE_SIZES[0], scope=(search_query, category))
+            for r in queries.page(faqs, search_query, category, result, start, end):
+                faq_entry(catalog, faqs, r, show_category=True)
+        else:
+            st.warning(f'No results found for "{search_query}"{where}. Try different keywords!')
+    
+    else:
+        # Browsing renders one page at a time, so the landing view costs the
+        # same however large the knowledge base grows.
+        count = faqs.count(category)
+        if category is None:
+            components.note(f"Browse all categories ({count} questions):")
+        else:
+            components.note(f"{count} questions in {category}")
+        page_size = st.selectbox("Questions per page", FAQ_PAGE_SIZES, key="faq_page_size")
+        start, end = paginate("faq_page", count, page_size, scope=(selected_faq_cat, page_size))
+        heading = None
+        for faq in faqs.page(category, start, end):
+            if category is None and faq["category"] != heading:
+                heading = faq["category"]
+                st.markdown(f"### {heading}")
+            faq_entry(catalog, faqs, faq)
+    
+    components.tip_card("💡 Remember", "The phrasing examples are just guides — don't memorize them word-for-word! Use the key points and put them in YOUR voice so it sounds natural and conversational.")
+
+
+faq_search()
@@ -0,0 +1,59 @@
+import streamlit as st
+
+from cutting_edge import components, render
+from cutting_edge.components import html, metered
+from cutting_edge.sessions import persisted
+from cutting_edge.timing import timed
+from cutting_edge.ui import get_catalog_store, rerun_tab
+
+
+@st.fragment
+@timed("flashcards")
+@metered("flashcards")
+@persisted
+def flashcards():
+    catalog = get_catalog_store().current()
+    components.tagline("Identify the WHY, then match the right response!")
+    if 'card_index' not in st.session_state:
+        st.session_state.card_index = 0
+    if 'show_answer' not in st.session_state:
+        st.session_state.show_answer = False
+    if 'completed' not in st.session_state:
+        st.session_state.completed = []
+    categories = ["All"] + list(catalog.objection_categories)
+    selected_cat = st.selectbox("Filter by category:", categories, key="flash_category")
+    filtered = catalog.objections if selected_cat == "All" else catalog.objections_by_category[selected_cat]
+    if st.session_state.card_index >= len(filtered):
+        st.session_state.card_index = 0
+    current = filtered[st.session_state.card_index]
+    filtered_ids = {o["id"] for o in filtered}
+    progress = len([c for c in st.session_state.completed if c in filtered_ids])
+    st.progress(progress / len(filtered))
+    components.note(f"{progress} / {len(filtered)} reviewed", align="right")
+    html(render.objection_card(catalog, current["id"], st.session_state.card_index, len(filtered)))
+    if st.session_state.show_answer:
+        html(render.objection_answer(catalog, current["id"]))
+        related = render.related(catalog, f"objection:{current['id']}")
+        if related:
+            html(related)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("🔄 Flip Card", use_container_width=True):
+            st.session_state.show_answer = not st.session_state.show_answer
+            rerun_tab()
+    with col2:
+        if st.button("➡️ Next Card", use_container_width=True):
+            if current["id"] not in st.session_state.completed:
+                st.session_state.completed.append(current["id"])
+            st.session_state.card_index = (st.session_state.card_index + 1) % len(filtered)
+            st.session_state.show_answer = False
+            rerun_tab()
+    with col3:
+        if st.button("🔁 Reset", use_container_width=True):
+            st.session_state.completed = []
+            st.session_state.card_index = 0
+            st.session_state.show_answer = False
+            rerun_tab()
+
+
+flashcards()
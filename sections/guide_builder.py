@@ -0,0 +1,45 @@
+import streamlit as st
+
+from cutting_edge import components, render
+from cutting_edge.components import html, metered
+from cutting_edge.sessions import persisted
+from cutting_edge.timing import timed
+from cutting_edge.ui import get_catalog_store
+
+
+@st.fragment
+@timed("guide_builder")
+@metered("guide_builder")
+@persisted
+def guide_builder():
+    catalog = get_catalog_store().current()
+    components.tagline("Build your own approach — your words, your style!")
+    components.card_open("🛠️ Build Your Guide")
+    scenario = st.selectbox("What objection are you handling?", ["Select a scenario..."] + list(catalog.guide_scenarios.keys()), key="guide_scenario")
+    if scenario != "Select a scenario...":
+        data = catalog.guide_scenarios[scenario]
+        st.markdown("---")
+        st.markdown("**Step 1: How do you want to open?**")
+        opening_style = st.radio("Choose your style:", list(data["openings"].keys()), horizontal=True, key="guide_opening")
+        st.markdown("---")
+        st.markdown("**Step 2: Which points do you want to hit?**")
+        selected_points = []
+        for point_name in data["points"]:
+            if st.checkbox(point_name, key=f"guide_{scenario}_{point_name}"):
+                selected_points.append(point_name)
+        st.markdown("---")
+        st.markdown("**Step 3: How do you want to close?**")
+        close_style = st.radio("Choose your close:", list(data["closes"].keys()), horizontal=True, key="guide_close")
+        if selected_points:
+            st.markdown("---")
+            st.markdown("### 📋 Your Custom Guide")
+            html(render.pitch(catalog, "guide", scenario, opening_style, selected_points, close_style))
+        else:
+            st.info("👆 Select at least one key point to see your guide!")
+        related = render.related(catalog, f"guide:{scenario}")
+        if related:
+            html(related)
+    components.card_close()
+
+
+guide_builder()
@@ -0,0 +1,69 @@
+import streamlit as st
+from datetime import datetime
+
+from cutting_edge import components
+from cutting_edge.components import html, metered
+from cutting_edge.dispositions import TIMESTAMP_FORMAT, get_disposition_store
+from cutting_edge.events import loss_events
+from cutting_edge.outbox import get_outbox
+from cutting_edge.sessions import persisted
+from cutting_edge.timing import timed
+from cutting_edge.ui import get_catalog_store
+
+PERIODS = {"Today": 1, "Last 7 days": 7, "Last 30 days": 30}
+TOP_AGENTS = 5
+
+
+@st.fragment
+@timed("loss_tracker")
+@metered("loss_tracker")
+@persisted
+def loss_tracker():
+    catalog = get_catalog_store().current()
+    components.tagline("Track dispositions. Find patterns. Coach smarter.")
+    components.card_open("Log a Loss")
+    agent_name = st.text_input("Agent Name", key="loss_agent_name")
+    agent_id = st.text_input("Agent ID", key="loss_agent_id")
+    disposition = st.selectbox("Disposition", ["Select disposition..."] + list(catalog.dispositions), key="loss_disposition")
+    if st.button("📤 Log & Send to Sheet", use_container_width=True):
+        if agent_name and agent_id and disposition != "Select disposition...":
+            # Written to the local outbox; a background thread sends it to
+            # the sheet and keeps retrying until the sheet has it. The local
+            # history below is kept under the same key.
+            now = datetime.now()
+            outbox, deliverer = get_outbox()
+            key = outbox.enqueue({
+                "agentName": agent_name, "agentId": agent_id, "disposition": disposition,
+                "timestamp": now.strftime(TIMESTAMP_FORMAT),
+            })
+            deliverer.wake()
+            get_disposition_store().record(agent_name, agent_id, disposition, now.timestamp(), key)
+            html(f'<div class="success-box">✓ Logged: {disposition}</div>')
+        else:
+            st.warning("Please fill in all fields!")
+    components.card_close()
+
+    components.card_open("📊 Patterns")
+    period = st.radio("Period", list(PERIODS), horizontal=True, key="loss_period")
+    days = PERIODS[period]
+    store = get_disposition_store()
+    team = store.by_disposition(days)
+    if not team:
+        st.info("No losses logged in this period yet.")
+    else:
+        components.tally(f"Team losses — {period.lower()}", team)
+        if agent_id:
+            mine = store.by_disposition(days, agent_id)
+            components.tally(f"{agent_name or agent_id} — {period.lower()}", mine or [("No losses logged", 0)])
+        top = team[0][0]
+        agents = store.by_agent(days, top)[:TOP_AGENTS]
+        components.tally(f"Most {top} losses", [(f"{name} ({ident})", n) for ident, name, n in agents])
+        hours, counts = loss_events(catalog, store).counts("hour", days=days, agent_id=agent_id or None)
+        components.tally(
+            f"When {agent_name or agent_id or 'the team'} loses — by hour",
+            [(hour, int(n)) for hour, n in zip(hours, counts) if n] or [("No losses logged", 0)],
+        )
+    components.card_close()
+
+
+loss_tracker()
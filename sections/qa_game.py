@@ -0,0 +1,142 @@
+import streamlit as st
+
+from cutting_edge import components, render
+from cutting_edge.components import html, metered
+from cutting_edge.sessions import persisted
+from cutting_edge.timing import timed
+from cutting_edge.ui import get_catalog_store, rerun_tab
+
+
+@st.fragment
+@timed("qa_game")
+@metered("qa_game")
+@persisted
+def qa_game():
+    catalog = get_catalog_store().current()
+    components.tagline("Test your QA knowledge — game show style! 🎯")
+    
+    if 'qa_index' not in st.session_state:
+        st.session_state.qa_index = 0
+    if 'qa_score' not in st.session_state:
+        st.session_state.qa_score = 0
+    if 'qa_answered' not in st.session_state:
+        st.session_state.qa_answered = False
+    if 'qa_selected' not in st.session_state:
+        st.session_state.qa_selected = None
+    if 'qa_history' not in st.session_state:
+        st.session_state.qa_history = []
+    
+    total_questions = len(catalog.qa_questions)
+    # A content reload can leave fewer questions than this game has reached;
+    # start the game over rather than index past the end.
+    if st.session_state.qa_index >= total_questions:
+        st.session_state.qa_index = 0
+        st.session_state.qa_score = 0
+        st.session_state.qa_answered = False
+        st.session_state.qa_selected = None
+        st.session_state.qa_history = []
+        st.session_state.qa_show_final = False
+    current_q = catalog.qa_questions[st.session_state.qa_index]
+    
+    score_pct = (st.session_state.qa_score / max(len(st.session_state.qa_history), 1)) * 100 if st.session_state.qa_history else 0
+    
+    components.qa_header(st.session_state.qa_score, len(st.session_state.qa_history), st.session_state.qa_index, total_questions)
+    
+    st.progress((st.session_state.qa_index + 1) / total_questions)
+    
+    components.qa_question(current_q["category"], current_q["scenario"])
+    
+    if not st.session_state.qa_answered:
+        for letter, text in current_q["options"].items():
+            if st.button(f"{letter}) {text}", key=f"qa_opt_{letter}", use_container_width=True):
+                st.session_state.qa_selected = letter
+                st.session_state.qa_answered = True
+                if letter == current_q["correct"]:
+                    st.session_state.qa_score += 1
+                st.session_state.qa_history.append({
+                    "question": current_q["scenario"],
+                    "selected": letter,
+                    "correct": current_q["correct"],
+                    "got_it": letter == current_q["correct"]
+                })
+                rerun_tab()
+    else:
+        for letter, text in current_q["options"].items():
+            if letter == current_q["correct"]:
+                components.qa_option(letter, text, "correct")
+            elif letter == st.session_state.qa_selected:
+                components.qa_option(letter, text, "wrong")
+            else:
+                components.qa_option(letter, text)
+        
+        components.qa_feedback(st.session_state.qa_selected == current_q["correct"], current_q["explanation"])
+        related = render.related(catalog, f"qa:{st.session_state.qa_index}")
+        if related:
+            html(related)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.session_state.qa_index < total_questions - 1:
+                if st.button("➡️ Next Question", use_container_width=True):
+                    st.session_state.qa_index += 1
+                    st.session_state.qa_answered = False
+                    st.session_state.qa_selected = None
+                    rerun_tab()
+            else:
+                if st.button("🏆 See Final Score", use_container_width=True):
+                    st.session_state.qa_show_final = True
+                    rerun_tab()
+        with col2:
+            if st.button("🔁 Start Over", use_container_width=True):
+                st.session_state.qa_index = 0
+                st.session_state.qa_score = 0
+                st.session_state.qa_answered = False
+                st.session_state.qa_selected = None
+                st.session_state.qa_history = []
+                st.session_state.qa_show_final = False
+                rerun_tab()
+    
+    if 'qa_show_final' not in st.session_state:
+        st.session_state.qa_show_final = False
+    
+    if st.session_state.qa_show_final and len(st.session_state.qa_history) == total_questions:
+        final_pct = (st.session_state.qa_score / total_questions) * 100
+        if final_pct >= 90:
+            grade = "QA Superstar!"
+            grade_color = "#28a745"
+            spriggle_emoji = "🎓"
+            spriggle_message = "Spriggle is SO proud of you! You're a QA master!"
+        elif final_pct >= 75:
+            grade = "Solid Performance!"
+            grade_color = "#4a9c3d"
+            spriggle_emoji = "😊"
+            spriggle_message = "Spriggle gives you a thumbs up! Great work!"
+        elif final_pct >= 60:
+            grade = "Keep Studying!"
+            grade_color = "#f5a623"
+            spriggle_emoji = "📖"
+            spriggle_message = "Spriggle believes in you! A little more practice and you've got this!"
+        else:
+            grade = "Time to Review!"
+            grade_color = "#dc3545"
+            spriggle_emoji = "💪"
+            spriggle_message = "Spriggle says don't give up! Review the guide and try again!"
+        
+        components.qa_final(grade, grade_color, spriggle_emoji, spriggle_message, st.session_state.qa_score, total_questions, final_pct)
+        
+        st.markdown("### 📋 Question Review")
+        for i, h in enumerate(st.session_state.qa_history):
+            icon = "✅" if h["got_it"] else "❌"
+            st.markdown(f"{icon} **Q{i+1}:** {h['question'][:50]}...")
+        
+        if st.button("🎮 Play Again", use_container_width=True):
+            st.session_state.qa_index = 0
+            st.session_state.qa_score = 0
+            st.session_state.qa_answered = False
+            st.session_state.qa_selected = None
+            st.session_state.qa_history = []
+            st.session_state.qa_show_final = False
+            rerun_tab()
+
+
+qa_game()
@@ -0,0 +1,33 @@
+import shutil
+
+import pytest
+
+from cutting_edge import build
+from cutting_edge.search import FaqIndex
+
+
+def faq(faq_id, question, answer, phrasing=""):
+    return {"id": faq_id, "category": "General", "question": question, "answer": answer, "phrasing": phrasing}
+
+
+FAQS = [
+    faq("fee", "What is the long grass fee?", "Lawns over six inches tall are charged an extra fee."),
+    faq("payment", "How do I add my payment info?", "Open the app and add a card under Payment."),
+    faq("cash", "Can I pay with cash?", "We only take card payments, never cash."),
+    faq("cancel", "How do I cancel a mowing?", "Cancel from the app before the crew is scheduled."),
+    faq("grass", "Do you bag the grass clippings?", "Clippings are mulched back into the lawn unless you ask."),
+]
+
+
+@pytest.fixture(scope="session")
+def index():
+    """A FaqIndex over five small FAQ entries."""
+    return FaqIndex(FAQS, "test")
+
+
+@pytest.fixture
+def content_dir(tmp_path):
+    """A copy of the bundled content sources to edit."""
+    for path in build.CONTENT_DIR.glob("*.json"):
+        shutil.copy(path, tmp_path / path.name)
+    return tmp_path
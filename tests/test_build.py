@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from cutting_edge import build
+
+
+def edit(content_dir, section, change):
+    """Apply change to a section's source: it edits the data in place, or
+    returns data to write instead."""
+    path = build.source_path(section, content_dir)
+    data = json.loads(path.read_text())
+    replaced = change(data)
+    data = data if replaced is None else replaced
+    path.write_text(json.dumps(data))
+
+
+def problems(content_dir):
+    with pytest.raises(build.ContentError) as e:
+        build.compile_sources(content_dir)
+    return e.value.problems
+
+
+def first_key(data):
+    return next(iter(data))
+
+
+def test_bundled_content_is_valid():
+    snapshot = build.compile_sources()
+    assert set(snapshot["sections"]) == set(build.SECTIONS)
+    assert len(snapshot["version"]) == 12
+
+
+def test_version_follows_the_content(content_dir):
+    before = build.compile_sources(content_dir)["version"]
+    edit(content_dir, "dispositions", lambda d: d.append("Moved away"))
+    assert build.compile_sources(content_dir)["version"] != before
+
+
+@pytest.mark.parametrize("section, change, expected", [
+    ("faq_data", lambda d: list(d.values()), "faq_data.json: expected an object, got list"),
+    ("objections", lambda d: {"0": d}, "objections.json: expected a list, got dict"),
+    ("objections", lambda d: d.__setitem__(0, "Too expensive"), "objections[0]: expected an object, got str"),
+    ("objections", lambda d: d[1].__setitem__("id", d[0]["id"]), "objections[1]: duplicate objection id"),
+    ("objections", lambda d: d[0].__setitem__("id", "1"), "objections[0]: 'id' must be an integer"),
+    ("objections", lambda d: d[0].__delitem__("rebuttal"), "objections[0]: missing or empty 'rebuttal'"),
+    ("dispositions", lambda d: d.append(d[0]), "dispositions: entries must be unique"),
+    ("dispositions", lambda d: d.append(7), "must be a non-empty string"),
+    ("dispositions", lambda d: d.append(" "), "must be a non-empty string"),
+    ("guide_scenarios", lambda d: d[first_key(d)].__setitem__("openings", {}), "'openings' must be a non-empty mapping"),
+    ("guide_scenarios", lambda d: d.__setitem__(first_key(d), []), "expected an object, got list"),
+    ("attach_guides", lambda d: d[first_key(d)].__setitem__("triggers", "grass"), "'triggers' must be a non-empty list of strings"),
+    ("attach_guides", lambda d: d[first_key(d)].__setitem__("triggers", ["grass", 3]), "'triggers' must be a non-empty list of strings"),
+    ("qa_questions", lambda d: d[0].__setitem__("correct", "Z"), "qa_questions[0]: correct answer 'Z' is not one of"),
+    ("qa_questions", lambda d: d[0].__setitem__("correct", ["A"]), "qa_questions[0]: missing or empty 'correct'"),
+    ("qa_questions", lambda d: d[0].__setitem__("options", []), "qa_questions[0]: 'options' must be a non-empty mapping"),
+    ("faq_data", lambda d: d.__setitem__(first_key(d), {}), "expected a list, got dict"),
+    ("faq_data", lambda d: d[first_key(d)][0].__setitem__("answer", ""), "missing or empty 'answer'"),
+    ("faq_data", lambda d: d[first_key(d)].append(None), "expected an object, got NoneType"),
+])
+def test_bad_content_is_a_content_error(content_dir, section, change, expected):
+    edit(content_dir, section, change)
+    assert any(expected in problem for problem in problems(content_dir)), problems(content_dir)
+
+
+def test_unparseable_json_is_a_content_error(content_dir):
+    build.source_path("faq_data", content_dir).write_text("{not json")
+    assert problems(content_dir)[0].startswith("faq_data.json: ")
+
+
+def test_every_problem_is_reported_at_once(content_dir):
+    edit(content_dir, "dispositions", lambda d: d.append(d[0]))
+    edit(content_dir, "objections", lambda d: d[0].__delitem__("surface"))
+    assert sorted(problems(content_dir)) == ["dispositions: entries must be unique", "objections[0]: missing or empty 'surface'"]
+
+
+def test_extra_fields_of_any_json_type_are_accepted(content_dir):
+    edit(content_dir, "faq_data", lambda d: d[first_key(d)][0].update({"verified": True, "owner": None, "score": 0.5}))
+    build.compile_sources(content_dir)
+
+
+def test_check_command(content_dir, capsys):
+    assert build.main(["--content-dir", str(content_dir), "--check"]) == 0
+    assert "content ok" in capsys.readouterr().out
+    edit(content_dir, "qa_questions", lambda d: d[0].__setitem__("correct", "Z"))
+    assert build.main(["--content-dir", str(content_dir), "--check"]) == 1
+    assert "qa_questions[0]" in capsys.readouterr().err
+    assert not (content_dir / "catalog.snapshot").exists()
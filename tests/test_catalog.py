@@ -0,0 +1,74 @@
+import json
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from cutting_edge import build
+from cutting_edge.catalog import CatalogStore
+
+
+def edit(content_dir, section, change):
+    path = build.source_path(section, content_dir)
+    data = json.loads(path.read_text())
+    change(data)
+    path.write_text(json.dumps(data))
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_reload_picks_up_an_edited_section(content_dir):
+    store = CatalogStore(content_dir)
+    before = store.current()
+    edit(content_dir, "dispositions", lambda d: d.append("Moved away"))
+    assert store.reload() == ["dispositions"]
+    assert store.current().version != before.version
+    assert "Moved away" in store.current().dispositions
+    assert store.current().qa_questions is before.qa_questions
+    assert store.reload() == []
+
+
+def test_invalid_edit_keeps_the_current_version(content_dir):
+    store = CatalogStore(content_dir)
+    version = store.current().version
+    edit(content_dir, "qa_questions", lambda d: d[0].update(correct="Z"))
+    assert store.reload() == []
+    assert store.current().version == version
+    assert "correct answer 'Z'" in str(store.last_error)
+
+    edit(content_dir, "qa_questions", lambda d: d[0].update(correct="B"))
+    store.reload()
+    assert store.last_error is None
+
+
+def test_watcher_survives_a_failed_reload(content_dir, monkeypatch, caplog):
+    store = CatalogStore(content_dir)
+    calls = []
+
+    def broken():
+        calls.append(True)
+        raise KeyError("qa_questions")
+
+    monkeypatch.setattr(store, "reload", broken)
+    store.start_watching(interval=0.01)
+    try:
+        wait_for(lambda: len(calls) >= 5)
+        assert store._watcher.is_alive()
+        failures = [r for r in caplog.records if "reload failed" in r.getMessage()]
+        assert len(failures) == 1 and failures[0].exc_info
+    finally:
+        store.stop_watching()
+
+
+def test_qa_game_restarts_when_questions_were_removed():
+    at = AppTest.from_file("../sections/qa_game.py")
+    at.session_state.qa_index = 999
+    at.session_state.qa_score = 3
+    at.run()
+    assert not at.exception
+    assert at.session_state.qa_index == 0
+    assert at.session_state.qa_score == 0
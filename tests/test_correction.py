@@ -0,0 +1,28 @@
+from cutting_edge.search import edit_distance, trigrams
+
+
+def ids(results):
+    return [r["id"] for r in results]
+
+
+def test_edit_distance_counts_a_transposition_once():
+    assert edit_distance("paymnet", "payment", 2) == 1
+    assert edit_distance("grass", "gross", 2) == 1
+    assert edit_distance("cancel", "payment", 2) == 3
+
+
+def test_trigrams_are_padded():
+    assert trigrams("fee") == {"$fe", "fee", "ee$"}
+
+
+def test_misspelled_terms_are_corrected(index):
+    assert index.correct("paymnet") == "payment"
+    assert index.correct("canel") == "cancel"
+    assert ids(index.search("paymnet info")) == ["payment"]
+    assert ids(index.search("logn gras")) == ["fee"]
+
+
+def test_short_or_unknown_terms_are_not_corrected(index):
+    assert index.correct("cah") is None
+    assert index.correct("helicopter") is None
+    assert index.correct("2024") is None
@@ -0,0 +1,90 @@
+import json
+from collections import Counter
+
+import pytest
+
+from cutting_edge import mining
+from cutting_edge.catalog import load_catalog
+
+
+def write_lines(path, lines):
+    path.write_bytes(b"".join(line + b"\n" for line in lines))
+    return path
+
+
+def test_bad_lines_are_skipped_and_counted(tmp_path):
+    path = write_lines(tmp_path / "calls.jsonl", [
+        json.dumps({"id": "1", "text": "we can pay in cash, right?"}).encode(),
+        b'{"id": "2", "text": "cut off',
+        b"\xff\xfe not utf-8",
+        json.dumps({"id": "3", "text": 42}).encode(),
+        json.dumps(["not", "a", "call"]).encode(),
+        json.dumps({"id": "4", "text": ["hello", {"text": "there"}]}).encode(),
+    ])
+    skipped = Counter()
+    assert [call["id"] for call in mining.read_calls(path, skipped=skipped)] == ["1", "4"]
+    assert skipped == {str(path): 4}
+
+
+def test_unreadable_json_file_is_skipped(tmp_path):
+    (tmp_path / "broken.json").write_text("{not json")
+    (tmp_path / "latin1.json").write_bytes('{"text": "caf\xe9"}'.encode("latin-1"))
+    skipped = Counter()
+    for name in ("broken.json", "latin1.json"):
+        assert list(mining.read_calls(tmp_path / name, skipped=skipped)) == []
+    assert sum(skipped.values()) == 2
+
+
+def test_byte_ranges_skip_each_bad_line_once(tmp_path):
+    lines = [json.dumps({"id": str(i), "text": "hello"}).encode() if i % 3 else b"{broken" for i in range(200)]
+    path = write_lines(tmp_path / "calls.jsonl", lines)
+    skipped = Counter()
+    ids = [call["id"] for task in mining.tasks([path], split_bytes=512) for call in mining.read_calls(*task, skipped=skipped)]
+    assert sorted(ids, key=int) == [str(i) for i in range(200) if i % 3]
+    assert skipped[str(path)] == len(range(0, 200, 3))
+
+
+def test_unsupported_file_is_rejected(tmp_path):
+    path = tmp_path / "calls.csv"
+    path.write_text("id,text\n")
+    with pytest.raises(ValueError, match="not a transcript file"):
+        list(mining.tasks([path]))
+    with pytest.raises(ValueError):
+        list(mining.read_calls(path))
+
+
+def test_unsupported_files_in_a_directory_are_ignored(tmp_path):
+    (tmp_path / "notes.csv").write_text("x")
+    (tmp_path / "call.txt").write_text("hello")
+    assert [task[0] for task in mining.tasks([tmp_path])] == [str(tmp_path / "call.txt")]
+
+
+def test_run_reports_skipped_calls(tmp_path, capsys):
+    archive = tmp_path / "archive"
+    archive.mkdir()
+    write_lines(archive / "calls.jsonl", [
+        json.dumps({"id": "1", "text": "we can pay in cash, right?", "disposition": "Price"}).encode(),
+        b"{broken",
+    ])
+    (archive / "bad.json").write_bytes(b"\x80\x81")
+    assert mining.main([str(archive), "--out", str(tmp_path / "out"), "--workers", "1"]) == 0
+    out = capsys.readouterr()
+    assert out.out.startswith("1 calls")
+    assert "skipped 2 unreadable or malformed call(s) in 2 file(s)" in out.err
+    assert (tmp_path / "out" / "objections.csv").exists()
+
+
+def test_run_rejects_an_unsupported_file(tmp_path, capsys):
+    (tmp_path / "calls.csv").write_text("x")
+    assert mining.main([str(tmp_path / "calls.csv"), "--out", str(tmp_path / "out")]) == 1
+    assert "not transcript files" in capsys.readouterr().err
+
+
+def test_mine_archive_counts_matches(tmp_path):
+    catalog = load_catalog()
+    surface = catalog.objections[0]["surface"]
+    write_lines(tmp_path / "calls.jsonl", [json.dumps({"id": "1", "text": surface}).encode(), b"oops"])
+    total = mining.mine_archive([tmp_path], catalog, workers=1)
+    assert total["calls"] == 1
+    assert total["items"][("objection", catalog.objections[0]["id"])] == 1
+    assert total["skipped"] == {str(tmp_path / "calls.jsonl"): 1}
@@ -0,0 +1,234 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cutting_edge import outbox, receiver
+from cutting_edge.outbox import ConnectionPool, Deliverer, Outbox, SheetClient, TokenBucket
+
+ROW = {"agentName": "Sam", "agentId": "A1", "disposition": "Price", "timestamp": "10/18/2026, 09:00:00 AM"}
+
+
+@pytest.fixture
+def sheet():
+    server, sheet = receiver.serve(0)
+    sheet.url = f"http://127.0.0.1:{server.server_port}/exec"
+    yield sheet
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def box(tmp_path):
+    return Outbox(tmp_path / "outbox.sqlite")
+
+
+def backoff_elapsed(box):
+    """Make rows waiting out a retry backoff due now."""
+    box._db.execute("UPDATE outbox SET next_attempt_at = 0 WHERE delivered_at IS NULL AND dead_at IS NULL")
+
+
+def drain(box, url, batch_size=1, reply="json"):
+    client = SheetClient(url, batch_size, ConnectionPool(), reply)
+    try:
+        return Deliverer(box, client).deliver_due()
+    finally:
+        client.pool.close()
+
+
+def row_state(box, key):
+    return box._db.execute(
+        "SELECT attempts, delivered_at IS NOT NULL, dead_at IS NOT NULL, last_error FROM outbox WHERE idempotency_key = ?",
+        (key,),
+    ).fetchone()
+
+
+@pytest.mark.parametrize("batch_size", [1, 50])
+def test_rows_are_delivered_once(sheet, box, batch_size):
+    keys = [box.enqueue({**ROW, "timestamp": str(i)}) for i in range(5)]
+    assert drain(box, sheet.url, batch_size) == 5
+    assert set(sheet.rows) == set(keys)
+    assert box.stats()["delivered"] == 5
+    assert drain(box, sheet.url, batch_size) == 0
+
+
+def test_duplicate_counts_as_delivered(sheet, tmp_path, box):
+    # Another process already delivered the row but died before marking it.
+    other = Outbox(tmp_path / "other.sqlite")
+    key = other.enqueue(ROW)
+    drain(other, sheet.url)
+    box.enqueue(ROW, key=key)
+    assert drain(box, sheet.url) == 1
+    assert sheet.duplicates == 1
+    assert len(sheet.rows) == 1
+
+
+def test_enqueue_keeps_the_first_row_for_a_key(box):
+    box.enqueue(ROW, key="k")
+    box.enqueue({**ROW, "disposition": "Other"}, key="k")
+    assert [payload["disposition"] for _, _, payload, _ in box.claim(10)] == ["Price"]
+
+
+def test_claimed_rows_are_leased(tmp_path):
+    path = tmp_path / "outbox.sqlite"
+    first, second = Outbox(path), Outbox(path)
+    first.enqueue(ROW)
+    assert len(first.claim(10)) == 1
+    assert second.claim(10) == []
+
+
+def test_expired_lease_makes_the_row_due_again(tmp_path):
+    path = tmp_path / "outbox.sqlite"
+    first, second = Outbox(path), Outbox(path)
+    key = first.enqueue(ROW)
+    first.claim(10, lease=0)  # the claiming process died mid-delivery
+    assert [k for _, k, _, _ in second.claim(10)] == [key]
+
+
+def test_failed_delivery_is_retried(sheet, box):
+    sheet.fail_rate = 1.0
+    key = box.enqueue(ROW)
+    assert drain(box, sheet.url) == 0
+    attempts, delivered, dead, error = row_state(box, key)
+    assert (attempts, delivered, dead, error) == (1, False, False, "HTTP 503")
+    assert box.stats()["pending_by_priority"]["retry"] == 1
+    assert drain(box, sheet.url) == 0  # still backing off
+
+    sheet.fail_rate = 0.0
+    backoff_elapsed(box)
+    assert drain(box, sheet.url) == 1
+    assert row_state(box, key)[:3] == (2, True, False)
+
+
+def test_rejected_rows_of_a_batch_are_retried(sheet, box):
+    sheet.row_fail_rate = 1.0
+    keys = [box.enqueue({**ROW, "timestamp": str(i)}) for i in range(3)]
+    assert drain(box, sheet.url, batch_size=50) == 0
+    assert [row_state(box, key)[3] for key in keys] == ["row not written"] * 3
+
+    sheet.row_fail_rate = 0.0
+    backoff_elapsed(box)
+    assert drain(box, sheet.url, batch_size=50) == 3
+
+
+def test_batch_follows_the_script_redirect(sheet, box):
+    sheet.redirect = True
+    box.enqueue(ROW)
+    assert drain(box, sheet.url, batch_size=50) == 1
+
+
+def test_row_is_dead_lettered_after_max_attempts(sheet, box, monkeypatch):
+    monkeypatch.setattr(outbox, "MAX_ATTEMPTS", 3)
+    sheet.fail_rate = 1.0
+    key = box.enqueue(ROW)
+    for _ in range(5):
+        drain(box, sheet.url)
+        backoff_elapsed(box)
+    assert row_state(box, key)[:3] == (3, False, True)
+    assert box.stats()["dead"] == 1
+
+    sheet.fail_rate = 0.0
+    assert drain(box, sheet.url) == 0
+    assert box.revive() == 1
+    assert drain(box, sheet.url) == 1
+
+
+def test_permanent_error_is_dead_lettered_at_once(sheet, box):
+    key = box.enqueue(ROW)
+    drain(box, sheet.url.replace("/exec", "/missing"))
+    assert row_state(box, key)[:3] == (1, False, True)
+
+
+class SignInPage(BaseHTTPRequestHandler):
+    """Answers every request the way a domain sign-in redirect ends: a 200
+    HTML page."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"<html><body>Sign in to continue</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def sign_in_page():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SignInPage)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/exec"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("batch_size", [1, 50])
+def test_html_reply_is_not_delivered(box, sign_in_page, batch_size):
+    key = box.enqueue(ROW)
+    assert drain(box, sign_in_page, batch_size) == 0
+    attempts, delivered, dead, error = row_state(box, key)
+    assert (attempts, delivered, dead) == (1, False, False)
+    assert "not JSON" in error
+
+
+def test_any_reply_mode_accepts_a_script_without_json(box, sign_in_page):
+    # The script deployed before apps_script/Code.gs answers with a page.
+    box.enqueue(ROW)
+    assert drain(box, sign_in_page, reply="any") == 1
+
+
+def test_any_reply_mode_still_retries_errors(sheet, box):
+    sheet.fail_rate = 1.0
+    box.enqueue(ROW)
+    assert drain(box, sheet.url, reply="any") == 0
+    assert box.stats()["pending"] == 1
+
+
+def test_unknown_reply_mode():
+    with pytest.raises(ValueError):
+        SheetClient("http://127.0.0.1/exec", reply="html")
+
+
+def test_backfill_queues_behind_live_rows(box):
+    box.enqueue(ROW, priority=outbox.BACKFILL)
+    box.enqueue({**ROW, "timestamp": "live"})
+    assert [payload["timestamp"] for _, _, payload, _ in box.claim(10)] == ["live", ROW["timestamp"]]
+
+
+def test_delivery_sends_every_field(sheet, box):
+    key = box.enqueue(ROW)
+    drain(box, sheet.url)
+    assert sheet.rows[key] == ROW
+    assert json.loads(json.dumps(sheet.summary()))["rows"] == 1
+
+
+def test_rows_survive_a_quota_throttle(box, monkeypatch):
+    # One request a second against a client allowed many more: most
+    # requests get a 429, but a throttled row is not charged an attempt.
+    monkeypatch.setattr(outbox, "MAX_ATTEMPTS", 2)
+    server, sheet = receiver.serve(0, quota=1)
+    client = SheetClient(f"http://127.0.0.1:{server.server_port}/exec", 1, ConnectionPool())
+    deliverer = Deliverer(box, client, TokenBucket(rate=50, burst=5))
+    keys = [box.enqueue({**ROW, "timestamp": str(i)}) for i in range(4)]
+    try:
+        deadline = time.monotonic() + 30
+        while box.stats()["pending"] and time.monotonic() < deadline:
+            deliverer.deliver_due()
+            time.sleep(0.05)
+    finally:
+        client.pool.close()
+        server.shutdown()
+        server.server_close()
+    assert sheet.over_quota > 0
+    assert box.stats()["delivered"] == 4 and box.stats()["dead"] == 0
+    assert [row_state(box, key)[0] for key in keys] == [1] * 4
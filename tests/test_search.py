@@ -0,0 +1,36 @@
+from cutting_edge.catalog import load_catalog
+from cutting_edge.search import FaqIndex, stem
+
+
+def ids(results):
+    return [r["id"] for r in results]
+
+
+def test_stem_merges_word_forms():
+    assert stem("charges") == stem("charged") == stem("charging") == "charg"
+    assert stem("clippings") == stem("clipping")
+    assert stem("grass") == "grass"
+
+
+def test_question_match_ranks_above_answer_match(index):
+    # "payment" is in one question; "payments" only in the other's answer.
+    assert ids(index.search("payment")) == ["payment", "cash"]
+
+
+def test_entries_with_every_term_come_first(index):
+    assert ids(index.search("long grass")) == ["fee"]
+    # No entry has both words: entries with either one are returned.
+    assert set(ids(index.search("cash mowing"))) == {"cash", "cancel"}
+
+
+def test_limit_and_no_match(index):
+    assert len(index.search("app", limit=1)) == 1
+    assert index.search("helicopter") == []
+    assert index.search("the and of") == []
+
+
+def test_catalog_faqs_are_searchable():
+    catalog = load_catalog()
+    index = FaqIndex(catalog.faqs, catalog.version)
+    for entry in catalog.faqs[:20]:
+        assert entry in index.search(entry["question"])[:3]
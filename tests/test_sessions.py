@@ -0,0 +1,96 @@
+import importlib.util
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from cutting_edge import sessions
+
+SID = "0123456789abcdef0123456789abcdef"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return sessions.MemoryBackend()
+    return sessions.open_backend(f"sqlite:///{tmp_path / 'sessions.db'}")
+
+
+def test_save_and_load(backend):
+    backend.save(SID, {"qa_index": sessions.encode(3), "faq_category": sessions.encode("Payment & Billing")}, [])
+    stored = backend.load(SID)
+    assert {key: sessions.decode(raw) for key, raw in stored.items()} == {"qa_index": 3, "faq_category": "Payment & Billing"}
+    assert backend.load("f" * 32) == {}
+
+
+def test_save_updates_and_removes_keys(backend):
+    backend.save(SID, {"qa_index": sessions.encode(1), "qa_selected": sessions.encode("B")}, [])
+    backend.save(SID, {"qa_index": sessions.encode(2)}, ["qa_selected"])
+    assert {key: sessions.decode(raw) for key, raw in backend.load(SID).items()} == {"qa_index": 2}
+
+
+def test_tuples_survive_a_round_trip():
+    value = {"scope": ("grass", None), "history": [("q1", True)]}
+    assert sessions.decode(sessions.encode(value)) == value
+
+
+def test_sqlite_state_is_shared_between_connections(tmp_path):
+    spec = f"sqlite:///{tmp_path / 'sessions.db'}"
+    sessions.open_backend(spec).save(SID, {"card_index": sessions.encode(5)}, [])
+    assert sessions.decode(sessions.open_backend(spec).load(SID)["card_index"]) == 5
+
+
+def test_sqlite_expires_idle_sessions(tmp_path):
+    path = tmp_path / "sessions.db"
+    sessions.SQLiteBackend(path).save(SID, {"card_index": sessions.encode(5)}, [])
+    assert sessions.SQLiteBackend(path, ttl=-1).load(SID) == {}
+
+
+@pytest.mark.skipif(importlib.util.find_spec("redis") is not None, reason="redis is installed")
+def test_redis_backend_needs_the_package():
+    with pytest.raises(ImportError, match="pip install redis"):
+        sessions.open_backend("redis://localhost:6379/0")
+
+
+def test_unknown_store():
+    with pytest.raises(ValueError):
+        sessions.open_backend("postgres://localhost/sessions")
+
+
+def page():
+    import streamlit as st
+
+    from cutting_edge import sessions
+
+    @sessions.persisted
+    def section():
+        st.session_state.setdefault("qa_index", 0)
+        st.session_state.setdefault("faq_bodies", {})
+        if st.button("next"):
+            st.session_state.qa_index += 1
+        st.write(st.session_state.qa_index)
+
+    sessions.restore_session()
+    section()
+
+
+@pytest.mark.parametrize("spec", ["memory", "sqlite"])
+def test_session_restored_on_another_replica(spec, tmp_path, monkeypatch):
+    backend = sessions.MemoryBackend() if spec == "memory" else sessions.open_backend(f"sqlite:///{tmp_path / 's.db'}")
+    monkeypatch.setattr(sessions, "get_session_backend", lambda: backend)
+
+    first = AppTest.from_function(page)
+    first.run()
+    sid = first.query_params["sid"]
+    first.button[0].click().run()
+    first.button[0].click().run()
+    assert first.session_state.qa_index == 2
+    stored = backend.load(sid)
+    assert sessions.decode(stored["qa_index"]) == 2
+    assert "faq_bodies" not in stored
+
+    # A new browser session presenting the same id picks up where the first left off.
+    second = AppTest.from_function(page)
+    second.query_params["sid"] = sid
+    second.run()
+    assert second.session_state.qa_index == 2
+    assert second.session_state._session_id == sid
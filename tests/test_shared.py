@@ -0,0 +1,122 @@
+import json
+import os
+import time
+from collections.abc import Mapping, Sequence
+
+import pytest
+
+from cutting_edge import build, shared
+from cutting_edge.catalog import Catalog, CatalogStore, load_catalog
+
+EXTRA = {"verified": True, "retired": False, "owner": None, "score": 0.75, "rank": -3, "views": 2 ** 40}
+
+
+def plain(value):
+    if isinstance(value, str) or not isinstance(value, (Mapping, Sequence)):
+        return value
+    if isinstance(value, Mapping):
+        return {k: plain(v) for k, v in value.items()}
+    return [plain(v) for v in value]
+
+
+def same_catalog(packed, catalog):
+    assert packed.version == catalog.version
+    for field in Catalog._fields:
+        if field != "version":
+            assert plain(getattr(packed, field)) == plain(getattr(catalog, field)), field
+
+
+def add_extra_fields(content_dir):
+    faq_data = json.loads((content_dir / "faq_data.json").read_text())
+    category = next(iter(faq_data))
+    faq_data[category][0].update(EXTRA)
+    (content_dir / "faq_data.json").write_text(json.dumps(faq_data))
+    return category
+
+
+def test_pack_round_trips_the_catalog(tmp_path):
+    catalog = load_catalog()
+    shared.write_shared(catalog, tmp_path / "catalog.bin")
+    same_catalog(shared.SharedCatalog(tmp_path / "catalog.bin"), catalog)
+
+
+def test_pack_round_trips_any_json_value(tmp_path):
+    value = {"list": [1, "two", 3.5, None, True, False, -1, 2 ** 40, [], {}], "nested": {"a": {"b": [0.0, ""]}}}
+    shared.write_shared(load_catalog()._replace(related=value), tmp_path / "catalog.bin")
+    packed = shared.SharedCatalog(tmp_path / "catalog.bin").related
+    assert plain(packed) == value
+    assert [type(v) for v in packed["list"][:8]] == [int, str, float, type(None), bool, bool, int, int]
+
+
+def test_shared_and_private_stores_accept_the_same_content(content_dir):
+    category = add_extra_fields(content_dir)
+    build.compile_sources(content_dir)  # what build --check runs
+    private = CatalogStore(content_dir).current()
+    packed = shared.SharedCatalogStore(content_dir).current()
+    same_catalog(packed, private)
+    entry = packed.faqs_by_category[category][0]
+    assert {key: entry[key] for key in EXTRA} == EXTRA
+
+
+def test_stale_format_is_rebuilt(content_dir):
+    path = content_dir / "catalog.bin"
+    store = shared.SharedCatalogStore(content_dir)
+    data = bytearray(path.read_bytes())
+    data[4:6] = (shared.FORMAT - 1).to_bytes(2, "little")
+    path.write_bytes(bytes(data))
+    assert shared._stale(path, content_dir)
+    assert shared.SharedCatalogStore(content_dir).current().version == store.current().version
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_watcher_survives_a_failed_rebuild(content_dir, monkeypatch, caplog):
+    store = shared.SharedCatalogStore(content_dir)
+    version = store.current().version
+    calls = []
+
+    def broken(blocking):
+        calls.append(blocking)
+        raise TypeError("cannot pack")
+
+    monkeypatch.setattr(store, "_rebuild", broken)
+    store.start_watching(interval=0.01)
+    try:
+        wait_for(lambda: len(calls) >= 5)
+        assert store._watcher.is_alive()
+        assert store.current().version == version
+        failures = [r for r in caplog.records if "reload failed" in r.getMessage()]
+        assert len(failures) == 1 and failures[0].exc_info
+    finally:
+        store.stop_watching()
+
+
+def test_writers_use_their_own_temp_files(content_dir, monkeypatch):
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(os, "replace", lambda src, dst: (replaced.append(src), real_replace(src, dst)))
+    catalog = load_catalog()
+    shared.write_shared(catalog, content_dir / "catalog.bin")
+    build.write_snapshot(build.compile_sources(content_dir), content_dir / "catalog.snapshot")
+    assert len(set(replaced)) == 2
+    assert not list(content_dir.glob("*.tmp"))
+
+
+@pytest.mark.parametrize("garbage", ["packed", "truncated", "empty"])
+def test_unreadable_snapshot_is_recompiled(content_dir, garbage):
+    version = CatalogStore(content_dir).current().version
+    snapshot = content_dir / "catalog.snapshot"
+    if garbage == "packed":
+        shared.write_shared(load_catalog(), content_dir / "catalog.bin")
+        data = (content_dir / "catalog.bin").read_bytes()
+    elif garbage == "truncated":
+        data = snapshot.read_bytes()[:100]
+    else:
+        data = b""
+    snapshot.write_bytes(data)
+    assert CatalogStore(content_dir).current().version == version
@@ -0,0 +1,40 @@
+from cutting_edge.catalog import load_catalog
+from cutting_edge.search import CatalogFaqs
+
+
+def ids(results):
+    return [r["id"] for r in results]
+
+
+def test_suggest_matches_word_prefixes(index):
+    assert ids(index.suggest("long gr")) == ["fee"]
+    assert ids(index.suggest("canc")) == ["cancel"]
+    # Neither question starts with "gr": the shorter one comes first.
+    assert ids(index.suggest("gr")) == ["fee", "grass"]
+
+
+def test_suggest_prefers_matches_at_the_start_of_the_question(index):
+    # "Do you bag the grass..." starts with the prefix; "...long grass fee" only contains it.
+    assert ids(index.suggest("do"))[0] == "grass"
+    assert ids(index.suggest("ho")) == ["cancel", "payment"]
+
+
+def test_suggest_with_a_trailing_space_needs_the_whole_word(index):
+    assert ids(index.suggest("pay ")) == ["cash"]
+    assert ids(index.suggest("pay")) == ["cash", "payment"]
+
+
+def test_suggest_falls_back_to_search_for_a_typo(index):
+    assert ids(index.suggest("paymnet")) == ids(index.search("payment")) == ["payment", "cash"]
+    assert index.suggest("   ") == []
+
+
+def test_suggest_limit(index):
+    assert len(index.suggest("h", limit=1)) == 1
+
+
+def test_catalog_suggestions_start_with_the_typed_word():
+    faqs = CatalogFaqs(load_catalog())
+    question = faqs.page(None, 0, 1)[0]["question"]
+    word = question.split()[0][:3].lower()
+    assert any(word in r["question"].lower() for r in faqs.suggest(word))